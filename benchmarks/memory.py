@@ -0,0 +1,77 @@
+# In-memory footprint of the shared tables.
+#
+#     python benchmarks/memory.py                       # every season
+#     python benchmarks/memory.py --seasons 2024 --row-budget 48
+#
+# Loads every table the pages share (each race's lap index, the degradation
+# index, the derived tables and the results tables) through f1.data, then
+# prints f1.data.memory_report(). Exits with status 1 when a lap-grain table
+# (one row per lap) goes over the bytes-per-row budget or the whole cache
+# goes over the total budget.
+import argparse
+import sys
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BASE_DIR))
+
+from f1 import data  # noqa: E402
+from f1.derived import DERIVED_TABLES, table_source  # noqa: E402
+from f1.results import RESULT_TABLES  # noqa: E402
+
+
+LAP_ROW_BUDGET = 64  # bytes per lap row
+TOTAL_BUDGET = 16.0  # MB per season, whole cache
+LAP_TABLES = ("race", "degradation_index", "derived lap_degradation", "positions_index", "derived race_positions")
+
+
+def load_all(seasons):
+    data.MAX_TABLES = 10_000  # keep every table for the report
+    for season in seasons:
+        if season in data.get_seasons():
+            for race in data.get_races(season):
+                data.get_race_index(season, race)
+            data.get_degradation_index(season)
+            data.get_positions_index(season)
+        for name in DERIVED_TABLES:
+            if table_source(name) == "laps" and season not in data.get_seasons():
+                continue
+            if table_source(name) == "results" and season not in data.get_result_seasons():
+                continue
+            data.get_derived(season, name)
+        if season in data.get_result_seasons():
+            for table in RESULT_TABLES:
+                data.get_results(season, table)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Report and check the memory of the shared tables.")
+    parser.add_argument("--seasons", type=int, nargs="*", help="default: every season")
+    parser.add_argument("--row-budget", type=float, default=LAP_ROW_BUDGET, help="bytes per lap row")
+    parser.add_argument("--budget", type=float, default=TOTAL_BUDGET, help="total MB per season")
+    parser.add_argument("--json", type=Path, help="also write the report to this file")
+    args = parser.parse_args()
+
+    seasons = args.seasons or sorted(set(data.get_seasons()) | set(data.get_result_seasons()))
+    load_all(seasons)
+    report = data.memory_report()
+
+    lap_tables = report["Table"].str.startswith(LAP_TABLES)
+    over = lap_tables & (report["BytesPerRow"] > args.row_budget)
+    total_mb = report["Bytes"].sum() / 2**20
+    total_budget = args.budget * len(seasons)
+
+    print(report.assign(MB=(report["Bytes"] / 2**20).round(3), Status=over.map({True: "FAIL", False: "ok"}))
+          .drop(columns="Bytes").to_string(index=False))
+    print(f"Total: {total_mb:.2f} MB in {len(report)} tables (budget {total_budget:.1f} MB, "
+          f"{args.row_budget:.0f} B per lap row)")
+
+    if args.json:
+        args.json.write_text(report.to_json(orient="records", indent=2))
+    failed = over.any() or total_mb > total_budget
+    print("❌ Over budget" if failed else "✅ Within budget")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,238 @@
+# Headless benchmark of the pages' computations on synthetic data.
+#
+#     python benchmarks/phases.py                         # 1, 5 and 20 seasons
+#     python benchmarks/phases.py --scales 1 5 --repeat 5 --out results.jsonl
+#
+# For each scale a synthetic data tree is generated (benchmarks/synthetic.py)
+# and each page's work is timed in four phases, without Streamlit:
+#   - load: read the tables the page reads
+#   - filter: select the season/race/drivers/teams shown
+#   - aggregate: compute what the page derives from them
+#   - figure: build the page's Plotly figure (f1.charts) and serialise it
+#     like st.plotly_chart
+# The best of --repeat runs is appended to a JSON-lines file (default
+# benchmarks/results.jsonl, kept out of git), one record per (scale, page,
+# phase), tagged with the git commit for comparison over time.
+import argparse
+import json
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import plotly.graph_objects as go
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BASE_DIR))
+sys.path.insert(0, str(BASE_DIR / "benchmarks"))
+
+from f1 import aggregates, analytics, charts, degradation, positions  # noqa: E402
+from f1.gaps import RaceGaps  # noqa: E402
+from f1.index import LapIndex  # noqa: E402
+from f1.results import RESULT_TABLES, RESULTS_DIR, read_results  # noqa: E402
+from f1.store import LAPS_DIR, read_laps  # noqa: E402
+from f1.telemetry import TELEMETRY_DIR, TelemetryStore, lap_delta, telemetry_path  # noqa: E402
+from synthetic import write_synthetic  # noqa: E402
+
+
+SCALES = [1, 5, 20]
+RESULTS_PATH = BASE_DIR / "benchmarks" / "results.jsonl"
+SELECTED_DRIVERS = 5
+SELECTED_TEAMS = 3
+
+
+# -------------------------------
+# Page workloads: each yields (phase, callable) in order; later phases use
+# the state earlier phases left in `s`
+# -------------------------------
+def lap_overlay(root, season, s):
+    yield "load", lambda: s.update(index=LapIndex(read_laps(seasons=[season], rounds=[1], root=root / LAPS_DIR.name)))
+    yield "filter", lambda: s.update(
+        race=s["index"].races[0],
+        drivers=s["index"].drivers(s["index"].races[0])[:SELECTED_DRIVERS],
+    )
+
+    def aggregate():
+        s["laps"] = analytics.driver_laps(s["index"], s["race"], s["drivers"])
+        s["pits"] = {driver: analytics.pit_laps(laps) for driver, laps in s["laps"].items()}
+    yield "aggregate", aggregate
+    yield "figure", lambda: charts.lap_overlay(s["index"], s["race"], s["drivers"]).to_json()
+
+
+def head_to_head(root, season, s):
+    # Every pair's gaps of one race, then one pair plus the closeness heatmap
+    yield "load", lambda: s.update(index=LapIndex(read_laps(seasons=[season], rounds=[1], root=root / LAPS_DIR.name)))
+    yield "aggregate", lambda: s.update(
+        race=s["index"].races[0],
+        gaps=RaceGaps(s["index"].race(s["index"].races[0])),
+    )
+    yield "filter", lambda: s.update(pairs=s["gaps"].closest_pairs())
+
+    def figure():
+        driver, rival = s["pairs"].iloc[0][["Driver", "Rival"]]
+        return [
+            charts.head_to_head(s["gaps"], s["index"], s["race"], driver, rival).to_json(),
+            charts.closeness(s["gaps"], s["race"]).to_json(),
+        ]
+    yield "figure", figure
+
+
+def race_trace(root, season, s):
+    # Running order of the whole season, then one race's trace
+    yield "load", lambda: s.update(laps=read_laps(seasons=[season], root=root / LAPS_DIR.name))
+    yield "aggregate", lambda: s.update(index=LapIndex(positions.race_positions(s["laps"])))
+    yield "filter", lambda: s.update(
+        race=s["index"].races[0],
+        summary=analytics.race_order_summary(s["index"].race(s["index"].races[0])),
+    )
+    yield "figure", lambda: charts.race_trace(
+        s["index"], s["race"], s["index"].drivers(s["race"]), "GapToLeader",
+    ).to_json()
+
+
+def tire_deg(root, season, s):
+    yield "load", lambda: s.update(laps=read_laps(seasons=[season], root=root / LAPS_DIR.name))
+    yield "aggregate", lambda: s.update(
+        lap_deg=degradation.lap_degradation(s["laps"]),
+        stints=degradation.stint_degradation(s["laps"]),
+        compounds=degradation.compound_degradation(s["laps"]),
+    )
+    yield "filter", lambda: s.update(index=LapIndex(s["lap_deg"]))
+
+    def figure():
+        race = s["index"].races[0]
+        return charts.degradation(s["index"], race, s["index"].drivers(race)[:SELECTED_DRIVERS]).to_json()
+    yield "figure", figure
+
+
+def team_pace(root, season, s):
+    columns = ["Season", "Round", "Race_Name", "Team", "IsPersonalBest", "LapTimeSeconds",
+               "LapNumber", "PitInTime", "PitOutTime", "Deleted"]
+    yield "load", lambda: s.update(laps=read_laps(seasons=[season], columns=columns, root=root / LAPS_DIR.name))
+    yield "aggregate", lambda: s.update(
+        box=aggregates.team_pace_box(s["laps"]),
+        outliers=aggregates.team_pace_outliers(s["laps"]),
+        pace=aggregates.team_race_pace(s["laps"]),
+    )
+    yield "filter", lambda: s.update(
+        teams=list(s["box"]["Team"].unique()[:SELECTED_TEAMS]),
+        gaps=analytics.gap_matrix(s["pace"]),
+    )
+
+    def figure():
+        specs = [charts.team_pace(s["box"], s["outliers"], team).to_json() for team in s["teams"]]
+        specs.append(go.Figure(go.Heatmap(z=s["gaps"].to_numpy())).to_json())
+        return specs
+    yield "figure", figure
+
+
+def tire_usage(root, season, s):
+    yield "load", lambda: s.update(tables={
+        table: read_results(season, table, root=root / RESULTS_DIR.name) for table in RESULT_TABLES
+    })
+
+    yield "filter", lambda: s.update(race=s["tables"]["races"]["Race_Name"].iloc[0])
+    yield "aggregate", lambda: s.update(
+        pits=aggregates.pit_stops_per_circuit(s["tables"]),
+        corr=aggregates.weather_correlation(s["tables"]),
+        lengths=aggregates.compound_stint_lengths(s["tables"]),
+    )
+
+    def figure():
+        bars = charts.tyre_strategy(s["tables"], s["race"])
+        pits = go.Figure(go.Bar(x=s["pits"]["Circuit"].astype(str), y=s["pits"]["AvgPitStops"]))
+        corr = go.Figure(go.Heatmap(z=s["corr"].drop(columns="Variable").to_numpy()))
+        return [bars.to_json(), pits.to_json(), corr.to_json()]
+    yield "figure", figure
+
+
+def all_seasons(root, season, s):
+    # Multi-season view: the cost that grows with the number of seasons
+    columns = ["Season", "Round", "Race_Name", "Team", "LapTimeSeconds", "LapNumber", "PitInTime", "PitOutTime",
+               "Deleted"]
+    yield "load", lambda: s.update(laps=read_laps(columns=columns, root=root / LAPS_DIR.name))
+    yield "aggregate", lambda: s.update(pace=aggregates.team_race_pace(s["laps"]))
+    yield "filter", lambda: s.update(team=s["pace"][s["pace"]["Team"] == s["pace"]["Team"].iloc[0]])
+    yield "figure", lambda: go.Figure(go.Scatter(
+        x=s["team"]["Season"] * 100 + s["team"]["Round"], y=s["team"]["GapToFastest"],
+    )).to_json()
+
+
+def telemetry(root, season, s):
+    # Two fastest laps out of one race's memory-mapped telemetry
+    yield "load", lambda: s.update(store=TelemetryStore(telemetry_path(root / TELEMETRY_DIR.name, season, 1)))
+    yield "filter", lambda: s.update(laps={
+        driver: s["store"].lap(driver, s["store"].fastest_lap(driver)) for driver in s["store"].drivers()[:2]
+    })
+    yield "aggregate", lambda: s.update(delta=lap_delta(*s["laps"].values()))
+    yield "figure", lambda: charts.telemetry_comparison(
+        s["laps"], s["delta"], dict.fromkeys(s["laps"], "white"), "telemetry",
+    ).to_json()
+
+
+PAGES = {
+    "lap_overlay": lap_overlay,
+    "head_to_head": head_to_head,
+    "race_trace": race_trace,
+    "tire_deg": tire_deg,
+    "team_pace": team_pace,
+    "tire_usage": tire_usage,
+    "all_seasons": all_seasons,
+    "telemetry": telemetry,
+}
+
+
+# -------------------------------
+# Runner
+# -------------------------------
+def time_page(workload, root, season, repeat):
+    best = {}
+    for _ in range(repeat):
+        state = {}
+        for phase, run in workload(root, season, state):
+            start = time.perf_counter()
+            run()
+            elapsed = time.perf_counter() - start
+            best[phase] = min(best.get(phase, elapsed), elapsed)
+    return best
+
+
+def git_commit():
+    result = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=BASE_DIR, capture_output=True, text=True)
+    return result.stdout.strip() or None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time each page's phases on synthetic data.")
+    parser.add_argument("--scales", type=int, nargs="+", default=SCALES, help="numbers of seasons")
+    parser.add_argument("--pages", nargs="+", choices=list(PAGES), default=list(PAGES))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--out", type=Path, default=RESULTS_PATH, help="JSON-lines file to append to")
+    args = parser.parse_args()
+
+    commit = git_commit()
+    stamp = time.strftime("%Y-%m-%dT%H:%M:%S")
+    records = []
+    for scale in args.scales:
+        with tempfile.TemporaryDirectory() as tmp:
+            laps, _ = write_synthetic(scale, tmp, telemetry_rounds=1)
+            season = int(laps["Season"].max())
+            print(f"--- {scale} season(s), {len(laps)} laps")
+            for page in args.pages:
+                timings = time_page(PAGES[page], Path(tmp), season, args.repeat)
+                print(f"{page:<12} " + "  ".join(f"{phase} {seconds * 1000:8.1f}ms" for phase, seconds in timings.items()))
+                records += [
+                    {"commit": commit, "timestamp": stamp, "seasons": scale, "laps": len(laps),
+                     "page": page, "phase": phase, "seconds": round(seconds, 6)}
+                    for phase, seconds in timings.items()
+                ]
+
+    with open(args.out, "a") as f:
+        for record in records:
+            f.write(json.dumps(record) + "\n")
+    print(f"✅ Appended {len(records)} results to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
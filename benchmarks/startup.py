@@ -0,0 +1,106 @@
+# Cold-start benchmark for the dashboard pages.
+#
+#     python benchmarks/startup.py                      # every page
+#     python benchmarks/startup.py "pages/Pace comp.py" --budget 2.5
+#
+# Each page runs in a fresh interpreter, like a container after scale-to-zero:
+#   - import: time to execute the page's top-level imports
+#   - first paint: import time plus the first full run of the page script
+#     (data load and figure build, rendered headlessly with AppTest)
+# Exits with status 1 when a page goes over the import or first-paint budget.
+import argparse
+import ast
+import json
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+PAGES = ["main_page.py"] + sorted(p.relative_to(BASE_DIR).as_posix() for p in (BASE_DIR / "pages").glob("*.py"))
+
+IMPORT_BUDGET = 1.5  # seconds
+FIRST_PAINT_BUDGET = 4.0  # seconds
+
+
+# -------------------------------
+# Child process: measure one page
+# -------------------------------
+def measure(page):
+    sys.path.insert(0, str(BASE_DIR))
+    sys.path.insert(0, str((BASE_DIR / page).parent))
+    tree = ast.parse((BASE_DIR / page).read_text(encoding="utf-8"))
+    imports = ast.Module(
+        body=[node for node in tree.body if isinstance(node, (ast.Import, ast.ImportFrom))],
+        type_ignores=[],
+    )
+
+    start = time.perf_counter()
+    exec(compile(imports, page, "exec"), {})
+    import_seconds = time.perf_counter() - start
+
+    from streamlit.testing.v1 import AppTest
+
+    start = time.perf_counter()
+    app = AppTest.from_file(str(BASE_DIR / page), default_timeout=120).run()
+    run_seconds = time.perf_counter() - start
+
+    return {
+        "page": page,
+        "import_seconds": round(import_seconds, 3),
+        "first_paint_seconds": round(import_seconds + run_seconds, 3),
+        "errors": [str(e.value) for e in app.exception],
+    }
+
+
+def run_child(page):
+    result = subprocess.run(
+        [sys.executable, __file__, "--child", page],
+        cwd=BASE_DIR, capture_output=True, text=True,
+    )
+    lines = result.stdout.strip().splitlines()
+    if result.returncode != 0 or not lines:
+        return {"page": page, "import_seconds": None, "first_paint_seconds": None,
+                "errors": [result.stderr.strip().splitlines()[-1] if result.stderr.strip() else "no output"]}
+    return json.loads(lines[-1])
+
+
+# -------------------------------
+# Main
+# -------------------------------
+def main():
+    parser = argparse.ArgumentParser(description="Measure cold import and first-paint time per page.")
+    parser.add_argument("pages", nargs="*", help="default: every page")
+    parser.add_argument("--import-budget", type=float, default=IMPORT_BUDGET, help="seconds")
+    parser.add_argument("--budget", type=float, default=FIRST_PAINT_BUDGET, help="first-paint seconds")
+    parser.add_argument("--json", type=Path, help="also write the results to this file")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(measure(args.child)))
+        return 0
+
+    results = [run_child(page) for page in args.pages or PAGES]
+
+    failed = False
+    print(f"{'page':<32} {'import':>8} {'paint':>8}")
+    for r in results:
+        over = r["errors"] or r["import_seconds"] > args.import_budget or r["first_paint_seconds"] > args.budget
+        failed |= bool(over)
+        if r["import_seconds"] is None:
+            print(f"{r['page']:<32} {'-':>8} {'-':>8}  FAIL {r['errors']}")
+            continue
+        status = "FAIL" if over else "ok"
+        print(f"{r['page']:<32} {r['import_seconds']:>7.2f}s {r['first_paint_seconds']:>7.2f}s  {status}"
+              + (f" {r['errors']}" if r["errors"] else ""))
+    print(f"Budget: import {args.import_budget:.2f}s, first paint {args.budget:.2f}s")
+
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2))
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,250 @@
+# Synthetic lap and results data for benchmarks.
+#
+#     python benchmarks/synthetic.py --seasons 5 --out /tmp/f1_synthetic
+#     python benchmarks/synthetic.py --seasons 1 --out /tmp/f1_synthetic --csv
+#     python benchmarks/synthetic.py --seasons 1 --out /tmp/f1_synthetic --telemetry 2
+#
+# Generates laps with the laps_2024_cleaned.csv columns and stints with the
+# f1_cleaned.csv columns, for any number of seasons, and writes them as a
+# processed data tree (laps/ and results/ stores, optionally the CSVs too).
+# Lap times follow a simple model (car pace + tyre wear − fuel burn + noise,
+# slow start/in/out-laps) so degradation and pace aggregates stay realistic.
+# With --telemetry, the first rounds of the last season also get 4 Hz car
+# telemetry, cut into laps by f1.telemetry like a FastF1 session.
+import argparse
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from f1.results import RESULTS_DIR, write_results  # noqa: E402
+from f1.store import LAPS_DIR, write_laps  # noqa: E402
+from f1.telemetry import TELEMETRY_DIR, lap_telemetry, telemetry_path, write_telemetry  # noqa: E402
+
+
+FIRST_SEASON = 2024
+ROUNDS = 24
+LAPS = 57
+TEAMS = [
+    "Red Bull Racing", "Ferrari", "Mercedes", "McLaren", "Aston Martin",
+    "Kick Sauber", "Haas F1 Team", "RB", "Williams", "Alpine",
+]
+DRIVERS = [
+    "VER", "PER", "LEC", "SAI", "HAM", "RUS", "NOR", "PIA", "ALO", "STR",
+    "BOT", "ZHO", "MAG", "HUL", "TSU", "RIC", "ALB", "SAR", "GAS", "OCO",
+]
+COMPOUNDS = np.array(["SOFT", "MEDIUM", "HARD"])
+WEAR = np.array([0.09, 0.06, 0.04])  # seconds per tyre-lap
+FUEL = 0.03  # seconds per lap of fuel burnt
+RETIRE_RATE = 0.05
+TELEMETRY_HZ = 4
+TRACK_LENGTH = 5000.0  # metres
+CORNERS = 9
+
+# laps_2024_cleaned.csv header (the CSV has no Season column)
+CSV_COLUMNS = [
+    "index", "Time", "Driver", "DriverNumber", "LapTime", "LapNumber", "Stint", "PitOutTime",
+    "PitInTime", "IsPersonalBest", "Compound", "TyreLife", "FreshTyre", "Team", "Round",
+    "Race_Name", "Circuit", "Country", "LapTimeSeconds",
+]
+
+
+# -------------------------------
+# Laps (laps_2024_cleaned.csv columns)
+# -------------------------------
+def synthetic_laps(seasons, rounds=ROUNDS, laps=LAPS, seed=0):
+    rng = np.random.default_rng(seed)
+    n_drivers = len(DRIVERS)
+    races = seasons * rounds
+    shape = (races, n_drivers, laps)
+
+    season = FIRST_SEASON - seasons + 1 + np.arange(races) // rounds
+    round_no = 1 + np.arange(races) % rounds
+    base = rng.uniform(75, 105, races)[:, None, None]
+    car = rng.normal(0, 0.5, (races, n_drivers // 2)).repeat(2, axis=1)[:, :, None]
+    driver = rng.normal(0, 0.2, (races, n_drivers))[:, :, None]
+
+    # 1-3 stops per driver at random laps; stint = 1 + stops made so far
+    lap = np.arange(1, laps + 1)
+    stops = rng.integers(1, 4, (races, n_drivers))
+    pit_laps = np.sort(rng.integers(8, laps - 5, (races, n_drivers, 3)), axis=2)
+    pit_laps = np.where(np.arange(3) < stops[:, :, None], pit_laps, laps + 1)
+    stint = 1 + (lap[None, None, :, None] > pit_laps[:, :, None, :]).sum(axis=3)
+    stint_start = np.concatenate([np.ones((races, n_drivers, 1)), pit_laps + 1], axis=2)
+    tyre_life = lap - np.take_along_axis(stint_start, stint - 1, axis=2) + 1
+    compound = rng.integers(0, 3, (races, n_drivers, 4))
+    compound = np.take_along_axis(compound, stint - 1, axis=2)
+
+    lap_time = (
+        base + car + driver + WEAR[compound] * tyre_life - FUEL * lap
+        + rng.normal(0, 0.35, shape)
+    )
+    pit_in = (lap[None, None, :, None] == pit_laps[:, :, None, :]).any(axis=3)
+    pit_out = np.roll(pit_in, 1, axis=2)
+    pit_out[:, :, 0] = False
+    lap_time = lap_time + 6 * (lap == 1) + 2 * pit_in + 20 * pit_out
+    session_time = 3600 + np.cumsum(lap_time, axis=2)
+
+    # Retirements: a few drivers stop at a random lap
+    retired_at = np.where(rng.random((races, n_drivers)) < RETIRE_RATE, rng.integers(5, laps, (races, n_drivers)), laps + 1)
+    keep = (lap[None, None, :] < retired_at[:, :, None]).ravel()
+
+    race_idx = np.repeat(np.arange(races), n_drivers * laps)
+    driver_idx = np.tile(np.repeat(np.arange(n_drivers), laps), races)
+    race_names = np.array([f"Grand Prix {r:02d}" for r in range(1, rounds + 1)])
+
+    df = pd.DataFrame({
+        "Time": pd.to_timedelta(session_time.ravel(), unit="s"),
+        "Driver": np.array(DRIVERS)[driver_idx],
+        "DriverNumber": driver_idx + 1,
+        "LapTime": pd.to_timedelta(lap_time.ravel(), unit="s"),
+        "LapNumber": np.tile(lap, races * n_drivers).astype(float),
+        "Stint": stint.ravel().astype(float),
+        "PitOutTime": pd.to_timedelta(np.where(pit_out, session_time - lap_time + 1, np.nan).ravel(), unit="s"),
+        "PitInTime": pd.to_timedelta(np.where(pit_in, session_time - 1, np.nan).ravel(), unit="s"),
+        "IsPersonalBest": False,
+        "Compound": COMPOUNDS[compound].ravel(),
+        "TyreLife": tyre_life.ravel().astype(float),
+        "FreshTyre": (tyre_life == 1).ravel(),
+        "Team": np.array(TEAMS)[driver_idx // 2],
+        "Season": season[race_idx],
+        "Round": round_no[race_idx],
+        "Race_Name": race_names[round_no[race_idx] - 1],
+        "LapTimeSeconds": lap_time.ravel(),
+    })[keep].reset_index(drop=True)
+    df["Circuit"] = df["Race_Name"]
+    df["Country"] = "Country " + df["Round"].astype(str)
+
+    # Personal best: a new fastest lap so far for that driver in that race
+    best = df.groupby(["Season", "Round", "Driver"])["LapTimeSeconds"].cummin()
+    df["IsPersonalBest"] = df["LapTimeSeconds"] == best
+    df.insert(0, "index", np.arange(len(df)))
+    return df
+
+
+# -------------------------------
+# Stints (f1_cleaned.csv columns)
+# -------------------------------
+def synthetic_stints(laps, seed=0):
+    rng = np.random.default_rng(seed)
+    race_keys = ["Season", "Round"]
+    driver_keys = race_keys + ["Driver"]
+
+    stints = (
+        laps.groupby(driver_keys + ["Stint"], sort=True)
+        .agg(Tire_Compound=("Compound", "first"), Stint_Length=("LapNumber", "size"),
+             Circuit=("Circuit", "first"), Race_Name=("Race_Name", "first"), Constructor=("Team", "first"))
+        .reset_index()
+    )
+    drivers = (
+        laps.groupby(driver_keys)
+        .agg(Laps=("LapNumber", "max"), Finish=("Time", "max"))
+        .reset_index()
+    )
+    drivers["Position"] = (
+        drivers.sort_values(["Laps", "Finish"], ascending=[False, True])
+        .groupby(race_keys).cumcount() + 1
+    )
+    drivers["TotalPitStops"] = stints.groupby(driver_keys).size().to_numpy() - 1
+    drivers["AvgPitStopTime"] = rng.uniform(22, 27, len(drivers))
+    for col in ["Lap_Time_Variation", "Tire_Usage_Aggression", "Position_Changes"]:
+        drivers[col] = rng.random(len(drivers))
+    drivers["Total_Pit_Stops"] = drivers["TotalPitStops"] / drivers["Laps"].clip(lower=1) * 8
+    drivers["Fast_Lap_Attempts"] = rng.uniform(20, 50, len(drivers))
+    drivers["Driver_Aggression_Score"] = rng.uniform(2, 8, len(drivers))
+
+    races = laps[race_keys].drop_duplicates().reset_index(drop=True)
+    races["Air_Temp_C"] = rng.uniform(10, 35, len(races))
+    races["Track_Temp_C"] = races["Air_Temp_C"] + rng.uniform(5, 20, len(races))
+    races["Humidity_percent"] = rng.uniform(20, 90, len(races))
+    races["Wind_Speed_KMH"] = rng.uniform(0, 20, len(races))
+
+    df = stints.merge(drivers, on=driver_keys).merge(races, on=race_keys)
+    last = df["Stint"] == df.groupby(driver_keys)["Stint"].transform("max")
+    df["Pit_Time"] = np.where(last, "Final Stint", rng.uniform(22, 27, len(df)).round(3).astype(str))
+    df["Abbreviation"] = df["Driver"]
+    df["Driver"] = "Driver " + df["Driver"]
+    return df[[
+        "Season", "Round", "Circuit", "Driver", "Constructor", "Laps", "Position", "TotalPitStops",
+        "AvgPitStopTime", "Race_Name", "Air_Temp_C", "Track_Temp_C", "Humidity_percent",
+        "Wind_Speed_KMH", "Lap_Time_Variation", "Total_Pit_Stops", "Tire_Usage_Aggression",
+        "Fast_Lap_Attempts", "Position_Changes", "Driver_Aggression_Score", "Abbreviation",
+        "Stint", "Tire_Compound", "Stint_Length", "Pit_Time",
+    ]]
+
+
+# -------------------------------
+# Car telemetry (FastF1 car_data)
+# -------------------------------
+def synthetic_telemetry(laps, season, round_no):
+    """(samples, index) of one race: a speed trace per driver, cut into laps by lap_telemetry."""
+    race = laps[(laps["Season"] == season) & (laps["Round"] == round_no)]
+    session_laps = pd.DataFrame({
+        "Driver": race["Driver"],
+        "DriverNumber": race["DriverNumber"].astype(str),
+        "LapNumber": race["LapNumber"],
+        "LapStartTime": race["Time"] - race["LapTime"],
+        "Time": race["Time"],
+    })
+
+    car_data = {}
+    for number, driver_laps in session_laps.groupby("DriverNumber"):
+        start = driver_laps["LapStartTime"].dt.total_seconds().to_numpy()
+        end = driver_laps["Time"].dt.total_seconds().to_numpy()
+        t = np.arange(start[0], end[-1], 1 / TELEMETRY_HZ)
+        lap = np.searchsorted(end, t, side="right").clip(max=len(end) - 1)
+        phase = (t - start[lap]) / (end[lap] - start[lap])
+
+        # Speed oscillates around the lap's mean speed once per corner, so
+        # every lap integrates to TRACK_LENGTH
+        wave = 2 * np.pi * CORNERS * phase
+        speed = TRACK_LENGTH / (end[lap] - start[lap]) * 3.6 * (1 + 0.35 * np.cos(wave))
+        car_data[number] = pd.DataFrame({
+            "SessionTime": pd.to_timedelta(t, unit="s"),
+            "Speed": speed,
+            "Throttle": np.where(np.sin(wave) < 0, 100.0, 15.0),
+            "Brake": np.sin(wave) > 0.5,
+            "RPM": 6000 + 20 * speed,
+            "nGear": np.clip(np.ceil(speed / 45), 1, 8),
+            "DRS": 0,
+        })
+    return lap_telemetry(car_data, session_laps)
+
+
+def write_synthetic(seasons, out, csv=False, seed=0, telemetry_rounds=0):
+    """Write a processed data tree with `seasons` synthetic seasons under `out`."""
+    laps = synthetic_laps(seasons, seed=seed)
+    stints = synthetic_stints(laps, seed=seed)
+    out = Path(out)
+    write_laps(laps, out / LAPS_DIR.name)
+    list(write_results(stints, out / RESULTS_DIR.name))
+    for round_no in range(1, telemetry_rounds + 1):
+        write_telemetry(
+            *synthetic_telemetry(laps, FIRST_SEASON, round_no),
+            telemetry_path(out / TELEMETRY_DIR.name, FIRST_SEASON, round_no),
+        )
+    if csv:
+        laps[CSV_COLUMNS].to_csv(out / f"laps_{FIRST_SEASON}_cleaned.csv", index=False)
+        stints.to_csv(out / "f1_cleaned.csv", index=False)
+    return laps, stints
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a synthetic processed data tree.")
+    parser.add_argument("--seasons", type=int, default=1)
+    parser.add_argument("--out", type=Path, required=True)
+    parser.add_argument("--csv", action="store_true", help="also write the cleaned CSVs")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--telemetry", type=int, default=0, metavar="ROUNDS",
+                        help="also write car telemetry for this many rounds of the last season")
+    args = parser.parse_args()
+
+    laps, stints = write_synthetic(args.seasons, args.out, args.csv, args.seed, args.telemetry)
+    print(f"✅ Wrote {len(laps)} laps and {len(stints)} stints ({args.seasons} seasons) to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+# Shared data access and analysis code for the F1 analysis dashboard.
@@ -0,0 +1,117 @@
+# Season aggregates
+#
+# Small summary tables computed once per season and data version (see
+# f1.derived), so season-wide pages read a few hundred rows instead of
+# regrouping every lap on each rerun.
+#
+# Lap-based tables take the season's lap table, results-based tables the
+# dict of races/results/stints tables (see f1.results); each aggregation runs
+# at the grain of the table it reads.
+#
+# Box statistics follow the matplotlib/seaborn convention: linear-interpolated
+# quartiles, whiskers at the most extreme laps within 1.5 × IQR of the box
+# (at the box edge when there are none), and every lap beyond the whiskers
+# reported as an outlier.
+import pandas as pd
+
+from f1.degradation import clean_lap_mask
+
+
+BOX_KEYS = ["Season", "Round", "Race_Name", "Team"]
+WHISKER = 1.5
+WEATHER_COLUMNS = ["Air_Temp_C", "Track_Temp_C", "Humidity_percent", "Wind_Speed_KMH"]
+
+
+def _pace_laps(laps):
+    # Personal-best laps only, for a fair team pace comparison (never a deleted one)
+    pace = laps["IsPersonalBest"] & ~laps["Deleted"] & laps["LapTimeSeconds"].notna()
+    laps = laps.loc[pace, BOX_KEYS + ["LapTimeSeconds"]]
+    return laps.reset_index(drop=True)
+
+
+def _box_fences(laps):
+    grouped = laps.groupby(BOX_KEYS, observed=True)["LapTimeSeconds"]
+    stats = grouped.quantile([0.25, 0.5, 0.75]).unstack()
+    stats.columns = ["Q1", "Median", "Q3"]
+    stats["Laps"] = grouped.size()
+    iqr = stats["Q3"] - stats["Q1"]
+    stats["LowLimit"] = stats["Q1"] - WHISKER * iqr
+    stats["HighLimit"] = stats["Q3"] + WHISKER * iqr
+    return stats
+
+
+def _inside_whiskers(laps, stats):
+    limits = stats[["LowLimit", "HighLimit"]].reindex(laps.set_index(BOX_KEYS).index).to_numpy()
+    lap_time = laps["LapTimeSeconds"].to_numpy()
+    return (lap_time >= limits[:, 0]) & (lap_time <= limits[:, 1])
+
+
+def team_pace_box(laps):
+    """Box statistics of personal-best lap times per (season, race, team).
+
+    One row per team and race: Q1, Median, Q3, LowerFence, UpperFence
+    (the whisker ends), Laps and Outliers (number of laps beyond the
+    whiskers, listed by team_pace_outliers).
+    """
+    laps = _pace_laps(laps)
+    stats = _box_fences(laps)
+    inside = _inside_whiskers(laps, stats)
+    by_box = [laps[key] for key in BOX_KEYS]
+
+    grouped = laps["LapTimeSeconds"].where(inside).groupby(by_box, observed=True)
+    # Whiskers never end inside the box (matplotlib: min(Q1, ...), max(Q3, ...))
+    stats["LowerFence"] = grouped.min().clip(upper=stats["Q1"])
+    stats["UpperFence"] = grouped.max().clip(lower=stats["Q3"])
+    stats["Outliers"] = pd.Series(~inside).groupby(by_box, observed=True).sum()
+    return stats.drop(columns=["LowLimit", "HighLimit"]).reset_index()
+
+
+def team_pace_outliers(laps):
+    """Personal-best laps beyond the whiskers of team_pace_box, one row per lap."""
+    laps = _pace_laps(laps)
+    inside = _inside_whiskers(laps, _box_fences(laps))
+    return laps[~inside].reset_index(drop=True)
+
+
+def team_race_pace(laps):
+    """Median clean-lap time per (season, race, team) and gap to the fastest team."""
+    laps = laps[clean_lap_mask(laps)]
+    pace = (
+        laps.groupby(["Season", "Round", "Race_Name", "Team"], observed=True)["LapTimeSeconds"]
+        .median().rename("MedianLapTime").reset_index()
+    )
+    fastest = pace.groupby(["Season", "Round"])["MedianLapTime"].transform("min")
+    pace["GapToFastest"] = pace["MedianLapTime"] - fastest
+    return pace
+
+
+# -------------------------------
+# Results-based aggregates
+# -------------------------------
+def pit_stops_per_circuit(tables):
+    """Average pit stops per driver at each circuit."""
+    results = tables["results"].merge(tables["races"][["RaceId", "Circuit"]], on="RaceId")
+    return (
+        results.groupby("Circuit", observed=True)["TotalPitStops"]
+        .agg(AvgPitStops="mean", Results="size")
+        .sort_values("AvgPitStops").reset_index()
+    )
+
+
+def weather_correlation(tables):
+    """Correlation matrix of race weather and average pit stops, one row per variable."""
+    races = tables["races"].set_index("RaceId")[WEATHER_COLUMNS]
+    races["TotalPitStops"] = tables["results"].groupby("RaceId")["TotalPitStops"].mean()
+    return races.corr().rename_axis("Variable").reset_index()
+
+
+def compound_stint_lengths(tables):
+    """Distribution of stint lengths per tyre compound (quartiles and range)."""
+    lengths = tables["stints"].groupby("Tire_Compound", observed=True)["Stint_Length"]
+    stats = lengths.quantile([0.25, 0.5, 0.75]).unstack()
+    stats.columns = ["Q1", "Median", "Q3"]
+    stats["Min"] = lengths.min()
+    stats["Max"] = lengths.max()
+    stats["Mean"] = lengths.mean()
+    stats["Stints"] = lengths.size()
+    return stats.reset_index()
@@ -0,0 +1,144 @@
+# Analytics API
+#
+# Plain functions shared by the pages, notebooks and batch jobs: they take
+# the shared tables (see f1.data) plus a selection and return frames, lists
+# or dicts. No Streamlit and no plotting here, so every compute path can be
+# cached, batched or profiled on its own.
+#
+# Season-wide tables (degradation, box statistics, pit stop and weather
+# aggregates) live in f1.degradation / f1.aggregates and are materialised
+# through f1.derived; this module covers the per-selection work.
+
+
+# -------------------------------
+# Colours
+# -------------------------------
+TEAM_COLORS = {
+    "Red Bull Racing": "#0600EF",
+    "Mercedes": "#00D2BE",
+    "Ferrari": "#DC0000",
+    "McLaren": "#FF8700",
+    "Aston Martin": "#006F62",
+    "Alpine": "#0090FF",
+    "Williams": "#005AFF",
+    "Haas F1 Team": "#FFFFFF",
+    "Kick Sauber": "#52E252",
+    "RB": "#6692FF",
+    "Alfa Romeo": "#900000",
+    "AlphaTauri": "#2B4562",
+}
+COMPOUND_COLORS = {
+    "SOFT": "#FF3333",
+    "MEDIUM": "#FFD700",
+    "HARD": "#E6E6E6",
+    "INTERMEDIATE": "#39B54A",
+    "WET": "#1E90FF",
+}
+DEFAULT_COLOR = "grey"
+
+
+def team_colors(teams):
+    """Official colour of each team in `teams`, grey for unknown teams."""
+    return {team: TEAM_COLORS.get(team, DEFAULT_COLOR) for team in teams}
+
+
+# -------------------------------
+# Laps
+# -------------------------------
+def personal_best_laps(laps):
+    """Laps that were a driver's personal best at the time (fair pace comparison)."""
+    return laps[laps["IsPersonalBest"]]
+
+
+def team_order(laps, value="LapTimeSeconds"):
+    """Teams of `laps`, fastest median `value` first."""
+    return list(laps.groupby("Team", observed=True)[value].median().sort_values().index)
+
+
+def pit_laps(laps):
+    """Lap numbers on which the driver(s) of `laps` pitted."""
+    return laps.loc[laps["PitInTime"].notna(), "LapNumber"].to_numpy()
+
+
+def driver_laps(index, race, drivers):
+    """{driver: laps} for `drivers` in `race`, from a LapIndex."""
+    return {driver: index.driver(race, driver) for driver in drivers}
+
+
+# -------------------------------
+# Results and stints (tables from f1.results)
+# -------------------------------
+def race_id(races, race):
+    return races.loc[races["Race_Name"] == race, "RaceId"].iloc[0]
+
+
+def race_results(tables, race):
+    """Driver results of `race`, in finishing order."""
+    results = tables["results"]
+    return results[results["RaceId"] == race_id(tables["races"], race)].sort_values("Position")
+
+
+def race_stints(tables, race):
+    """One row per stint of `race` with the driver abbreviation."""
+    results = race_results(tables, race)
+    stints = tables["stints"].merge(results[["ResultId", "Abbreviation"]], on="ResultId")
+    return stints[["Abbreviation", "Stint", "Tire_Compound", "Stint_Length"]].astype(
+        {"Abbreviation": str, "Tire_Compound": str}
+    )
+
+
+# -------------------------------
+# Degradation tables (from f1.degradation)
+# -------------------------------
+def stint_summary(stints, race, drivers):
+    """Degradation slope per stint of `drivers` in `race`."""
+    stints = stints[(stints["Race_Name"] == race) & stints["Driver"].isin(drivers)]
+    return stints[["Driver", "Stint", "Compound", "StartLap", "EndLap", "CleanLaps", "DegSlope", "MeanLapTime"]]
+
+
+def circuit_compounds(compounds, race):
+    """Median degradation per compound at the circuit of `race`."""
+    return compounds[compounds["Race_Name"] == race][["Compound", "DegSlope", "Stints", "CleanLaps"]]
+
+
+def gap_matrix(gaps):
+    """Teams × races pivot of a team_race_pace table, fastest team on average first."""
+    pivot = gaps.pivot_table(index="Team", columns=["Round", "Race_Name"], values="GapToFastest", observed=True)
+    return pivot.loc[pivot.mean(axis=1).sort_values().index]
+
+
+def correlation_matrix(correlation, columns):
+    """Sub-matrix of a weather_correlation table for `columns`."""
+    return correlation.set_index("Variable").loc[columns, columns]
+
+
+# -------------------------------
+# Race order (race_positions table from f1.positions)
+# -------------------------------
+def race_order_summary(positions):
+    """One row per driver of one race's race_positions rows, in finishing order.
+
+    Drivers are ranked by laps completed, then by the time they crossed the
+    line at the end of their last lap; Finish is that rank. Incomplete marks
+    the drivers whose laps stop before the flag: they retired, or their last
+    laps have no rows in the lap data, which can't tell the two apart. Start
+    is the position after the first lap; Overtakes and OvertakenBy are summed
+    over the race.
+    """
+    by_driver = positions.sort_values("LapNumber").groupby("Driver", observed=True)
+    summary = by_driver.agg(
+        Team=("Team", "first"),
+        Laps=("LapNumber", "max"),
+        LastTime=("Time", "last"),
+        Start=("Position", "first"),
+        Overtakes=("Overtakes", "sum"),
+        OvertakenBy=("OvertakenBy", "sum"),
+    )
+    # The flag falls when the leader completes the last lap
+    flag = positions.loc[positions["LapNumber"] == positions["LapNumber"].max(), "Time"].min()
+    summary["Incomplete"] = summary["LastTime"] < flag
+    summary = summary.sort_values(["Laps", "LastTime"], ascending=[False, True]).reset_index()
+    summary["Finish"] = range(1, len(summary) + 1)
+    summary["Gained"] = summary["Start"].astype(int) - summary["Finish"]
+    columns = ["Driver", "Team", "Laps", "Start", "Finish", "Gained", "Overtakes", "OvertakenBy", "Incomplete"]
+    return summary[columns]
@@ -0,0 +1,74 @@
+# Image assets
+#
+# Pages show driver and team pictures at a handful of fixed widths, so
+# scripts/build_thumbnails.py pre-sizes every picture to those widths as WebP
+# under assets/thumbs/<width>/. Pages fetch the bytes through asset_image():
+#   - an index of the asset files, listed once per process, replaces the
+#     per-rerun os.path.exists checks
+#   - image bytes are kept in a shared LRU cache bounded by size
+# When a thumbnail has not been built, the original file is served instead.
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+
+ASSETS_DIR = Path(__file__).resolve().parent.parent / "assets"
+THUMBS_DIR = ASSETS_DIR / "thumbs"
+
+# Display widths used by the pages, per asset folder ("" = top-level assets)
+THUMB_WIDTHS = {
+    "drivers": (120, 150, 300),
+    "teams": (600, 1200),
+    "": (500, 600),
+}
+THUMB_FORMAT = "webp"
+THUMB_QUALITY = 80
+
+MAX_CACHE_BYTES = 32 * 1024 * 1024
+
+_lock = threading.Lock()
+_index = None  # relative asset paths (posix) that exist on disk
+_images = OrderedDict()  # relative path -> bytes
+_cached_bytes = 0
+
+
+def thumbnail_name(name, width):
+    """Relative path of the `width` thumbnail of asset `name`."""
+    return f"thumbs/{width}/{Path(name).with_suffix('.' + THUMB_FORMAT).as_posix()}"
+
+
+def _get_index():
+    global _index
+    if _index is None:
+        _index = frozenset(
+            path.relative_to(ASSETS_DIR).as_posix()
+            for path in ASSETS_DIR.rglob("*") if path.is_file()
+        )
+    return _index
+
+
+def asset_image(name, width=None):
+    """Bytes of asset `name` (e.g. "drivers/VER.png") sized for `width`.
+
+    Returns None when the asset does not exist.
+    """
+    global _cached_bytes
+    with _lock:
+        index = _get_index()
+        if width is not None and thumbnail_name(name, width) in index:
+            name = thumbnail_name(name, width)
+        elif name not in index:
+            return None
+
+        data = _images.get(name)
+        if data is not None:
+            _images.move_to_end(name)
+            return data
+
+        data = (ASSETS_DIR / name).read_bytes()
+        _images[name] = data
+        _cached_bytes += len(data)
+        while _cached_bytes > MAX_CACHE_BYTES and len(_images) > 1:
+            _, evicted = _images.popitem(last=False)
+            _cached_bytes -= len(evicted)
+        return data
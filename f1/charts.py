@@ -0,0 +1,368 @@
+# Page figures
+#
+# Plotly figures of the dashboard's common views, built from the shared
+# tables. The pages and the static prerender job (scripts/prerender.py) use
+# the same builders, so a prerendered figure is exactly what the page would
+# have drawn for that selection. Dense traces go through the downsampling /
+# WebGL helpers of f1.figures.
+import numpy as np
+import plotly.express as px
+import plotly.graph_objects as go
+from plotly.subplots import make_subplots
+
+from f1.analytics import COMPOUND_COLORS, DEFAULT_COLOR, TEAM_COLORS, race_stints, team_colors
+from f1.figures import line_trace, pit_lines, point_trace
+from f1.gaps import CLOSE_GAP
+
+
+def lap_overlay(index, race, drivers):
+    """Lap times of `drivers` in `race` with their pit stops (LapIndex over laps)."""
+    colors = team_colors(index.race(race)["Team"].unique())
+    laps = {driver: index.driver(race, driver) for driver in sorted(drivers)}
+    points = sum(len(driver_laps) for driver_laps in laps.values())
+    fig = go.Figure()
+    pit_shapes = []
+
+    for driver, driver_laps in laps.items():
+        team_color = colors[driver_laps["Team"].iloc[0]]
+
+        fig.add_trace(line_trace(
+            driver_laps["LapNumber"],
+            driver_laps["LapTimeSeconds"],
+            figure_points=points,
+            mode="lines+markers",
+            name=driver,
+            line=dict(color=team_color, width=2),
+            marker=dict(size=8),
+            hovertemplate="Lap %{x}<br>Lap Time: %{y:.3f}s<extra></extra>"
+        ))
+
+        # Pit stops as vertical lines (added to the layout in one batch)
+        pit_shapes += pit_lines(driver_laps, team_color, opacity=0.5)
+
+    fig.update_layout(
+        shapes=pit_shapes,
+        title=f"Lap Times Overlay – {race}",
+        xaxis_title="Lap Number",
+        yaxis_title="Lap Time (s)",
+        yaxis_autorange="reversed",
+        template="plotly_dark",
+        height=600,
+        width=1200
+    )
+    return fig
+
+
+def degradation(index, race, drivers):
+    """Per-stint degradation of `drivers` in `race` (LapIndex over lap_degradation)."""
+    colors = team_colors(index.race(race)["Team"].unique())
+    laps = {driver: index.driver(race, driver) for driver in sorted(drivers)}
+    points = sum(len(driver_laps) for driver_laps in laps.values())
+    fig = go.Figure()
+    pit_shapes = []
+
+    for driver, driver_laps in laps.items():
+        # Degradation restarts at every stint; in/out laps are gaps in the line
+        team_color = colors[driver_laps["Team"].iloc[0]]
+
+        fig.add_trace(line_trace(
+            driver_laps["LapNumber"],
+            driver_laps["StintDegradation"],
+            figure_points=points,
+            mode='lines+markers',
+            name=driver,
+            line=dict(color=team_color, width=3),
+            marker=dict(size=8),
+            hovertemplate=
+            f'<b>{driver}</b><br>Laps: %{{x}}<br>Degradation: %{{y:.2f}}s<extra></extra>',
+        ))
+
+        # Pit stops (added to the layout in one batch)
+        pit_shapes += pit_lines(driver_laps, team_color)
+
+    fig.update_layout(
+        shapes=pit_shapes,
+        title=f"Tire Degradation per Stint – {race}",
+        xaxis_title="Lap Number",
+        yaxis_title="Lap Time Increase since Stint Start (s)",
+        template="plotly_dark",
+        plot_bgcolor="#0E1117",
+        paper_bgcolor="#0E1117",
+        font=dict(color="#FF0000"),
+        hovermode="x unified"
+    )
+    return fig
+
+
+def team_pace(box_stats, outliers, team):
+    """Season box plot of `team` from the team_pace_box/team_pace_outliers tables."""
+    team_stats = box_stats[box_stats["Team"] == team].sort_values("Round")
+    team_outliers = outliers[outliers["Team"] == team]
+    races = team_stats["Race_Name"].astype(str)
+
+    # Neon-style boxplot drawn from the precomputed statistics,
+    # races in chronological order
+    fig = go.Figure()
+    fig.add_trace(go.Box(
+        x=races,
+        q1=team_stats["Q1"],
+        median=team_stats["Median"],
+        q3=team_stats["Q3"],
+        lowerfence=team_stats["LowerFence"],
+        upperfence=team_stats["UpperFence"],
+        fillcolor=TEAM_COLORS.get(team, DEFAULT_COLOR),
+        line=dict(color="white", width=2),
+        name=team,
+    ))
+    fig.add_trace(go.Scatter(
+        x=team_outliers["Race_Name"].astype(str),
+        y=team_outliers["LapTimeSeconds"],
+        mode="markers",
+        marker=dict(color="white", size=5),
+        name="Outliers",
+        hovertemplate="%{x}<br>%{y:.3f}s<extra></extra>",
+    ))
+    fig.update_layout(
+        title=dict(text=f"{team} – Season Pace", font=dict(color="#FF0000", size=18)),
+        yaxis_title="Lap Time (s)",
+        xaxis=dict(tickangle=45, categoryorder="array", categoryarray=races),
+        template="plotly_dark",
+        plot_bgcolor="#111111",
+        paper_bgcolor="#111111",
+        showlegend=False,
+        height=600,
+    )
+    return fig
+
+
+def race_pace(box_stats, laps, race):
+    """Team boxes of one race with every personal-best lap as a jittered point.
+
+    Boxes are drawn from the precomputed team_pace_box rows of `race`
+    (fastest median first), so only their statistics are sent; the laps
+    themselves go out as one point trace per team, thinned out and switched
+    to WebGL by f1.figures when there are many.
+    """
+    stats = box_stats[box_stats["Race_Name"] == race].sort_values("Median")
+    teams = stats["Team"].astype(str).tolist()
+    team_laps = laps.assign(Team=laps["Team"].astype(str)).groupby("Team")["LapTimeSeconds"]
+    palette = px.colors.qualitative.Plotly
+    jitter = np.random.default_rng(0)
+
+    fig = go.Figure()
+    for i, row in enumerate(stats.itertuples()):
+        color = palette[i % len(palette)]
+        fig.add_trace(go.Box(
+            x=[i], q1=[row.Q1], median=[row.Median], q3=[row.Q3],
+            lowerfence=[row.LowerFence], upperfence=[row.UpperFence],
+            name=teams[i], marker_color=color, width=0.6,
+        ))
+        lap_times = team_laps.get_group(teams[i]).to_numpy()
+        fig.add_trace(point_trace(
+            i - 0.45 + jitter.uniform(-0.08, 0.08, len(lap_times)), lap_times,
+            figure_points=len(laps),
+            mode="markers",
+            name=teams[i],
+            marker=dict(color=color, size=5, opacity=0.7),
+            hovertemplate=f"{teams[i]}<br>%{{y:.3f}}s<extra></extra>",
+        ))
+
+    fig.update_layout(
+        title=f"{race} – Team Pace Comparison",
+        xaxis=dict(tickvals=list(range(len(teams))), ticktext=teams, title=None),
+        yaxis_title="Lap Time (s)",
+        showlegend=False,
+        template="plotly_white",
+    )
+    return fig
+
+
+def tyre_strategy(tables, race):
+    """Stacked stint bars per driver of `race` (races/results/stints tables)."""
+    fig = px.bar(
+        race_stints(tables, race),
+        x="Stint_Length",
+        y="Abbreviation",
+        color="Tire_Compound",
+        orientation='h',
+        text="Stint_Length",
+        color_discrete_map=COMPOUND_COLORS,
+        hover_data=["Tire_Compound", "Stint_Length"],
+        template="plotly_dark"
+    )
+
+    fig.update_layout(
+        title=f"Tire Strategies – {race}",
+        xaxis_title="Lap Number",
+        yaxis_title="Driver",
+        yaxis={'categoryorder':'total ascending'},
+        barmode='stack',
+        plot_bgcolor="#111111",
+        paper_bgcolor="#111111",
+        font=dict(color="#FFFFFF"),
+        height=600
+    )
+    return fig
+
+
+def telemetry_comparison(laps, delta, colors, title):
+    """Speed / throttle / brake traces of two laps over distance, plus their delta.
+
+    `laps` is {label: lap telemetry} with the reference lap first, `delta`
+    the f1.telemetry.lap_delta of the second lap to the first.
+    """
+    channels = [("Speed", "Speed (km/h)"), ("Throttle", "Throttle (%)"), ("Brake", "Brake")]
+    fig = make_subplots(
+        rows=len(channels) + 1, cols=1, shared_xaxes=True, vertical_spacing=0.03,
+        row_heights=[0.4, 0.2, 0.1, 0.3],
+    )
+    points = len(channels) * sum(len(lap) for lap in laps.values()) + len(delta)
+    for i, (label, lap) in enumerate(laps.items()):
+        for row, (channel, _) in enumerate(channels, start=1):
+            fig.add_trace(line_trace(
+                lap["Distance"], lap[channel],
+                figure_points=points,
+                mode="lines",
+                name=label,
+                legendgroup=label,
+                showlegend=row == 1,
+                line=dict(color=colors[label], width=2, dash="solid" if i == 0 else "dot"),
+                hovertemplate=f"%{{x:.0f}} m<br>{channel}: %{{y:.0f}}<extra>{label}</extra>",
+            ), row=row, col=1)
+
+    reference, other = list(laps)
+    fig.add_trace(line_trace(
+        delta["Distance"], delta["Delta"],
+        figure_points=points,
+        mode="lines",
+        name=f"{other} vs {reference}",
+        line=dict(color="white", width=2),
+        fill="tozeroy",
+        hovertemplate="%{x:.0f} m<br>%{y:+.3f}s<extra></extra>",
+    ), row=len(channels) + 1, col=1)
+    fig.add_hline(y=0, line=dict(color="grey", width=1), row=len(channels) + 1, col=1)
+
+    for row, (_, axis_title) in enumerate(channels + [(None, f"Delta to {reference} (s)")], start=1):
+        fig.update_yaxes(title_text=axis_title, row=row, col=1)
+    fig.update_xaxes(title_text="Distance (m)", row=len(channels) + 1, col=1)
+    fig.update_layout(
+        title=title,
+        template="plotly_dark",
+        plot_bgcolor="#111111",
+        paper_bgcolor="#111111",
+        hovermode="x unified",
+        height=900,
+    )
+    return fig
+
+
+def head_to_head(gaps, index, race, driver, rival):
+    """Lap-by-lap gap of `rival` to `driver` (RaceGaps) with both drivers' pit stops."""
+    colors = team_colors(index.race(race)["Team"].unique())
+    laps = {name: index.driver(race, name) for name in (driver, rival)}
+    pair = gaps.pair(driver, rival)
+    estimated = pair[pair["Estimated"]]
+    rival_color = colors[laps[rival]["Team"].iloc[0]]
+
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(
+        x=pair["LapNumber"],
+        y=pair["Gap"],
+        mode="lines+markers",
+        name=f"{rival} to {driver}",
+        line=dict(color=rival_color, width=3),
+        marker=dict(size=6),
+        fill="tozeroy",
+        hovertemplate="Lap %{x}<br>Gap: %{y:+.3f}s<extra></extra>",
+    ))
+    fig.add_trace(go.Scatter(
+        x=estimated["LapNumber"],
+        y=estimated["Gap"],
+        mode="markers",
+        name="Interpolated lap",
+        marker=dict(color="white", size=9, symbol="circle-open"),
+        hovertemplate="Lap %{x}<br>Gap: %{y:+.3f}s (interpolated)<extra></extra>",
+    ))
+
+    # Pit stops of both drivers (added to the layout in one batch)
+    pit_shapes = []
+    for name, name_laps in laps.items():
+        pit_shapes += pit_lines(name_laps, colors[name_laps["Team"].iloc[0]], opacity=0.6)
+    fig.update_layout(
+        shapes=pit_shapes,
+        title=f"{rival} vs {driver} – {race}",
+        xaxis_title="Lap Number",
+        yaxis_title=f"Gap to {driver} (s, > 0: {rival} behind)",
+        template="plotly_dark",
+        plot_bgcolor="#111111",
+        paper_bgcolor="#111111",
+        height=550,
+    )
+    fig.add_hline(y=0, line=dict(color="grey", width=1))
+    return fig
+
+
+def closeness(gaps, race):
+    """Drivers × drivers heatmap of the mean |gap| over the laps each pair shared (RaceGaps)."""
+    mean, laps, close = gaps.closeness()
+    fig = go.Figure(go.Heatmap(
+        z=mean,
+        x=gaps.drivers,
+        y=gaps.drivers,
+        customdata=np.dstack([laps, close]),
+        colorscale="Reds_r",
+        zmax=30,
+        colorbar=dict(title="s"),
+        hovertemplate=(
+            "%{y} – %{x}<br>Mean gap: %{z:.2f}s<br>"
+            f"Laps together: %{{customdata[0]}}<br>Laps within {CLOSE_GAP:g}s: %{{customdata[1]}}<extra></extra>"
+        ),
+    ))
+    fig.update_layout(
+        title=f"Who Was Closest to Whom – {race}",
+        template="plotly_dark",
+        plot_bgcolor="#111111",
+        paper_bgcolor="#111111",
+        yaxis=dict(autorange="reversed"),
+        height=650,
+    )
+    return fig
+
+
+def race_trace(index, race, drivers, value):
+    """Lap-by-lap Position or GapToLeader of `drivers` in `race` (LapIndex over race_positions)."""
+    colors = team_colors(index.race(race)["Team"].unique())
+    laps = {driver: index.driver(race, driver) for driver in sorted(drivers)}
+    points = sum(len(driver_laps) for driver_laps in laps.values())
+    hover = "P%{y}" if value == "Position" else "+%{y:.3f}s to the leader"
+    fig = go.Figure()
+    seen_teams = set()
+
+    for driver, driver_laps in laps.items():
+        # Second driver of a team dashed, so teammates can be told apart
+        team = driver_laps["Team"].iloc[0]
+        fig.add_trace(line_trace(
+            driver_laps["LapNumber"],
+            driver_laps[value],
+            figure_points=points,
+            mode="lines",
+            name=driver,
+            line=dict(color=colors[team], width=2, dash="dot" if team in seen_teams else "solid"),
+            hovertemplate=f"<b>{driver}</b><br>Lap %{{x}}<br>{hover}<extra></extra>",
+        ))
+        seen_teams.add(team)
+
+    fig.update_layout(
+        title=f"Race Trace – {race}",
+        xaxis_title="Lap Number",
+        yaxis_title="Position" if value == "Position" else "Gap to Leader (s)",
+        yaxis_autorange="reversed",
+        template="plotly_dark",
+        plot_bgcolor="#111111",
+        paper_bgcolor="#111111",
+        hovermode="closest",
+        height=650,
+    )
+    if value == "Position":
+        fig.update_yaxes(dtick=1)
+    return fig
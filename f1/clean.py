@@ -0,0 +1,104 @@
+# Raw -> processed lap cleaning
+#
+# Scripted version of the old cleaner notebook. Raw laps are cleaned one
+# round at a time (or in bounded CSV chunks for legacy season CSVs) and each
+# round is written straight to the processed store, so peak memory is one
+# round regardless of how many seasons are re-cleaned. Only the columns the
+# processed schema needs are ever read from the raw data.
+from pathlib import Path
+
+import pandas as pd
+import pyarrow.parquet as pq
+
+from f1.store import DURATION_COLUMNS, LAP_SCHEMA, partition_files, round_path, to_lap_schema, write_partition
+
+
+# Raw columns needed to produce LAP_SCHEMA (LapTimeSeconds is derived)
+RAW_COLUMNS = [col for col in LAP_SCHEMA if col != "LapTimeSeconds"] + ["LapTime"]
+
+
+def clean_laps(raw):
+    """Clean the raw laps of one round into the processed lap schema."""
+    raw = raw.rename(columns=str.strip)
+
+    # Parse durations once, vectorised, straight to seconds
+    laps = raw.copy()
+    for col in DURATION_COLUMNS + ["LapTime"]:
+        laps[col] = pd.to_timedelta(laps[col]).dt.total_seconds()
+
+    # Filter invalid laps: no lap time. Laps deleted by race control stay,
+    # flagged Deleted (see f1/store.py)
+    laps = laps[laps["LapTime"].notna()].copy()  # a frame of its own, not a view of `raw`
+
+    laps["LapTimeSeconds"] = laps.pop("LapTime")
+    return to_lap_schema(laps)
+
+
+# -------------------------------
+# Sources
+# -------------------------------
+def _is_current(out_path, source_path):
+    # The processed partition was written after its source last changed
+    return out_path.exists() and out_path.stat().st_mtime >= Path(source_path).stat().st_mtime
+
+
+def clean_partitions(raw_dir, out_dir, force=False):
+    """Clean every raw season=YYYY/round=RR partition under `raw_dir`.
+
+    Rounds whose processed partition is newer than the raw one are skipped.
+    Yields (season, round, n_laps) for each round written.
+    """
+    for raw_path in partition_files(raw_dir):
+        season = int(raw_path.parent.parent.name.split("=")[1])
+        round_no = int(raw_path.parent.name.split("=")[1])
+        out_path = round_path(out_dir, season, round_no)
+        if not force and _is_current(out_path, raw_path):
+            continue
+
+        available = pq.read_schema(raw_path).names
+        raw = pd.read_parquet(raw_path, columns=[col for col in RAW_COLUMNS if col in available])
+        laps = clean_laps(raw)
+        write_partition(laps, out_path)
+        yield season, round_no, len(laps)
+
+
+def clean_csv(csv_path, out_dir, chunksize=50_000, force=False):
+    """Clean a legacy raw season CSV in bounded chunks.
+
+    The CSV must be ordered by round: rows are buffered until the round
+    changes and each complete round is cleaned and written on its own. A
+    round whose rows reappear further down raises ValueError, as cleaning it
+    again would overwrite its partition with a partial round. Rounds whose
+    processed partition is newer than the CSV are skipped.
+    Yields (season, round, n_laps) for each round written.
+    """
+    chunks = pd.read_csv(csv_path, usecols=lambda col: col.strip() in RAW_COLUMNS, chunksize=chunksize)
+    seen = set()
+    current, skip = None, False
+    pending = []
+    for chunk in chunks:
+        chunk = chunk.rename(columns=str.strip)
+        for (season, round_no), rows in chunk.groupby(["Season", "Round"], sort=False):
+            if (season, round_no) != current:
+                if (season, round_no) in seen:
+                    raise ValueError(
+                        f"{csv_path}: rows of {season} round {round_no} are not contiguous, sort the CSV by round"
+                    )
+                if pending:
+                    yield _flush(pending, out_dir)
+                seen.add((season, round_no))
+                current = (season, round_no)
+                skip = not force and _is_current(round_path(out_dir, season, round_no), csv_path)
+            if not skip:
+                pending.append(rows)
+    if pending:
+        yield _flush(pending, out_dir)
+
+
+def _flush(pending, out_dir):
+    raw = pd.concat(pending, ignore_index=True)
+    pending.clear()
+    season, round_no = int(raw["Season"].iloc[0]), int(raw["Round"].iloc[0])
+    laps = clean_laps(raw)
+    write_partition(laps, round_path(out_dir, season, round_no))
+    return season, round_no, len(laps)
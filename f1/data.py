@@ -0,0 +1,238 @@
+# Shared dataset cache
+#
+# Every page imports its tables from here instead of reading files itself.
+# Each table is loaded once per server process and the same frame is handed
+# to every session and rerun. Entries are keyed on the mtime and size of the
+# files they were read from, so rewriting a partition invalidates every
+# cached table built from it on the next access.
+#
+# Lap data is read from the season/round partitioned store with the smallest
+# possible footprint: a race selection reads that race's partition only, and
+# season-wide views read only the columns they ask for. The cache is an LRU
+# bounded by MAX_TABLES so browsing many races doesn't grow memory forever.
+import threading
+from collections import OrderedDict
+
+import pandas as pd
+
+from f1.derived import build_derived, data_version, load_source, read_derived, source_files, table_source
+from f1.gaps import RaceGaps
+from f1.index import LapIndex
+from f1.results import RESULTS_DIR, list_result_seasons, read_results, results_path
+from f1.store import LAPS_DIR, list_seasons, memory_bytes, partition_files, read_laps, round_path
+from f1.telemetry import TELEMETRY_DIR, TelemetryStore, telemetry_files, telemetry_path
+
+
+MAX_TABLES = 64
+
+_lock = threading.Lock()  # guards _tables and _loading, never held while loading
+_tables = OrderedDict()  # key -> (signature, table)
+_loading = {}  # key -> lock held by the session loading that key
+
+
+def protect_shared_tables():
+    """Turn on pandas copy-on-write for this process.
+
+    Shared frames must stay read-only: with copy-on-write, a page that adds
+    a column or edits a filtered frame gets its own copy instead of mutating
+    the cached table underneath every other session. It changes pandas
+    semantics process-wide, so only the Streamlit pages (each one is an
+    entry point of the app) call it; notebooks and scripts keep pandas'
+    defaults.
+    """
+    pd.set_option("mode.copy_on_write", True)
+
+
+def _signature(paths):
+    signature = []
+    for path in paths:
+        stat = path.stat()
+        signature.append((str(path), stat.st_mtime_ns, stat.st_size))
+    return tuple(signature)
+
+
+def _cached(key, signature):
+    # Under _lock: the table of a fresh entry (marked recently used), or None
+    entry = _tables.get(key)
+    if entry is None or entry[0] != signature:
+        return None
+    _tables.move_to_end(key)
+    return entry[1]
+
+
+def _shared(key, paths, loader):
+    """Return the cached table `key`, reloading it if any of `paths` changed.
+
+    Loads run outside the cache lock: a cold load blocks only the sessions
+    waiting for that same key, which then get the loaded table.
+    """
+    signature = _signature(paths)
+    with _lock:
+        table = _cached(key, signature)
+        if table is not None:
+            return table
+        key_lock = _loading.setdefault(key, threading.Lock())
+
+    with key_lock:
+        with _lock:
+            table = _cached(key, signature)  # loaded while we waited
+        if table is not None:
+            return table
+        table = loader()
+        with _lock:
+            _tables[key] = (signature, table)
+            _tables.move_to_end(key)
+            while len(_tables) > MAX_TABLES:
+                _tables.popitem(last=False)
+            _loading.pop(key, None)
+    return table
+
+
+# -------------------------------
+# Lap data
+# -------------------------------
+def get_seasons():
+    """Seasons available in the lap store, oldest first."""
+    return list_seasons(LAPS_DIR)
+
+
+def _race_rounds(season):
+    def load():
+        races = read_laps(seasons=[season], columns=["Round", "Race_Name"]).drop_duplicates()
+        return dict(zip(races["Race_Name"].astype(str), races["Round"]))
+
+    return _shared(("rounds", season), partition_files(LAPS_DIR, season), load)
+
+
+def get_races(season):
+    """Sorted race names of `season`."""
+    return sorted(_race_rounds(season))
+
+
+def get_race_round(season, race):
+    return _race_rounds(season)[race]
+
+
+def get_race_index(season, race):
+    """LapIndex over the timed laps of one race (deleted laps left out), read from its partition only."""
+    round_no = _race_rounds(season)[race]
+    path = round_path(LAPS_DIR, season, round_no)
+
+    def load():
+        laps = read_laps(seasons=[season], rounds=[round_no])
+        return LapIndex(laps[~laps["Deleted"]])
+
+    return _shared(("race", season, round_no), [path], load)
+
+
+def get_race_gaps(season, race):
+    """RaceGaps (every driver pair, every lap) of one race, computed once per partition.
+
+    Built from every crossing of the race, deleted laps included.
+    """
+    round_no = _race_rounds(season)[race]
+    path = round_path(LAPS_DIR, season, round_no)
+    return _shared(
+        ("gaps", season, round_no), [path],
+        lambda: RaceGaps(read_laps(seasons=[season], rounds=[round_no])),
+    )
+
+
+def get_data_version(season, source="laps"):
+    """Content hash of the season's lap partitions (or results tables)."""
+    files = source_files(source, season)
+    return _shared(("version", source, season), files, lambda: data_version(files))
+
+
+def get_derived(season, name):
+    """Derived table `name` for `season` (see f1.derived.DERIVED_TABLES).
+
+    Uses the materialised file when it matches the current data version and
+    engine code (see f1/derived.py), otherwise builds the table from its
+    source (once per data version).
+    """
+    source = table_source(name)
+
+    def load():
+        table = read_derived(name, season, get_data_version(season, source))
+        if table is None:
+            table = build_derived(name, load_source(source, season))
+        return table
+
+    return _shared(("derived", name, season), source_files(source, season), load)
+
+
+def get_degradation_index(season):
+    """LapIndex over the season's lap-level degradation table."""
+    return _shared(
+        ("degradation_index", season), partition_files(LAPS_DIR, season),
+        lambda: LapIndex(get_derived(season, "lap_degradation")),
+    )
+
+
+def get_positions_index(season):
+    """LapIndex over the season's race_positions table (running order per lap)."""
+    return _shared(
+        ("positions_index", season), partition_files(LAPS_DIR, season),
+        lambda: LapIndex(get_derived(season, "race_positions")),
+    )
+
+
+# -------------------------------
+# Car telemetry (see f1/telemetry.py)
+# -------------------------------
+def get_telemetry(season, race):
+    """Memory-mapped TelemetryStore of one race, or None if it wasn't ingested."""
+    round_no = get_race_round(season, race)
+    files = telemetry_files(TELEMETRY_DIR, season, round_no)
+    if not files:
+        return None
+    return _shared(
+        ("telemetry", season, round_no), files,
+        lambda: TelemetryStore(telemetry_path(TELEMETRY_DIR, season, round_no)),
+    )
+
+
+# -------------------------------
+# Race results (see f1/results.py)
+# -------------------------------
+def get_result_seasons():
+    return list_result_seasons(RESULTS_DIR)
+
+
+def get_results(season, table):
+    """The season's "races", "results" or "stints" table."""
+    return _shared(
+        ("results", table, season), [results_path(RESULTS_DIR, season, table)],
+        lambda: read_results(season, table),
+    )
+
+
+# -------------------------------
+# Memory
+# -------------------------------
+def memory_report():
+    """Footprint of every table in the shared cache, largest first.
+
+    One row per cached frame (a LapIndex counts as its lap table):
+    Table, Rows, Columns, Bytes and BytesPerRow.
+    """
+    with _lock:
+        entries = [(key, table) for key, (_, table) in _tables.items()]
+
+    rows = []
+    for key, table in entries:
+        df = table.laps if isinstance(table, LapIndex) else table
+        if not isinstance(df, pd.DataFrame):
+            continue
+        size = memory_bytes(df)
+        rows.append({
+            "Table": " ".join(",".join(part) if isinstance(part, tuple) else str(part) for part in key),
+            "Rows": len(df),
+            "Columns": df.shape[1],
+            "Bytes": size,
+            "BytesPerRow": round(size / max(len(df), 1), 1),
+        })
+    return pd.DataFrame(rows, columns=["Table", "Rows", "Columns", "Bytes", "BytesPerRow"]).sort_values(
+        "Bytes", ascending=False, ignore_index=True
+    )
@@ -0,0 +1,101 @@
+# Tyre degradation engine
+#
+# Degradation is measured within each stint, never across a pit stop:
+#   - lap level: StintDegradation, lap time minus the stint's first clean
+#     lap, and LapDelta, lap time minus the stint's previous clean lap
+#   - stint level: least-squares slope of lap time against TyreLife
+#
+# In/out-laps and the standing-start lap are excluded: they are slow because
+# of the pit lane or the start, not because of the tyres. So are laps
+# deleted by race control, whose lap time doesn't count.
+# Everything is computed for all races and drivers at once with grouped,
+# vectorised operations; the per-stint regression is solved in closed form
+# from grouped sums instead of fitting each stint separately.
+import numpy as np
+
+
+STINT_KEYS = ["Season", "Round", "Driver", "Stint"]
+MIN_FIT_LAPS = 3  # fewer clean laps than this and a stint gets no slope
+
+LAP_COLUMNS = [
+    "Season", "Round", "Race_Name", "Driver", "Team", "Stint",
+    "Compound", "LapNumber", "TyreLife", "LapTimeSeconds", "PitInTime", "PitOutTime", "Deleted",
+]
+
+
+def clean_lap_mask(laps):
+    clean = laps["PitInTime"].isna() & laps["PitOutTime"].isna() & (laps["LapNumber"] > 1) & ~laps["Deleted"]
+    return clean.to_numpy()
+
+
+def lap_degradation(laps):
+    """Per-lap degradation within each stint.
+
+    Adds IsCleanLap, LapDelta (change from the previous clean lap of the
+    stint, 0 on its first one) and StintDegradation (lap time minus the
+    stint's first clean lap). Both are NaN on excluded laps.
+    """
+    laps = laps[LAP_COLUMNS].sort_values(STINT_KEYS + ["LapNumber"], ignore_index=True)
+    clean = clean_lap_mask(laps)
+    lap_time = laps["LapTimeSeconds"].where(clean)
+
+    grouped = lap_time.groupby([laps[key] for key in STINT_KEYS], observed=True, sort=False)
+    # Diff over the clean laps only, so an excluded lap in between is skipped
+    clean_laps = laps[clean]
+    clean_grouped = clean_laps["LapTimeSeconds"].groupby(
+        [clean_laps[key] for key in STINT_KEYS], observed=True, sort=False
+    )
+    laps["IsCleanLap"] = clean
+    laps["LapDelta"] = clean_grouped.diff().fillna(0).reindex(laps.index)
+    laps["StintDegradation"] = lap_time - grouped.transform("first")
+    return laps
+
+
+def stint_degradation(laps):
+    """One row per stint with its degradation slope (seconds per tyre-lap)."""
+    laps = laps[LAP_COLUMNS]
+    clean = clean_lap_mask(laps)
+    by_stint = [laps[key] for key in STINT_KEYS]
+
+    stints = laps.groupby(by_stint, observed=True).agg(
+        Race_Name=("Race_Name", "first"),
+        Team=("Team", "first"),
+        Compound=("Compound", "first"),
+        StartLap=("LapNumber", "min"),
+        EndLap=("LapNumber", "max"),
+        StartTyreLife=("TyreLife", "min"),
+    )
+
+    # Batched least squares: slope = (n·Σxy − Σx·Σy) / (n·Σx² − (Σx)²),
+    # in float64 (the float32 lap times would cancel out in the numerator)
+    x = laps["TyreLife"].astype("float64").where(clean)
+    y = laps["LapTimeSeconds"].astype("float64").where(clean)
+    valid = x.notna() & y.notna()
+    x, y = x.where(valid), y.where(valid)
+    sums = (
+        x.to_frame("x").assign(y=y, xy=x * y, xx=x * x, n=valid.astype(int))
+        .groupby(by_stint, observed=True).sum()
+    )
+    denom = sums["n"] * sums["xx"] - sums["x"] ** 2
+    with np.errstate(divide="ignore", invalid="ignore"):
+        slope = (sums["n"] * sums["xy"] - sums["x"] * sums["y"]) / denom
+    slope = slope.where((sums["n"] >= MIN_FIT_LAPS) & (denom > 0))
+
+    stints["CleanLaps"] = sums["n"]
+    stints["DegSlope"] = slope
+    stints["MeanLapTime"] = sums["y"] / sums["n"].where(sums["n"] > 0)
+    return stints.reset_index()
+
+
+def compound_degradation(laps):
+    """Median stint slope per (season, race, compound)."""
+    stints = stint_degradation(laps).dropna(subset=["DegSlope"])
+    return (
+        stints.groupby(["Season", "Race_Name", "Compound"], observed=True)
+        .agg(
+            DegSlope=("DegSlope", "median"),
+            Stints=("DegSlope", "size"),
+            CleanLaps=("CleanLaps", "sum"),
+        )
+        .reset_index()
+    )
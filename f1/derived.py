@@ -0,0 +1,111 @@
+# Derived tables
+#
+# Tables computed from the lap store or the results tables (degradation,
+# season aggregates, ...) are materialised per season under
+# data/processed/derived/<name>/season=YYYY.parquet. Each file records the
+# data version of the source it was built from (a content hash of the
+# season's source files) and the engine version (a content hash of the
+# modules that compute the tables). A stored table is only used while both
+# still match, so stale tables are never served after a re-clean or a
+# change to the engines.
+import hashlib
+import os
+from pathlib import Path
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from f1 import aggregates, degradation, gaps, positions
+from f1.results import RESULT_TABLES, RESULTS_DIR, read_results, result_files
+from f1.store import LAPS_DIR, PROCESSED_DIR, partition_files, read_laps
+
+
+DERIVED_DIR = PROCESSED_DIR / "derived"
+VERSION_KEY = b"f1.data_version"
+ENGINE_MODULES = (aggregates, degradation, gaps, positions)  # the code the tables are computed by
+
+# name -> (source, function(source data of one season) -> DataFrame)
+#   "laps":    the season's lap table
+#   "results": dict of the season's races/results/stints tables
+DERIVED_TABLES = {
+    "lap_degradation": ("laps", degradation.lap_degradation),
+    "stint_degradation": ("laps", degradation.stint_degradation),
+    "compound_degradation": ("laps", degradation.compound_degradation),
+    "team_pace_box": ("laps", aggregates.team_pace_box),
+    "team_pace_outliers": ("laps", aggregates.team_pace_outliers),
+    "team_race_pace": ("laps", aggregates.team_race_pace),
+    "race_positions": ("laps", positions.race_positions),
+    "pit_stops_per_circuit": ("results", aggregates.pit_stops_per_circuit),
+    "weather_correlation": ("results", aggregates.weather_correlation),
+    "compound_stint_lengths": ("results", aggregates.compound_stint_lengths),
+}
+
+
+def table_source(name):
+    return DERIVED_TABLES[name][0]
+
+
+def source_files(source, season):
+    if source == "laps":
+        return partition_files(LAPS_DIR, season)
+    return result_files(RESULTS_DIR, season)
+
+
+def load_source(source, season):
+    if source == "laps":
+        return read_laps(seasons=[season])
+    return {table: read_results(season, table) for table in RESULT_TABLES}
+
+
+def data_version(files):
+    """Content hash of a set of partition files."""
+    digest = hashlib.sha1()
+    for path in sorted(files):
+        digest.update(f"{path.parent.parent.name}/{path.parent.name}".encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()[:16]
+
+
+def code_version(modules):
+    """Content hash of the source files of `modules`."""
+    digest = hashlib.sha1()
+    for module in modules:
+        digest.update(Path(module.__file__).read_bytes())
+    return digest.hexdigest()[:16]
+
+
+ENGINE_VERSION = code_version(ENGINE_MODULES)
+
+
+def _stored_version(version):
+    # What VERSION_KEY holds: the data version plus the engine version
+    return f"{version}+{ENGINE_VERSION}".encode()
+
+
+def derived_path(name, season, root=DERIVED_DIR):
+    return root / name / f"season={season}.parquet"
+
+
+def build_derived(name, data):
+    return DERIVED_TABLES[name][1](data)
+
+
+def write_derived(name, season, df, version, root=DERIVED_DIR):
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    metadata = {**(table.schema.metadata or {}), VERSION_KEY: _stored_version(version)}
+    path = derived_path(name, season, root)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    pq.write_table(table.replace_schema_metadata(metadata), tmp_path)
+    os.replace(tmp_path, path)
+
+
+def read_derived(name, season, version, root=DERIVED_DIR):
+    """Stored table `name` for `season`, or None if missing or stale."""
+    path = derived_path(name, season, root)
+    if not path.exists():
+        return None
+    table = pq.read_table(path)
+    if (table.schema.metadata or {}).get(VERSION_KEY) != _stored_version(version):
+        return None
+    return table.to_pandas()
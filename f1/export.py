@@ -0,0 +1,92 @@
+# Static image export
+#
+# Rendering a figure to PNG/SVG goes through Kaleido's headless Chromium and
+# takes about a second, so it never happens on the script thread by default:
+#   - images are only rendered when a user asks for one
+#   - renders run on a single background worker that keeps one Kaleido
+#     browser warm, so concurrent sessions queue instead of each starting
+#     their own Chromium
+#   - results are cached under the figure's cache key (f1.figures.figure_key:
+#     page, selection and data version) plus format and scale, so the same
+#     figure is rendered once for every session that exports it, and a
+#     rerun checks the cache without serialising the figure
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import plotly.io as pio
+
+
+MAX_IMAGES = 64
+RENDER_TIMEOUT = 60  # seconds a page waits for a render
+
+_pool = None
+_lock = threading.Lock()
+_images = OrderedDict()  # image key -> image bytes
+_pending = {}  # image key -> Future
+
+
+def _start_renderer():
+    # Kaleido >= 1.0 can keep one browser process running for all renders.
+    # If it can't (older Kaleido, no Chrome yet), pio.to_image still works
+    # and starts a renderer per call, or reports the real error per export.
+    try:
+        import kaleido
+        kaleido.start_sync_server(silence_warnings=True)
+    except Exception:
+        pass
+
+
+def _get_pool():
+    global _pool
+    if _pool is None:
+        _pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="f1-export", initializer=_start_renderer)
+    return _pool
+
+
+def image_key(figure_key, fmt="png", scale=1):
+    return figure_key, fmt, scale
+
+
+def _render(key, fig, fmt, scale):
+    try:
+        data = pio.to_image(fig, format=fmt, scale=scale)
+        with _lock:
+            _images[key] = data
+            while len(_images) > MAX_IMAGES:
+                _images.popitem(last=False)
+        return data
+    finally:
+        with _lock:
+            _pending.pop(key, None)
+
+
+def cached_image(figure_key, fmt="png", scale=1):
+    """Image bytes if the figure cached under `figure_key` was already rendered, else None."""
+    key = image_key(figure_key, fmt, scale)
+    with _lock:
+        data = _images.get(key)
+        if data is not None:
+            _images.move_to_end(key)
+        return data
+
+
+def render_image(figure_key, fig, fmt="png", scale=1):
+    """Future resolving to the image bytes of `fig`, the figure cached under `figure_key`.
+
+    Already-rendered figures resolve immediately; a figure that is already
+    being rendered for another session shares that render.
+    """
+    key = image_key(figure_key, fmt, scale)
+    with _lock:
+        data = _images.get(key)
+        if data is None:
+            future = _pending.get(key)
+            if future is None:
+                future = _get_pool().submit(_render, key, fig, fmt, scale)
+                _pending[key] = future
+            return future
+
+    done = Future()
+    done.set_result(data)
+    return done
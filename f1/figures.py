@@ -0,0 +1,153 @@
+# Plotly figure helpers
+#
+# Figures are built once per selection and cached as serialised JSON, keyed
+# by (page, season, race, sorted drivers, data version), with LRU eviction.
+# A rerun with an unchanged selection just deserialises the cached spec
+# instead of rebuilding every trace. JSON strings are immutable, so one
+# cached figure can be handed to every session safely.
+#
+# Dense traces are thinned on the server before they are sent: long series
+# are downsampled with LTTB (largest triangle three buckets), which keeps
+# the peaks and troughs that make the shape of a line, and point clouds keep
+# evenly spaced ranks of their distribution. Above WEBGL_THRESHOLD points
+# per figure, traces render with WebGL (Scattergl) instead of SVG. Each
+# trace records its original and shown point counts in trace.meta, which
+# decimation_note() turns into a caption for the page.
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import plotly.graph_objects as go
+import plotly.io as pio
+
+from f1.analytics import pit_laps
+
+
+MAX_FIGURES = 128
+MAX_POINTS = 1000  # per trace, after downsampling
+WEBGL_THRESHOLD = 1000  # points per figure
+
+_lock = threading.Lock()
+_figures = OrderedDict()  # key -> figure JSON
+
+
+def pit_lines(laps, color, opacity=1.0):
+    """Dashed vertical lines at the pit-in laps of `laps`, as layout shapes.
+
+    Collect the shapes of every driver and pass them to
+    fig.update_layout(shapes=...) once; add_vline relayouts the whole
+    figure on every call.
+    """
+    return [
+        dict(
+            type="line", xref="x", yref="paper",
+            x0=lap, x1=lap, y0=0, y1=1,
+            line=dict(color=color, dash="dash", width=1),
+            opacity=opacity,
+        )
+        for lap in pit_laps(laps)
+    ]
+
+
+def figure_key(page, season, race, drivers, version=None):
+    return page, season, race, tuple(sorted(drivers)), version
+
+
+def cached_figure(key, build):
+    """Figure for `key`, calling build() only on a cache miss."""
+    with _lock:
+        spec = _figures.get(key)
+        if spec is not None:
+            _figures.move_to_end(key)
+
+    if spec is None:
+        spec = build().to_json()
+        with _lock:
+            _figures[key] = spec
+            while len(_figures) > MAX_FIGURES:
+                _figures.popitem(last=False)
+    return pio.from_json(spec)
+
+
+# -------------------------------
+# Downsampling and WebGL
+# -------------------------------
+def lttb(x, y, n_out):
+    """Indices of `n_out` points of (x, y) chosen by largest triangle three buckets.
+
+    The first and last points are always kept; every bucket in between
+    keeps the point forming the largest triangle with the previously kept
+    point and the average of the next bucket. NaN points (gaps in a line)
+    are always kept.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    gaps = np.flatnonzero(np.isnan(x) | np.isnan(y))
+    if len(gaps):
+        finite = np.setdiff1d(np.arange(len(x)), gaps)
+        keep = finite[lttb(x[finite], y[finite], max(n_out - len(gaps), 3))]
+        return np.union1d(keep, gaps)
+
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.intp)  # n_out - 2 buckets
+    keep = np.empty(n_out, dtype=np.intp)
+    keep[0], keep[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        next_hi = edges[i + 2] if i + 2 < len(edges) else n
+        next_x, next_y = x[hi:next_hi].mean(), y[hi:next_hi].mean()
+        area = np.abs((x[a] - next_x) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (next_y - y[a]))
+        a = lo + int(area.argmax())
+        keep[i + 1] = a
+    return keep
+
+
+def rank_sample(y, n_out):
+    """Indices of `n_out` points at evenly spaced ranks of `y` (min and max included)."""
+    n = len(y)
+    if n_out >= n:
+        return np.arange(n)
+    order = np.argsort(np.asarray(y), kind="stable")
+    return np.sort(order[np.linspace(0, n - 1, n_out).round().astype(np.intp)])
+
+
+def line_trace(x, y, figure_points=None, max_points=MAX_POINTS, **kwargs):
+    """go.Scatter of a series, LTTB-downsampled to `max_points`.
+
+    Returns a go.Scattergl instead when the figure holds more than
+    WEBGL_THRESHOLD points in all (`figure_points`, default: this trace's).
+    """
+    x, y = np.asarray(x), np.asarray(y)
+    keep = lttb(x, y, max_points)
+    return _trace(x, y, keep, figure_points, **kwargs)
+
+
+def point_trace(x, y, figure_points=None, max_points=MAX_POINTS, **kwargs):
+    """Like line_trace, for unordered points: keeps evenly spaced ranks of `y`."""
+    x, y = np.asarray(x), np.asarray(y)
+    keep = rank_sample(y, max_points)
+    return _trace(x, y, keep, figure_points, **kwargs)
+
+
+def _trace(x, y, keep, figure_points, **kwargs):
+    webgl = (figure_points or len(x)) > WEBGL_THRESHOLD
+    trace = go.Scattergl if webgl else go.Scatter
+    return trace(x=x[keep], y=y[keep], meta=dict(points=len(x), shown=len(keep)), **kwargs)
+
+
+def decimation_note(fig):
+    """Caption describing how `fig` was thinned out, or None if nothing was."""
+    counts = [trace.meta for trace in fig.data if isinstance(trace.meta, dict) and "points" in trace.meta]
+    points = sum(count["points"] for count in counts)
+    shown = sum(count["shown"] for count in counts)
+    webgl = any(trace.type == "scattergl" for trace in fig.data)
+    if shown == points and not webgl:
+        return None
+    if shown < points:
+        note = f"Showing {shown:,} of {points:,} points ({shown / points:.0%}, downsampled on the server)"
+    else:
+        note = f"{points:,} points"
+    return note + (" · WebGL rendering" if webgl else "")
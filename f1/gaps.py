@@ -0,0 +1,190 @@
+# Driver-to-driver gaps
+#
+# The lap table's Time column is the session time at which a driver crossed
+# the line at the end of each lap. Laid out as a drivers × laps array, the
+# gap between every pair of drivers on every lap is a single broadcast
+# subtraction:
+#
+#     gaps[a, b, lap] = times[b, lap] - times[a, lap]    (> 0: b behind a)
+#
+# Laps without a row in the lap store (dropped by the cleaner for having no
+# lap time; deleted laps are kept, see f1/store.py) are filled in by
+# complete_laps(): the end of a lap is the start of the next one (its Time
+# minus its lap time), and longer holes are interpolated from the driver's
+# crossing times, which only ever increase. A car still running when the
+# winner took the flag but whose final lap has no row gets that lap too:
+# its flag crossing is estimated from its last lap time. Laps after a retirement stay NaN, so a pair only has a gap
+# while both cars are running. Cars are compared at the same lap number,
+# so a lapped car's gap includes the laps it is down.
+import numpy as np
+import pandas as pd
+
+
+CLOSE_GAP = 1.0  # seconds, DRS range
+MIN_SHARED_LAPS = 5  # for a pair to count in closest_pairs
+DRIVER_KEYS = ["Season", "Round", "Driver"]
+MAX_FLAG_LAPS = 1  # missing laps at the end of a race that are still filled in
+
+
+# -------------------------------
+# Lap end times
+# -------------------------------
+def complete_laps(laps):
+    """One row per lap from 1 to each driver's last lap, with every crossing time known.
+
+    `laps` is a lap table of one or more races. Returns DRIVER_KEYS,
+    Race_Name, Team, LapNumber, Time, PitInTime, PitOutTime and Estimated
+    (Time filled in, the lap has no row in `laps`), sorted by driver and lap.
+    A driver's last lap is the one on which they took the flag when they
+    were still running at the finish (see _flag_laps).
+    Time stays NaN only on missing laps before a driver's first known one.
+    """
+    last = _flag_laps(laps)
+    sizes = last["LastLap"].to_numpy(dtype=np.int64)
+    driver = np.repeat(np.arange(len(last)), sizes)
+    grid = last[DRIVER_KEYS + ["Race_Name", "Team"]].iloc[driver].reset_index(drop=True)
+    grid["LapNumber"] = (np.arange(sizes.sum()) - np.repeat(np.cumsum(sizes) - sizes, sizes) + 1).astype(np.int16)
+
+    columns = ["LapNumber", "Time", "LapTimeSeconds", "PitInTime", "PitOutTime"]
+    grid = grid.merge(laps[DRIVER_KEYS + columns], on=DRIVER_KEYS + ["LapNumber"], how="left")
+    time = grid["Time"].to_numpy(dtype=np.float64, copy=True)
+    known = ~np.isnan(time)
+
+    # Flag lap without a row: estimated from the driver's last lap time
+    # (laps between it and the last known one are interpolated below)
+    flag_row = np.cumsum(sizes) - 1
+    flag = last["FlagTime"].to_numpy()
+    missing_flag = np.isnan(time[flag_row]) & ~np.isnan(flag)
+    time[flag_row[missing_flag]] = flag[missing_flag]
+
+    # End of a missing lap = start of the driver's next lap
+    start = time - grid["LapTimeSeconds"].to_numpy(dtype=np.float64)
+    next_start = np.append(start[1:], np.nan)
+    next_same = np.append(driver[1:] == driver[:-1], False)
+    fill = ~known & next_same & ~np.isnan(next_start)
+    time[fill] = next_start[fill]
+
+    # Longer holes: linear between the driver's known laps around them
+    have = ~np.isnan(time)
+    rows = np.arange(len(time))
+    before = np.maximum.accumulate(np.where(have, rows, 0))
+    after = np.minimum.accumulate(np.where(have, rows, len(time) - 1)[::-1])[::-1]
+    inside = ~have & have[before] & have[after] & (driver[before] == driver) & (driver[after] == driver)
+    share = (rows - before) / np.maximum(after - before, 1)
+    time[inside] = (time[before] + (time[after] - time[before]) * share)[inside]
+
+    grid["Time"] = time
+    grid["Estimated"] = ~known & ~np.isnan(time)
+    return grid.drop(columns="LapTimeSeconds")
+
+
+def _flag_laps(laps):
+    # One row per driver: LastLap, and FlagTime when the flag lap is missing.
+    # The race is over when the leader completes the last lap. A driver who
+    # was still running then crosses the line once more, on their flag lap;
+    # with their median lap time, that is at most MAX_FLAG_LAPS laps after
+    # their last crossing. Cars further back retired: with more missing
+    # laps, a finisher can't be told from a last-lap crash (no results here).
+    laps = laps.sort_values(DRIVER_KEYS + ["LapNumber"])
+    last = laps.groupby(DRIVER_KEYS, observed=True).agg(
+        Race_Name=("Race_Name", "first"), Team=("Team", "first"), LastLap=("LapNumber", "max"),
+        LastTime=("Time", "last"), LastLapTime=("LapTimeSeconds", "last"), MedianLap=("LapTimeSeconds", "median"),
+    ).reset_index()
+
+    race_laps = last.groupby(["Season", "Round"], observed=True)["LastLap"].transform("max").to_numpy()
+    final = laps["LapNumber"] == laps.groupby(["Season", "Round"], observed=True)["LapNumber"].transform("max")
+    finish = laps[final].groupby(["Season", "Round"], observed=True)["Time"].min()
+    finish = finish.reindex(pd.MultiIndex.from_frame(last[["Season", "Round"]])).to_numpy()
+
+    last_time = last["LastTime"].to_numpy()
+    behind = finish - last_time
+    missing = np.where(behind > 0, np.floor(behind / last["MedianLap"].to_numpy()) + 1, 0)
+    missing = np.minimum(np.nan_to_num(missing), race_laps - last["LastLap"].to_numpy())
+    missing = np.where(missing <= MAX_FLAG_LAPS, missing, 0).astype(np.int64)
+
+    last["LastLap"] += missing
+    last["FlagTime"] = np.where(
+        missing > 0,
+        np.maximum(last_time + missing * last["LastLapTime"].to_numpy(dtype=np.float64), finish),
+        np.nan,
+    )
+    return last
+
+
+# -------------------------------
+# Pairwise gaps
+# -------------------------------
+class RaceGaps:
+    """Gaps between every pair of drivers of one race, on every lap."""
+
+    def __init__(self, laps):
+        laps = complete_laps(laps)
+        self.drivers, rows = np.unique(laps["Driver"].astype(str).to_numpy(), return_inverse=True)
+        self.drivers = self.drivers.tolist()
+        lap_numbers = laps["LapNumber"].to_numpy(dtype=np.int64)
+        self.lap_numbers = np.arange(1, lap_numbers.max() + 1)
+
+        shape = (len(self.drivers), len(self.lap_numbers))
+        self.times = np.full(shape, np.nan)
+        self.times[rows, lap_numbers - 1] = laps["Time"].to_numpy()
+        self.estimated = np.zeros(shape, dtype=bool)
+        self.estimated[rows, lap_numbers - 1] = laps["Estimated"].to_numpy()
+        self.gaps = (self.times[None, :, :] - self.times[:, None, :]).astype(np.float32)
+        self._rows = {driver: row for row, driver in enumerate(self.drivers)}
+
+    def pair(self, driver, rival):
+        """Gap of `rival` to `driver` on every lap both were running.
+
+        Columns LapNumber, Gap (> 0: rival behind) and Estimated (either
+        crossing time was interpolated).
+        """
+        a, b = self._rows[driver], self._rows[rival]
+        gap = self.gaps[a, b]
+        running = ~np.isnan(gap)
+        return pd.DataFrame({
+            "LapNumber": self.lap_numbers[running],
+            "Gap": gap[running],
+            "Estimated": (self.estimated[a] | self.estimated[b])[running],
+        })
+
+    def closeness(self):
+        """Drivers × drivers: stats of |gap| over the laps each pair shared.
+
+        Returns (mean |gap|, shared laps, laps within CLOSE_GAP), each a
+        drivers × drivers array with NaN / 0 where a pair never shared a lap.
+        """
+        distance = np.abs(self.gaps)
+        laps = np.isfinite(distance).sum(axis=2)
+        total = np.nansum(distance, axis=2)
+        mean = np.divide(total, laps, out=np.full(laps.shape, np.nan), where=laps > 0)
+        close = (distance <= CLOSE_GAP).sum(axis=2)  # NaN compares False
+        np.fill_diagonal(mean, np.nan)
+        return mean, laps, close
+
+    def closest_pairs(self, min_laps=MIN_SHARED_LAPS):
+        """Every pair of drivers with at least `min_laps` laps in common, closest first.
+
+        Columns Driver, Rival, MeanGap (mean |gap|), Laps and LapsClose
+        (laps within CLOSE_GAP).
+        """
+        mean, laps, close = self.closeness()
+        a, b = np.triu_indices(len(self.drivers), k=1)
+        keep = laps[a, b] >= min_laps
+        a, b = a[keep], b[keep]
+        drivers = np.array(self.drivers, dtype=object)
+        return pd.DataFrame({
+            "Driver": drivers[a],
+            "Rival": drivers[b],
+            "MeanGap": mean[a, b],
+            "Laps": laps[a, b],
+            "LapsClose": close[a, b],
+        }).sort_values("MeanGap", ignore_index=True)
+
+    def nearest_rivals(self, min_laps=MIN_SHARED_LAPS):
+        """For each driver, the driver with the smallest mean |gap| to them."""
+        pairs = self.closest_pairs(min_laps)
+        both_ways = pd.concat(
+            [pairs, pairs.rename(columns={"Driver": "Rival", "Rival": "Driver"})], ignore_index=True
+        )
+        nearest = both_ways.sort_values("MeanGap", kind="stable").drop_duplicates("Driver")
+        return nearest.sort_values("Driver", ignore_index=True)[["Driver", "Rival", "MeanGap", "Laps", "LapsClose"]]
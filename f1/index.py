@@ -0,0 +1,63 @@
+# Race / driver row index over the lap table
+#
+# The lap table is sorted once by (Race_Name, Driver, LapNumber). Every race
+# is then a contiguous block of rows and every (race, driver) pair a
+# lap-sorted sub-block, so filtering is a dict lookup plus an iloc slice
+# instead of a boolean mask over the whole table.
+import numpy as np
+
+
+RACE_COL = "Race_Name"
+DRIVER_COL = "Driver"
+
+
+def _runs(*keys):
+    """Start/stop offsets of the runs of equal consecutive key tuples."""
+    changed = np.zeros(len(keys[0]) - 1, dtype=bool)
+    for key in keys:
+        changed |= key[1:] != key[:-1]
+    change = np.flatnonzero(changed) + 1
+    starts = np.concatenate(([0], change))
+    stops = np.concatenate((change, [len(keys[0])]))
+    return starts, stops
+
+
+class LapIndex:
+    def __init__(self, laps):
+        if laps.empty:
+            raise ValueError("Cannot index an empty lap table")
+        laps = laps.sort_values([RACE_COL, DRIVER_COL, "LapNumber"], kind="stable", ignore_index=True)
+        self.laps = laps
+
+        races = laps[RACE_COL].to_numpy(dtype=object)
+        drivers = laps[DRIVER_COL].to_numpy(dtype=object)
+
+        self._races = {}
+        for start, stop in zip(*_runs(races)):
+            self._races[races[start]] = slice(start, stop)
+
+        self._drivers = {}
+        self._race_drivers = {race: [] for race in self._races}
+        for start, stop in zip(*_runs(races, drivers)):
+            race, driver = races[start], drivers[start]
+            self._drivers[(race, driver)] = slice(start, stop)
+            self._race_drivers[race].append(driver)
+
+        self.races = sorted(self._races)
+        for race_drivers in self._race_drivers.values():
+            race_drivers.sort()
+
+    # -------------------------------
+    # Lookups
+    # -------------------------------
+    def drivers(self, race):
+        """Sorted driver codes that took part in `race`."""
+        return self._race_drivers.get(race, [])
+
+    def race(self, race):
+        """All laps of `race`, grouped by driver and sorted by lap."""
+        return self.laps.iloc[self._races.get(race, slice(0, 0))]
+
+    def driver(self, race, driver):
+        """Laps of `driver` in `race`, sorted by lap."""
+        return self.laps.iloc[self._drivers.get((race, driver), slice(0, 0))]
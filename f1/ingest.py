@@ -0,0 +1,268 @@
+# Season ingestion from FastF1
+#
+# Laps are stored one Parquet file per race, partitioned by season:
+#
+#     <root>/season=2024/round=01/laps.parquet
+#     <root>/season=2024/_manifest.json
+#
+# Rounds are fetched in parallel across a process pool and each finished
+# round is written to disk as soon as it completes. The manifest records
+# which event each checkpoint came from and when it was fetched, so a
+# re-run compares it against the current schedule and only fetches rounds
+# that are missing, were rescheduled, or were fetched before their data
+# settled.
+#
+# What gets loaded per round is set by a load profile (see LOAD_PROFILES):
+# the default "laps" profile skips car telemetry and position data entirely
+# and only persists the lap columns the cleaner and pages use. Profiles that
+# load telemetry also cut the car data into laps and write it to the
+# telemetry store (see f1/telemetry.py): the live TELEMETRY_DIR for the
+# default root, <root>/telemetry for any other, so a scratch ingest never
+# writes into the live tree.
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import fastf1
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from f1.store import BASE_DIR, round_path, season_path, write_partition
+from f1.telemetry import TELEMETRY_DIR, lap_telemetry, telemetry_files, telemetry_path, write_telemetry
+
+
+RAW_LAPS_DIR = BASE_DIR / "data" / "raw" / "laps"
+CACHE_DIR = BASE_DIR / "fastf1_cache"
+MANIFEST_NAME = "_manifest.json"
+
+# Timing data can still be corrected shortly after a race, so a round
+# fetched within this window of the event is fetched again next run.
+SETTLE_TIME = timedelta(days=3)
+
+
+# -------------------------------
+# Load profiles
+# -------------------------------
+# Lap columns the cleaning stage and the pages read
+LAP_COLUMNS = [
+    "Time", "Driver", "DriverNumber", "LapTime", "LapNumber", "Stint",
+    "PitOutTime", "PitInTime", "IsPersonalBest", "Compound", "TyreLife",
+    "FreshTyre", "Team", "Deleted", "Position",
+]
+WEATHER_COLUMNS = ["AirTemp", "TrackTemp", "Humidity", "WindSpeed", "Rainfall"]
+EVENT_COLUMNS = ["Season", "Round", "Race_Name", "Circuit", "Country", "Date"]
+
+# `load` is passed to Session.load(). Race control messages stay on in every
+# profile: FastF1 needs them to flag deleted laps.
+# `columns` is what gets persisted (None keeps every lap column).
+LOAD_PROFILES = {
+    "laps": {
+        "load": dict(laps=True, telemetry=False, weather=False, messages=True),
+        "columns": LAP_COLUMNS + EVENT_COLUMNS,
+    },
+    "laps_telemetry": {
+        "load": dict(laps=True, telemetry=True, weather=False, messages=True),
+        "columns": LAP_COLUMNS + EVENT_COLUMNS,
+    },
+    "laps_weather": {
+        "load": dict(laps=True, telemetry=False, weather=True, messages=True),
+        "columns": LAP_COLUMNS + WEATHER_COLUMNS + EVENT_COLUMNS,
+    },
+    "full": {
+        "load": dict(laps=True, telemetry=True, weather=True, messages=True),
+        "columns": None,
+    },
+}
+DEFAULT_PROFILE = "laps"
+
+
+# -------------------------------
+# Checkpoints
+# -------------------------------
+def has_checkpoint(path):
+    """True if `path` is a complete, non-empty Parquet file."""
+    try:
+        return pq.read_metadata(path).num_rows > 0
+    except (OSError, pa.ArrowInvalid):
+        return False
+
+
+def load_manifest(root, season):
+    path = season_path(root, season) / MANIFEST_NAME
+    if not path.exists():
+        return {}
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_manifest(root, season, manifest):
+    path = season_path(root, season) / MANIFEST_NAME
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(".tmp")
+    with open(tmp_path, "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+# -------------------------------
+# Schedule comparison
+# -------------------------------
+def get_schedule(season):
+    events = fastf1.get_event_schedule(season, include_testing=False)
+    return events[["RoundNumber", "EventName", "EventDate"]]
+
+
+def rounds_to_fetch(root, season, schedule, manifest, profile=DEFAULT_PROFILE, now=None):
+    """Rounds of `schedule` whose stored checkpoint is missing or stale."""
+    now = now or datetime.now()
+    todo = []
+    for event in schedule.itertuples(index=False):
+        round_no = int(event.RoundNumber)
+        event_date = pd.Timestamp(event.EventDate)
+        if event_date > now:
+            continue  # not raced yet
+
+        entry = manifest.get(str(round_no))
+        if entry is None or not has_checkpoint(round_path(root, season, round_no)):
+            todo.append(round_no)
+        elif entry["event_name"] != event.EventName or entry["event_date"] != str(event_date):
+            todo.append(round_no)  # rescheduled or renamed since last fetch
+        elif entry.get("profile", DEFAULT_PROFILE) != profile:
+            todo.append(round_no)  # stored with different columns
+        elif pd.Timestamp(entry["fetched_at"]) < event_date + SETTLE_TIME:
+            todo.append(round_no)  # fetched before the data settled
+    return todo
+
+
+# -------------------------------
+# Fetching
+# -------------------------------
+def _dir_size(path):
+    return sum(f.stat().st_size for f in Path(path).rglob("*") if f.is_file())
+
+
+def _frame_bytes(frames):
+    return int(sum(df.memory_usage(deep=True).sum() for df in frames if df is not None))
+
+
+def fetch_round(season, round_no, cache_dir, profile=DEFAULT_PROFILE):
+    """Load one race session with `profile` and return its laps, telemetry and load stats.
+
+    Telemetry is (samples, index) from f1.telemetry.lap_telemetry, or None
+    when the profile doesn't load it.
+
+    Stats are bytes downloaded (growth of the FastF1 cache folder; approximate
+    when several workers share the cache), bytes parsed (in-memory size of
+    everything the session loaded) and load time.
+    """
+    settings = LOAD_PROFILES[profile]
+    fastf1.Cache.enable_cache(str(cache_dir))
+    race = fastf1.get_session(season, round_no, 'R')  # 'R' = Race
+
+    cache_before = _dir_size(cache_dir)
+    start = time.perf_counter()
+    race.load(**settings["load"])
+    load_seconds = time.perf_counter() - start
+
+    laps = pd.DataFrame(race.laps).reset_index(drop=True)
+    parsed = [laps]
+    telemetry = None
+    if settings["load"]["telemetry"]:
+        parsed += list(race.car_data.values()) + list(race.pos_data.values())
+        telemetry = lap_telemetry(race.car_data, race.laps)
+    if settings["load"]["weather"]:
+        parsed.append(race.weather_data)
+        weather = race.laps.get_weather_data().reset_index(drop=True)
+        laps[WEATHER_COLUMNS] = weather[WEATHER_COLUMNS].to_numpy()
+
+    laps['Season'] = season
+    laps['Round'] = round_no
+    laps['Race_Name'] = race.event['EventName']
+    laps['Circuit'] = race.event['EventName']
+    laps['Country'] = race.event['Country']
+    laps['Date'] = race.event['EventDate']
+    if settings["columns"] is not None:
+        laps = laps[settings["columns"]]
+
+    stats = {
+        "bytes_downloaded": _dir_size(cache_dir) - cache_before,
+        "bytes_parsed": _frame_bytes(parsed),
+        "load_seconds": round(load_seconds, 2),
+    }
+    return laps, telemetry, stats
+
+
+def telemetry_root(root):
+    """Telemetry store that goes with the lap store `root`."""
+    return TELEMETRY_DIR if Path(root).resolve() == RAW_LAPS_DIR else Path(root) / TELEMETRY_DIR.name
+
+
+def _ingest_round(season, round_no, root, cache_dir, profile):
+    start = time.perf_counter()
+    laps, telemetry, stats = fetch_round(season, round_no, cache_dir, profile)
+    write_partition(laps, round_path(root, season, round_no))
+    stats["laps"] = len(laps)
+    stats["bytes_stored"] = round_path(root, season, round_no).stat().st_size
+    if telemetry is not None:
+        telemetry_dir = telemetry_root(root)
+        write_telemetry(*telemetry, telemetry_path(telemetry_dir, season, round_no))
+        stats["bytes_stored"] += sum(path.stat().st_size for path in telemetry_files(telemetry_dir, season, round_no))
+    stats["round_seconds"] = round(time.perf_counter() - start, 2)
+    return stats
+
+
+def ingest_season(season, root=RAW_LAPS_DIR, cache_dir=CACHE_DIR, workers=None,
+                  force=False, profile=DEFAULT_PROFILE):
+    """Fetch the new or updated rounds of `season` into `root`.
+
+    Returns the list of rounds that failed.
+    """
+    if profile not in LOAD_PROFILES:
+        raise ValueError(f"Unknown load profile {profile!r}, expected one of {list(LOAD_PROFILES)}")
+    os.makedirs(cache_dir, exist_ok=True)
+    fastf1.Cache.enable_cache(str(cache_dir))
+    schedule = get_schedule(season)
+    manifest = {} if force else load_manifest(root, season)
+
+    todo = rounds_to_fetch(root, season, schedule, manifest, profile)
+    print(f"Season {season}: {len(schedule)} rounds scheduled, {len(todo)} to fetch ({profile} profile)")
+    if not todo:
+        return []
+
+    events = schedule.set_index("RoundNumber")
+    failed = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {
+            pool.submit(_ingest_round, season, r, root, cache_dir, profile): r
+            for r in todo
+        }
+        for future in as_completed(futures):
+            round_no = futures[future]
+            try:
+                stats = future.result()
+            except Exception as e:
+                print(f"  Failed to process Round {round_no}: {e}")
+                failed.append(round_no)
+                continue
+
+            # Record each round as soon as it lands so a crash keeps it
+            manifest[str(round_no)] = {
+                "event_name": events.loc[round_no, "EventName"],
+                "event_date": str(pd.Timestamp(events.loc[round_no, "EventDate"])),
+                "fetched_at": datetime.now().isoformat(timespec="seconds"),
+                "profile": profile,
+                **stats,
+            }
+            save_manifest(root, season, manifest)
+            print(
+                f"  Round {round_no}: {stats['laps']} laps, "
+                f"{stats['bytes_downloaded'] / 1e6:.1f} MB downloaded, "
+                f"{stats['bytes_parsed'] / 1e6:.1f} MB parsed, "
+                f"{stats['bytes_stored'] / 1e6:.2f} MB stored, "
+                f"{stats['round_seconds']:.1f}s"
+            )
+    return sorted(failed)
@@ -0,0 +1,282 @@
+# Page instrumentation
+#
+# Each page run records timing spans for its phases (load, filter, images,
+# figure, export, ...) and is tagged with the season and race it showed:
+#
+#     run = start_run("driver_comp")
+#     run.tag(season=season, race=race)
+#     with run.span("load"):
+#         ...
+#     run.finish()          # records the "total" phase, traces the run and exports
+#     dev_overlay(run)      # sidebar table, only with ?dev=1 in the URL
+#
+# Spans are aggregated per process into Prometheus histograms, labelled by
+# page and phase only (one series per race would grow without bound) and
+# exposed
+#   - as a text file when F1_METRICS_FILE is set (node_exporter textfile
+#     collector), rewritten at most every EXPORT_INTERVAL seconds, and/or
+#   - on http://127.0.0.1:<port>/metrics when F1_METRICS_PORT is set.
+# The season and race go to the trace of each finished run instead: the
+# last TRACE_RUNS runs of the process are kept by recent_runs().
+#
+# Peak memory per phase comes from tracemalloc, which slows allocations
+# down noticeably, so it is only on with F1_METRICS_MEMORY=1. tracemalloc is
+# process-wide: with concurrent sessions a phase's peak includes whatever the
+# other sessions allocated meanwhile, and a span starting in another session
+# resets the shared peak, losing this one's. Read it as a rough figure that
+# can be off either way; it is only exact with a single session.
+import logging
+import os
+import threading
+import time
+import tracemalloc
+from collections import deque
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+
+BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)  # seconds
+EXPORT_INTERVAL = 5.0
+LABELS = ("page", "phase")
+TRACE_RUNS = 200
+
+METRICS_FILE = os.environ.get("F1_METRICS_FILE")
+METRICS_PORT = os.environ.get("F1_METRICS_PORT")
+TRACE_MEMORY = os.environ.get("F1_METRICS_MEMORY") == "1"
+
+_lock = threading.Lock()
+_series = {}  # label values -> {"buckets": [...], "count", "sum", "peak"}
+_traces = deque(maxlen=TRACE_RUNS)  # finished runs, oldest first
+_last_export = 0.0
+_server = None
+_serve_failed = False
+
+log = logging.getLogger(__name__)
+
+
+# -------------------------------
+# Recording
+# -------------------------------
+class PageRun:
+    """Spans of one page run; see the module docstring for usage."""
+
+    def __init__(self, page):
+        self.page = page
+        self.tags = {"season": None, "race": None}
+        self.spans = []  # (phase, seconds, peak bytes or None)
+        self.start = time.perf_counter()
+
+    def tag(self, season=None, race=None):
+        if season is not None:
+            self.tags["season"] = season
+        if race is not None:
+            self.tags["race"] = race
+
+    @contextmanager
+    def span(self, phase):
+        tracing = tracemalloc.is_tracing()
+        if tracing:
+            base = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - start
+            peak = tracemalloc.get_traced_memory()[1] - base if tracing else None
+            self._record(phase, seconds, peak)
+
+    def _record(self, phase, seconds, peak):
+        self.spans.append((phase, seconds, peak))
+        observe(self.page, phase, seconds, peak)
+
+    def finish(self):
+        """Record the whole run as the "total" phase, trace it and export."""
+        self._record("total", time.perf_counter() - self.start, None)
+        trace = {"page": self.page, **self.tags, "spans": list(self.spans)}
+        with _lock:
+            _traces.append(trace)
+        export()
+
+
+def start_run(page):
+    if TRACE_MEMORY and not tracemalloc.is_tracing():
+        tracemalloc.start()
+    if METRICS_PORT:
+        serve(int(METRICS_PORT))
+    return PageRun(page)
+
+
+def observe(page, phase, seconds, peak=None):
+    key = (page, phase)
+    with _lock:
+        series = _series.get(key)
+        if series is None:
+            series = _series[key] = {"buckets": [0] * len(BUCKETS), "count": 0, "sum": 0.0, "peak": None}
+        for i, bound in enumerate(BUCKETS):
+            if seconds <= bound:
+                series["buckets"][i] += 1
+        series["count"] += 1
+        series["sum"] += seconds
+        if peak is not None:
+            series["peak"] = max(peak, series["peak"] or 0)
+
+
+def snapshot():
+    """[(labels dict, series dict)] of everything recorded in this process."""
+    with _lock:
+        return [
+            (dict(zip(LABELS, key)), {**series, "buckets": list(series["buckets"])})
+            for key, series in _series.items()
+        ]
+
+
+def recent_runs():
+    """[trace dict] of the last TRACE_RUNS finished runs: page, season, race
+    and spans [(phase, seconds, peak bytes or None)], oldest first."""
+    with _lock:
+        return list(_traces)
+
+
+# -------------------------------
+# Prometheus export
+# -------------------------------
+def _labels(labels, **extra):
+    def escape(value):
+        return str(value).replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+    return "{" + ",".join(f'{name}="{escape(value)}"' for name, value in {**labels, **extra}.items()) + "}"
+
+
+def prometheus_text():
+    """All series in the Prometheus text exposition format."""
+    series = snapshot()
+    lines = [
+        "# HELP f1_page_phase_seconds Time spent in each phase of a page run.",
+        "# TYPE f1_page_phase_seconds histogram",
+    ]
+    for labels, values in series:
+        for bound, count in zip(BUCKETS, values["buckets"]):
+            lines.append(f"f1_page_phase_seconds_bucket{_labels(labels, le=bound)} {count}")
+        lines.append(f"f1_page_phase_seconds_bucket{_labels(labels, le='+Inf')} {values['count']}")
+        lines.append(f"f1_page_phase_seconds_sum{_labels(labels)} {values['sum']:.6f}")
+        lines.append(f"f1_page_phase_seconds_count{_labels(labels)} {values['count']}")
+
+    lines += [
+        "# HELP f1_page_phase_peak_bytes Highest traced memory peak of a phase (F1_METRICS_MEMORY=1).",
+        "# TYPE f1_page_phase_peak_bytes gauge",
+    ]
+    lines += [
+        f"f1_page_phase_peak_bytes{_labels(labels)} {values['peak']}"
+        for labels, values in series if values["peak"] is not None
+    ]
+    return "\n".join(lines) + "\n"
+
+
+def write_prometheus(path):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    tmp_path.write_text(prometheus_text(), encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
+def export():
+    """Rewrite F1_METRICS_FILE, at most every EXPORT_INTERVAL seconds."""
+    global _last_export
+    if not METRICS_FILE:
+        return
+    now = time.monotonic()
+    with _lock:
+        if now - _last_export < EXPORT_INTERVAL:
+            return
+        _last_export = now
+    write_prometheus(METRICS_FILE)
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path != "/metrics":
+            self.send_error(404)
+            return
+        body = prometheus_text().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def serve(port):
+    """Serve /metrics on localhost in a daemon thread (once per process).
+
+    If the port can't be bound (another app process, or an old socket still
+    in TIME_WAIT), log it once and carry on without the endpoint: metrics
+    must never stop a page from rendering.
+    """
+    global _server, _serve_failed
+    with _lock:
+        if _server is not None or _serve_failed:
+            return
+        try:
+            _server = ThreadingHTTPServer(("127.0.0.1", port), _MetricsHandler)
+        except OSError as error:
+            _serve_failed = True
+            log.warning("Metrics endpoint disabled, can't listen on port %s: %s", port, error)
+            return
+    threading.Thread(target=_server.serve_forever, daemon=True).start()
+
+
+# -------------------------------
+# Developer overlay
+# -------------------------------
+def dev_overlay(run, top=10):
+    """Sidebar tables of this run's spans, the slowest phases and the slowest recent runs.
+
+    Shown only when the page is opened with ?dev=1.
+    """
+    import streamlit as st
+
+    if st.query_params.get("dev") != "1":
+        return
+
+    st.sidebar.markdown("---")
+    st.sidebar.caption(f"⏱️ {run.page} – {run.tags['season'] or ''} {run.tags['race'] or ''}")
+    st.sidebar.dataframe(
+        [
+            {"Phase": phase, "ms": round(seconds * 1000, 1),
+             "Peak MB": None if peak is None else round(peak / 2**20, 1)}
+            for phase, seconds, peak in run.spans
+        ],
+        hide_index=True,
+    )
+
+    slowest = sorted(
+        ((values["sum"] / values["count"], labels, values)
+         for labels, values in snapshot() if labels["phase"] != "total"),
+        key=lambda row: row[0], reverse=True,
+    )[:top]
+    st.sidebar.caption("Slowest phases in this process (mean)")
+    st.sidebar.dataframe(
+        [
+            {"Page": labels["page"], "Phase": labels["phase"],
+             "Runs": values["count"], "Mean ms": round(mean * 1000, 1)}
+            for mean, labels, values in slowest
+        ],
+        hide_index=True,
+    )
+
+    # The race is only in the traces, not in the histogram labels
+    runs = sorted(recent_runs(), key=lambda trace: trace["spans"][-1][1], reverse=True)[:top]
+    st.sidebar.caption(f"Slowest of the last {TRACE_RUNS} runs")
+    st.sidebar.dataframe(
+        [
+            {"Page": trace["page"], "Race": trace["race"] or trace["season"],
+             "Total ms": round(trace["spans"][-1][1] * 1000, 1)}
+            for trace in runs
+        ],
+        hide_index=True,
+    )
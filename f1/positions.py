@@ -0,0 +1,86 @@
+# Race order engine
+#
+# The lap table has no Position column (the cleaner drops it), but the Time
+# of every lap is the session time at which the driver crossed the line.
+# Sorting all laps of a race once by (LapNumber, Time) gives the running
+# order at the end of every lap:
+#   - Position: rank among the cars that completed that lap
+#   - GapToLeader / GapAhead: crossing time behind the leader / the car
+#     ahead on the same lap (a lapped car's gap includes the laps it is down)
+#   - PositionsGained: places gained since the previous lap
+#   - Overtakes / OvertakenBy: cars passed on track during the lap, and
+#     cars that passed this one
+#
+# Lap 1 is compared with the grid, from a GridPosition column of the lap
+# table. The lap store doesn't hold one (every car's lap 1 starts at the
+# same session time, so the laps can't tell the grid order either): without
+# it, lap 1 has no PositionsGained and no overtakes.
+#
+# Missing laps are filled in by f1.gaps.complete_laps, so a driver without a
+# lap time doesn't drop out of the order for that lap. A swap only counts as
+# an overtake when neither car was in the pits on that lap (in- or out-lap)
+# and neither car's order rests on a filled-in lap.
+# Everything runs over all races of a season at once with sorts, grouped
+# cumulative operations and one self-join per lap; no per-race loops.
+import numpy as np
+
+from f1.gaps import DRIVER_KEYS, complete_laps
+
+
+LAP_KEYS = ["Season", "Round", "LapNumber"]
+
+POSITION_COLUMNS = [
+    "Season", "Round", "Race_Name", "Driver", "Team", "LapNumber", "Time",
+    "Position", "GapToLeader", "GapAhead", "PositionsGained",
+    "Overtakes", "OvertakenBy", "Pitted", "Estimated",
+]
+
+
+def _overtakes(order):
+    # Pair every car with every other car on the same lap; A passed B when
+    # A was behind B after the previous lap and is ahead now
+    cars = order[LAP_KEYS + ["Position", "PreviousPosition", "Clean"]].assign(Row=np.arange(len(order)))
+    pairs = cars.merge(cars, on=LAP_KEYS, suffixes=("", "Other"))
+    passed = (
+        (pairs["PreviousPosition"] > pairs["PreviousPositionOther"])
+        & (pairs["Position"] < pairs["PositionOther"])
+        & pairs["Clean"] & pairs["CleanOther"]
+    ).to_numpy()
+    made = np.bincount(pairs["Row"].to_numpy()[passed], minlength=len(order))
+    suffered = np.bincount(pairs["RowOther"].to_numpy()[passed], minlength=len(order))
+    return made, suffered
+
+
+def race_positions(laps):
+    """Running order of every driver on every lap (see the module comment).
+
+    One row per (race, driver, lap) with a known crossing time, sorted by
+    race, lap and position.
+    """
+    grid = laps[DRIVER_KEYS + ["GridPosition"]].drop_duplicates(DRIVER_KEYS) if "GridPosition" in laps else None
+    laps = complete_laps(laps).dropna(subset=["Time"]).reset_index(drop=True)
+    laps["Pitted"] = laps["PitInTime"].notna() | laps["PitOutTime"].notna()
+
+    # The one sort: every lap's cars in crossing order
+    order = laps.sort_values(LAP_KEYS + ["Time"])
+    by_lap = order.groupby(LAP_KEYS, observed=True, sort=False)["Time"]
+    laps["Position"] = (by_lap.cumcount() + 1).astype(np.int8)
+    laps["GapToLeader"] = (order["Time"] - by_lap.transform("first")).astype(np.float32)
+    laps["GapAhead"] = by_lap.diff().astype(np.float32)
+
+    # Back in driver/lap order: compare with the driver's previous lap,
+    # and lap 1 with the grid when the lap table has it
+    by_driver = laps.groupby(DRIVER_KEYS, observed=True, sort=False)
+    laps["PreviousPosition"] = by_driver["Position"].shift()
+    if grid is not None:
+        grid_position = laps[DRIVER_KEYS].merge(grid, on=DRIVER_KEYS, how="left")["GridPosition"].to_numpy()
+        laps["PreviousPosition"] = laps["PreviousPosition"].where(laps["LapNumber"] != 1, grid_position)
+    laps["PositionsGained"] = (laps["PreviousPosition"] - laps["Position"]).astype(np.float32)
+    previous_estimated = by_driver["Estimated"].shift(fill_value=False).astype(bool)
+    laps["Clean"] = ~laps["Pitted"] & ~laps["Estimated"] & ~previous_estimated
+
+    laps = laps.sort_values(LAP_KEYS + ["Position"], ignore_index=True)
+    made, suffered = _overtakes(laps)
+    laps["Overtakes"] = made.astype(np.int8)
+    laps["OvertakenBy"] = suffered.astype(np.int8)
+    return laps[POSITION_COLUMNS]
@@ -0,0 +1,148 @@
+# Prerendered reports
+#
+# The common views (each race's lap overlay, degradation and tyre strategy
+# with the pages' default selection, and each team's season pace) are
+# rendered ahead of time by scripts/prerender.py into
+#
+#     reports/season=YYYY/<analysis>/<name>.json   Plotly figure spec
+#     reports/season=YYYY/<analysis>/<name>.html   standalone page
+#     reports/season=YYYY/<analysis>/<name>.png    static image (optional)
+#
+# so they can be put behind a static file server. Each spec records the data
+# version, the renderer version (a content hash of the chart code) and the
+# selection it was built from in layout.meta; the dashboard only serves a
+# prerendered figure while all three still match, and builds it live
+# otherwise, so a change to a chart is never hidden behind an old report.
+import json
+import os
+
+import plotly.io as pio
+
+from f1 import analytics, charts, figures
+from f1.data import (
+    get_data_version, get_degradation_index, get_derived, get_race_index, get_races, get_results,
+)
+from f1.derived import code_version
+from f1.results import RESULT_TABLES
+from f1.store import BASE_DIR
+
+
+REPORTS_DIR = BASE_DIR / "reports"
+DEFAULT_DRIVERS = 2  # the pages preselect the first two drivers of a race
+RENDERER_MODULES = (charts, figures, analytics)  # the code a report's figure depends on besides the data
+RENDERER_VERSION = code_version(RENDERER_MODULES)
+
+
+def default_drivers(drivers):
+    return list(drivers[:DEFAULT_DRIVERS])
+
+
+# -------------------------------
+# Analyses: name -> (source, targets(season), build(season, name, selection))
+# -------------------------------
+def _race_targets(season):
+    return [
+        (race, default_drivers(get_race_index(season, race).drivers(race)))
+        for race in get_races(season)
+    ]
+
+
+def _team_targets(season):
+    return [(str(team), []) for team in get_derived(season, "team_pace_box")["Team"].unique()]
+
+
+def _result_race_targets(season):
+    return [(str(race), []) for race in sorted(get_results(season, "races")["Race_Name"].astype(str))]
+
+
+ANALYSES = {
+    "lap_overlay": (
+        "laps", _race_targets,
+        lambda season, race, drivers: charts.lap_overlay(get_race_index(season, race), race, drivers),
+    ),
+    "degradation": (
+        "laps", _race_targets,
+        lambda season, race, drivers: charts.degradation(get_degradation_index(season), race, drivers),
+    ),
+    "team_pace": (
+        "laps", _team_targets,
+        lambda season, team, _: charts.team_pace(
+            get_derived(season, "team_pace_box"), get_derived(season, "team_pace_outliers"), team,
+        ),
+    ),
+    "tyre_strategy": (
+        "results", _result_race_targets,
+        lambda season, race, _: charts.tyre_strategy(
+            {table: get_results(season, table) for table in RESULT_TABLES}, race,
+        ),
+    ),
+}
+
+
+def report_targets(season, analysis):
+    """[(name, selection)] to prerender for `analysis` in `season`."""
+    return ANALYSES[analysis][1](season)
+
+
+def report_version(season, analysis):
+    return get_data_version(season, ANALYSES[analysis][0])
+
+
+# -------------------------------
+# Files
+# -------------------------------
+def report_path(season, analysis, name, ext, root=REPORTS_DIR):
+    return root / f"season={season}" / analysis / f"{name.replace(' ', '_')}.{ext}"
+
+
+def _meta(version, selection):
+    return {"data_version": version, "renderer_version": RENDERER_VERSION, "selection": sorted(selection)}
+
+
+def _read_spec(path):
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+def is_current(season, analysis, name, selection, version, png=False, root=REPORTS_DIR):
+    spec = _read_spec(report_path(season, analysis, name, "json", root))
+    if spec is None or spec.get("layout", {}).get("meta") != _meta(version, selection):
+        return False
+    return not png or report_path(season, analysis, name, "png", root).exists()
+
+
+def _write_atomic(path, data):
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+
+
+def render_report(season, analysis, name, selection, version, png=False, root=REPORTS_DIR):
+    """Build one report and write its JSON, HTML and (optionally) PNG files."""
+    fig = ANALYSES[analysis][2](season, name, selection)
+    fig.update_layout(meta=_meta(version, selection))
+
+    json_path = report_path(season, analysis, name, "json", root)
+    json_path.parent.mkdir(parents=True, exist_ok=True)
+    _write_atomic(report_path(season, analysis, name, "html", root),
+                  fig.to_html(include_plotlyjs="cdn").encode("utf-8"))
+    # The spec marks the report as built for this version; a missing PNG is
+    # retried on the next --png run (see is_current)
+    _write_atomic(json_path, fig.to_json().encode("utf-8"))
+    if png:
+        _write_atomic(report_path(season, analysis, name, "png", root), fig.to_image(format="png"))
+
+
+# -------------------------------
+# Serving
+# -------------------------------
+def report_figure(season, analysis, name, selection=(), root=REPORTS_DIR):
+    """Prerendered figure for this selection, or None if missing or stale."""
+    spec = _read_spec(report_path(season, analysis, name, "json", root))
+    if spec is None:
+        return None
+    if spec.get("layout", {}).get("meta") != _meta(report_version(season, analysis), selection):
+        return None
+    return pio.from_json(json.dumps(spec))
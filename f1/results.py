@@ -0,0 +1,89 @@
+# Race results store
+#
+# f1_cleaned.csv has one row per driver stint and repeats every race-level
+# field (circuit, weather) and driver-level field (position, pit stops,
+# aggression scores) on each of a driver's stints. Here it is split into
+# three tables at their natural grain, linked by integer keys:
+#
+#   races    one row per race        RaceId = Season * 100 + Round
+#   results  one row per driver/race ResultId = RaceId * 100 + finishing position
+#   stints   one row per stint       ResultId, Stint
+#
+# stored per season as data/processed/results/season=YYYY/<table>.parquet.
+# Aggregations then run on the table they belong to: averaging pit stops
+# over results counts each driver once, not once per stint.
+import pandas as pd
+
+from f1.store import PROCESSED_DIR, write_partition
+
+
+RESULTS_CSV_PATH = PROCESSED_DIR / "f1_cleaned.csv"
+RESULTS_DIR = PROCESSED_DIR / "results"
+
+RACE_COLUMNS = [
+    "Season", "Round", "Race_Name", "Circuit",
+    "Air_Temp_C", "Track_Temp_C", "Humidity_percent", "Wind_Speed_KMH",
+]
+RESULT_COLUMNS = [
+    "Driver", "Abbreviation", "Constructor", "Laps", "Position", "TotalPitStops",
+    "AvgPitStopTime", "Lap_Time_Variation", "Total_Pit_Stops", "Tire_Usage_Aggression",
+    "Fast_Lap_Attempts", "Position_Changes", "Driver_Aggression_Score",
+]
+STINT_COLUMNS = ["Stint", "Tire_Compound", "Stint_Length", "Pit_Time"]
+RESULT_TABLES = ["races", "results", "stints"]
+
+
+def split_results(df):
+    """Split a stint-level results frame into (races, results, stints)."""
+    df = df.assign(
+        RaceId=(df["Season"] * 100 + df["Round"]).astype("int32"),
+        ResultId=(df["Season"] * 10000 + df["Round"] * 100 + df["Position"]).astype("int32"),
+    )
+
+    races = df.drop_duplicates("RaceId")[["RaceId"] + RACE_COLUMNS]
+    races = races.astype({
+        "Season": "int16", "Round": "int8", "Race_Name": "category", "Circuit": "category",
+    })
+
+    results = df.drop_duplicates("ResultId")[["ResultId", "RaceId"] + RESULT_COLUMNS]
+    results = results.astype({
+        "Driver": "category", "Abbreviation": "category", "Constructor": "category",
+        "Laps": "int16", "Position": "int8", "TotalPitStops": "int8",
+    })
+
+    # Pit_Time holds "Final Stint" on the last stint; stored as NaN instead
+    stints = df[["ResultId"] + STINT_COLUMNS].assign(
+        Stint=df["Stint"].astype("int8"),
+        Tire_Compound=df["Tire_Compound"].astype("category"),
+        Stint_Length=df["Stint_Length"].astype("int16"),
+        Pit_Time=pd.to_numeric(df["Pit_Time"], errors="coerce"),
+    )
+    return tuple(t.sort_values(t.columns[0], kind="stable", ignore_index=True) for t in (races, results, stints))
+
+
+def results_path(root, season, table):
+    return root / f"season={season}" / f"{table}.parquet"
+
+
+def result_files(root=RESULTS_DIR, season=None):
+    pattern = f"season={season}/*.parquet" if season is not None else "season=*/*.parquet"
+    return sorted(root.glob(pattern))
+
+
+def list_result_seasons(root=RESULTS_DIR):
+    return sorted(int(path.name.split("=", 1)[1]) for path in root.glob("season=*") if path.is_dir())
+
+
+def write_results(df, root=RESULTS_DIR):
+    """Split `df` and write the three tables for each of its seasons."""
+    for season, season_df in df.groupby("Season"):
+        for table, frame in zip(RESULT_TABLES, split_results(season_df)):
+            write_partition(frame.assign(**{
+                col: frame[col].cat.remove_unused_categories()
+                for col in frame.select_dtypes("category")
+            }), results_path(root, season, table))
+            yield season, table, len(frame)
+
+
+def read_results(season, table, root=RESULTS_DIR):
+    return pd.read_parquet(results_path(root, season, table))
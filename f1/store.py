@@ -0,0 +1,171 @@
+# Columnar lap store
+#
+# Processed laps are kept as Parquet with a fixed schema, one file per race:
+#
+#     data/processed/laps/season=2024/round=01/laps.parquet
+#
+#   - session timestamps (Time, PitOutTime, PitInTime) are float64 seconds;
+#     lap times (LapTimeSeconds) are float32, exact to well under 1 ms
+#   - repeated strings (Driver, Team, Race_Name, ...) are categoricals
+#   - lap counters are small integers (LapNumber int16, Stint int8, ...);
+#     TyreLife is float32 because FastF1 leaves it NaN for unknown sets
+#   - IsPersonalBest / FreshTyre / Deleted are real booleans
+#   - laps deleted by race control (track limits) are kept, flagged Deleted:
+#     their lap time doesn't count, but their crossing Time still orders
+#     the cars (f1.gaps, f1.positions). Lap-time views leave them out.
+#   - no redundant columns: the CSV's `index`, LapTime (= LapTimeSeconds)
+#     and Circuit (= Race_Name, both the event name) are not stored
+#
+# Reads go through a pyarrow dataset with hive partitioning, so season/round
+# filters prune whole files and only the requested columns are decoded.
+import os
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+
+
+# -------------------------------
+# Paths
+# -------------------------------
+BASE_DIR = Path(__file__).resolve().parent.parent
+PROCESSED_DIR = BASE_DIR / "data" / "processed"
+LAPS_CSV_PATH = PROCESSED_DIR / "laps_2024_cleaned.csv"
+LAPS_DIR = PROCESSED_DIR / "laps"  # season=YYYY/round=RR/laps.parquet partitions
+
+# -------------------------------
+# Schema
+# -------------------------------
+DURATION_COLUMNS = ["Time", "PitOutTime", "PitInTime"]
+
+LAP_SCHEMA = {
+    "Time": "float64",
+    "Driver": "category",
+    "DriverNumber": "int8",
+    "LapNumber": "int16",
+    "Stint": "int8",
+    "PitOutTime": "float64",
+    "PitInTime": "float64",
+    "IsPersonalBest": "bool",
+    "Compound": "category",
+    "TyreLife": "float32",
+    "FreshTyre": "bool",
+    "Team": "category",
+    "Season": "int16",
+    "Round": "int8",
+    "Race_Name": "category",
+    "Country": "category",
+    "LapTimeSeconds": "float32",
+    "Deleted": "bool",
+}
+
+# Partition keys live in the folder names, not in the files
+PARTITIONING = ds.partitioning(
+    pa.schema([("season", pa.int32()), ("round", pa.int32())]), flavor="hive"
+)
+
+
+def to_lap_schema(df):
+    """Coerce a cleaned lap frame to LAP_SCHEMA (column order and dtypes).
+
+    A frame without a Deleted column (cleaned CSVs, which dropped deleted
+    laps) has none.
+    """
+    if "Deleted" not in df.columns:
+        df = df.assign(Deleted=False)
+    missing = [col for col in LAP_SCHEMA if col not in df.columns]
+    if missing:
+        raise ValueError(f"Lap frame is missing columns: {missing}")
+
+    df = df[list(LAP_SCHEMA)].copy()
+    for col in DURATION_COLUMNS:
+        if not pd.api.types.is_float_dtype(df[col]):
+            df[col] = pd.to_timedelta(df[col]).dt.total_seconds()
+    for col in ["IsPersonalBest", "FreshTyre", "Deleted"]:
+        # NaN flags (e.g. FastF1 generated laps) count as False
+        df[col] = df[col].astype("boolean").fillna(False).astype(bool)
+    keys = ["Season", "Round", "Driver"]
+    if df["Stint"].isna().any():
+        # A lap with an unknown stint belongs to the stint of its neighbours
+        stint = df.groupby(keys, observed=True, sort=False)["Stint"]
+        df["Stint"] = stint.ffill().fillna(stint.bfill())
+    if df["Stint"].isna().any():
+        # Drivers FastF1 has no stints for at all: a new stint starts at
+        # every pit exit after the start
+        laps = df.sort_values(keys + ["LapNumber"])
+        pit_exit = (laps["PitOutTime"].notna() & (laps["LapNumber"] > 1)).astype("int8")
+        counted = pit_exit.groupby([laps[key] for key in keys], observed=True, sort=False).cumsum() + 1
+        df["Stint"] = df["Stint"].fillna(counted)
+    return df.astype(LAP_SCHEMA)
+
+
+def memory_bytes(df):
+    """Deep in-memory size of a frame (categories and strings included)."""
+    return int(df.memory_usage(deep=True, index=True).sum())
+
+
+# -------------------------------
+# Partition layout
+# -------------------------------
+def season_path(root, season):
+    return Path(root) / f"season={season}"
+
+
+def round_path(root, season, round_no):
+    return season_path(root, season) / f"round={round_no:02d}" / "laps.parquet"
+
+
+def partition_files(root=LAPS_DIR, season=None):
+    """Partition files under `root`, optionally for one season only."""
+    pattern = f"season={season}/round=*/laps.parquet" if season is not None else "season=*/round=*/laps.parquet"
+    return sorted(Path(root).glob(pattern))
+
+
+def list_seasons(root=LAPS_DIR):
+    return sorted(int(p.name.split("=")[1]) for p in Path(root).glob("season=*") if p.is_dir())
+
+
+# -------------------------------
+# Read / write
+# -------------------------------
+def write_partition(df, path):
+    # Write to a hidden temp file first so an interrupted write is never
+    # picked up as a partition (dataset discovery skips dot-files)
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    df.to_parquet(tmp_path, index=False)
+    os.replace(tmp_path, path)
+
+
+def write_laps(df, root=LAPS_DIR):
+    """Write a cleaned lap frame as one partition per (season, round)."""
+    df = to_lap_schema(df)
+    for (season, round_no), laps in df.groupby(["Season", "Round"]):
+        laps = laps.apply(lambda col: col.cat.remove_unused_categories() if col.dtype == "category" else col)
+        write_partition(laps, round_path(root, season, round_no))
+
+
+def read_laps(seasons=None, rounds=None, columns=None, root=LAPS_DIR):
+    """Load laps, reading only the requested partitions and columns.
+
+    `seasons` / `rounds` are pushed down to the dataset as partition filters,
+    so non-matching files are never opened. Partitions written before laps
+    were flagged Deleted read as having no deleted laps.
+    """
+    dataset = ds.dataset(root, format="parquet", partitioning=PARTITIONING)
+    columns = list(columns or LAP_SCHEMA)
+    stored = [col for col in columns if col != "Deleted" or col in dataset.schema.names]
+    predicate = None
+    if seasons is not None:
+        predicate = ds.field("season").isin(list(seasons))
+    if rounds is not None:
+        round_filter = ds.field("round").isin(list(rounds))
+        predicate = round_filter if predicate is None else predicate & round_filter
+    laps = dataset.to_table(columns=stored, filter=predicate).to_pandas()
+    if "Deleted" in columns:
+        # Missing in older partitions: no column, or nulls next to newer ones
+        flags = laps["Deleted"] if "Deleted" in laps else pd.Series(pd.NA, index=laps.index, dtype="boolean")
+        laps["Deleted"] = flags.astype("boolean").fillna(False).astype(bool)
+    return laps[columns]
@@ -0,0 +1,190 @@
+# Car telemetry store
+#
+# Per-lap car telemetry (speed, throttle, brake, ...) is kept as one flat
+# float32 array per race, memory-mapped on read:
+#
+#     data/processed/telemetry/season=2024/round=01/samples.npy   (samples × CHANNELS)
+#     data/processed/telemetry/season=2024/round=01/laps.parquet  offset index
+#
+# Samples are grouped by driver and lap, in lap order, and each sample
+# carries its Distance and Time from the start of its lap. The index has one
+# row per (Driver, LapNumber) with the Start/Stop rows of that lap in the
+# array, its LapTime and whether race control deleted it (track limits), so
+# reading a lap is a dict lookup plus a slice of the memory map: only the
+# pages of the requested laps are read from disk, never the whole race
+# (hundreds of MB at full rate).
+import os
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from f1.store import PROCESSED_DIR
+
+
+TELEMETRY_DIR = PROCESSED_DIR / "telemetry"
+SAMPLES_NAME = "samples.npy"
+INDEX_NAME = "laps.parquet"
+
+CHANNELS = ["Distance", "Time", "Speed", "Throttle", "Brake", "RPM", "nGear", "DRS"]
+CAR_CHANNELS = ["Speed", "Throttle", "Brake", "RPM", "nGear", "DRS"]  # as in FastF1 car_data
+
+
+# -------------------------------
+# Layout
+# -------------------------------
+def telemetry_path(root, season, round_no):
+    return Path(root) / f"season={season}" / f"round={round_no:02d}"
+
+
+def telemetry_files(root, season, round_no):
+    """Index and samples file of one race, [] if it has no telemetry."""
+    directory = telemetry_path(root, season, round_no)
+    files = [directory / INDEX_NAME, directory / SAMPLES_NAME]
+    return files if all(path.exists() for path in files) else []
+
+
+# -------------------------------
+# Extraction from a FastF1 session
+# -------------------------------
+def _seconds(values):
+    return pd.to_timedelta(values).dt.total_seconds().to_numpy()
+
+
+def lap_telemetry(car_data, laps):
+    """Cut a session's car data into laps.
+
+    `car_data` is FastF1's {driver number: car telemetry} (SessionTime plus
+    CAR_CHANNELS), `laps` the session laps (Driver, DriverNumber, LapNumber,
+    LapStartTime, Time and, when FastF1 has it, Deleted). Each driver's samples are assigned to laps with one
+    searchsorted over the lap boundaries; Distance is speed integrated over
+    time from the start of each lap.
+    Returns (samples, index) as written by write_telemetry.
+    """
+    blocks, rows = [], []
+    offset = 0
+    for number, car in car_data.items():
+        driver_laps = laps[
+            (laps["DriverNumber"].astype(str) == str(number))
+            & laps["LapStartTime"].notna() & laps["Time"].notna()
+        ].sort_values("LapNumber")
+        if driver_laps.empty or car.empty:
+            continue
+
+        session_time = _seconds(car["SessionTime"])
+        lap_start = _seconds(driver_laps["LapStartTime"])
+        lap_end = _seconds(driver_laps["Time"])
+        first = np.searchsorted(session_time, lap_start)
+        sizes = np.searchsorted(session_time, lap_end) - first
+        has_samples = sizes > 0
+        if not has_samples.any():
+            continue
+        driver_laps = driver_laps[has_samples]
+        lap_start, lap_end = lap_start[has_samples], lap_end[has_samples]
+        first, sizes = first[has_samples], sizes[has_samples]
+
+        # Row of every sample of every lap, laps back to back
+        lap_of = np.repeat(np.arange(len(sizes)), sizes)
+        lap_offsets = np.concatenate(([0], np.cumsum(sizes)[:-1]))
+        take = first[lap_of] + np.arange(sizes.sum()) - lap_offsets[lap_of]
+
+        time = session_time[take] - lap_start[lap_of]
+        speed = car["Speed"].to_numpy(dtype=np.float64)[take]
+        dt = np.diff(time, prepend=0.0)
+        dt[lap_offsets] = time[lap_offsets]  # first sample: since lap start
+        step = speed / 3.6 * dt
+        distance = np.cumsum(step)
+        distance -= np.repeat(distance[lap_offsets] - step[lap_offsets], sizes)
+
+        block = np.empty((len(take), len(CHANNELS)), dtype=np.float32)
+        block[:, 0] = distance
+        block[:, 1] = time
+        for i, channel in enumerate(CAR_CHANNELS, start=2):
+            block[:, i] = car[channel].to_numpy(dtype=np.float64)[take]
+        blocks.append(block)
+
+        starts = offset + lap_offsets
+        rows.append(pd.DataFrame({
+            "Driver": driver_laps["Driver"].astype(str).to_numpy(),
+            "LapNumber": driver_laps["LapNumber"].to_numpy(dtype=np.int16),
+            "Start": starts,
+            "Stop": starts + sizes,
+            "LapTime": lap_end - lap_start,
+            "Deleted": (
+                driver_laps["Deleted"].astype("boolean").fillna(False).to_numpy(dtype=bool)
+                if "Deleted" in driver_laps else False
+            ),
+        }))
+        offset += len(take)
+
+    if not blocks:
+        return np.empty((0, len(CHANNELS)), dtype=np.float32), pd.DataFrame(
+            columns=["Driver", "LapNumber", "Start", "Stop", "LapTime", "Deleted"]
+        )
+    index = pd.concat(rows, ignore_index=True).astype({"Driver": "category", "Start": "int64", "Stop": "int64"})
+    return np.concatenate(blocks), index
+
+
+# -------------------------------
+# Read / write
+# -------------------------------
+def write_telemetry(samples, index, directory):
+    """Write one race's samples and offset index (the index last: it marks the race complete)."""
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    for name, write in [
+        (SAMPLES_NAME, lambda path: np.save(path, np.ascontiguousarray(samples, dtype=np.float32))),
+        (INDEX_NAME, lambda path: index.to_parquet(path, index=False)),
+    ]:
+        tmp_path = directory / f".{name}.tmp"
+        with open(tmp_path, "wb") as f:
+            write(f)
+        os.replace(tmp_path, directory / name)
+
+
+class TelemetryStore:
+    """Memory-mapped telemetry of one race."""
+
+    def __init__(self, directory):
+        directory = Path(directory)
+        self.laps = pd.read_parquet(directory / INDEX_NAME)
+        self._samples = np.load(directory / SAMPLES_NAME, mmap_mode="r")
+        stat = (directory / SAMPLES_NAME).stat()
+        self.version = f"{stat.st_mtime_ns:x}-{stat.st_size:x}"  # for figure cache keys
+        self._offsets = {
+            (driver, lap): (start, stop)
+            for driver, lap, start, stop in zip(
+                self.laps["Driver"].astype(str), self.laps["LapNumber"].tolist(),
+                self.laps["Start"].tolist(), self.laps["Stop"].tolist(),
+            )
+        }
+
+    def drivers(self):
+        return sorted(self.laps["Driver"].astype(str).unique())
+
+    def lap(self, driver, lap_number):
+        """Telemetry of one lap (CHANNELS columns), read from its slice of the array only."""
+        start, stop = self._offsets[(driver, int(lap_number))]
+        return pd.DataFrame(np.array(self._samples[start:stop]), columns=CHANNELS)
+
+    def fastest_lap(self, driver):
+        """Lap number of the driver's fastest lap with telemetry, deleted laps excluded.
+
+        None when the driver has no timed lap left (e.g. all were deleted).
+        """
+        laps = self.laps[(self.laps["Driver"] == driver) & self.laps["LapTime"].notna()]
+        if "Deleted" in laps:  # not recorded by stores written before it was
+            laps = laps[~laps["Deleted"]]
+        if laps.empty:
+            return None
+        return int(laps.loc[laps["LapTime"].idxmin(), "LapNumber"])
+
+
+def lap_delta(reference, other):
+    """Time gap of `other` to `reference` along the reference lap's distance.
+
+    Positive when `other` is behind at that point of the lap.
+    """
+    distance = reference["Distance"].to_numpy()
+    other_time = np.interp(distance, other["Distance"].to_numpy(), other["Time"].to_numpy())
+    return pd.DataFrame({"Distance": distance, "Delta": other_time - reference["Time"].to_numpy()})
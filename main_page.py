@@ -1,15 +1,14 @@
 # main_page.py
 import streamlit as st
-from PIL import Image
-import os
-from pathlib import Path
+
+from f1.assets import asset_image
 
 
 # -------------------------------
 # Page config
 # -------------------------------
 st.set_page_config(
-    page_title="F1 2024 Analysis Hub",
+    page_title="F1 Analysis Hub",
     layout="wide"
 )
 
@@ -46,18 +45,17 @@ st.markdown("""
 # -------------------------------
 # F1 Logo
 # -------------------------------
-logo_path = "assets/F1.svg.png"
-if os.path.exists(logo_path):
-    logo = Image.open(logo_path)
+logo = asset_image("F1.svg.png", width=600)
+if logo is not None:
     st.image(logo, width=600)
 
 # -------------------------------
 # Welcome text
 # -------------------------------
 st.markdown("""
-# Welcome to the F1 2024 Analysis Hub
+# Welcome to the F1 Analysis Hub
 Explore detailed Formula 1 race analytics including driver lap times, tire strategies, team pace, and tire degradation.
-This dashboard allows you to dive deep into performance trends, tire management, and comparative analysis for the 2024 season.
+This dashboard allows you to dive deep into performance trends, tire management, and comparative analysis season by season.
 """)
 
 st.markdown("---")
@@ -69,27 +67,27 @@ analyses = [
     {
         "title": "Tire Strategies per Race",
         "description": "Visualize each driver’s tire stints during a race and how they managed their tire usage.",
-        "image": "assets/Strategie.jpg"
+        "image": "Strategie.jpg"
     },
     {
         "title": "Lap Times Overlay",
         "description": "Compare multiple drivers’ lap times across a single race with pit stop markers and tire compounds.",
-        "image": "assets/laptimes.jpg"
+        "image": "laptimes.jpg"
     },
     {
         "title": "Tire Degradation",
         "description": "Analyze lap time progression to understand tire wear patterns for drivers.",
-        "image": "assets/Tire_deg.jpg"
+        "image": "Tire_deg.jpg"
     },
     {
         "title": "Team Pace Comparison",
         "description": "Compare median lap times of all F1 teams across the season.",
-        "image": "assets/team_pace.jpg"
+        "image": "team_pace.jpg"
     },
     {
         "title": "Driver Lap Times Comparison",
         "description": "Compare selected drivers’ lap times in detail.",
-        "image": "assets/driverlap.jpg"
+        "image": "driverlap.jpg"
     }
 ]
 
@@ -102,12 +100,12 @@ for i in range(0, len(analyses), num_cols):
     for j, analysis in enumerate(analyses[i:i+num_cols]):
         with cols[j]:
             # Display image
-            if os.path.exists(analysis["image"]):
-                img = Image.open(analysis["image"])
-                st.image(img, width=500)  # <-- Modify width here
+            img = asset_image(analysis["image"], width=500)
+            if img is not None:
+                st.image(img, width=500)  # <-- Modify width here (see f1/assets.py THUMB_WIDTHS)
             # Title & description
             st.markdown(f"### {analysis['title']}")
             st.markdown(analysis["description"])
 
 st.markdown("---")
-st.markdown("Enjoy exploring the 2024 F1 season analytics with interactive plots and insightful visualizations!")
+st.markdown("Enjoy exploring the F1 season analytics with interactive plots and insightful visualizations!")
@@ -1,63 +1,62 @@
 # pages/team_pace_race.py
 import streamlit as st
-import pandas as pd
-from pathlib import Path
-import plotly.express as px
 
-# -----------------------
-# Paths
-# -----------------------
-BASE_DIR = Path(__file__).resolve().parent.parent
-DATA_PATH = BASE_DIR / "data" / "processed" / "laps_2024_cleaned.csv"
-
-# -----------------------
-# Load dataset
-# -----------------------
-@st.cache_data
-def load_data():
-    return pd.read_csv(DATA_PATH)
-
-df = load_data()
+from f1 import charts
+from f1.analytics import personal_best_laps
+from f1.data import (
+    get_data_version, get_derived, get_race_index, get_races, get_seasons, protect_shared_tables,
+)
+from f1.export import RENDER_TIMEOUT, cached_image, render_image
+from f1.figures import cached_figure, decimation_note, figure_key
+from f1.metrics import dev_overlay, start_run
 
 # -----------------------
 # Streamlit layout
 # -----------------------
+protect_shared_tables()  # copy-on-write for the cached frames, see f1/data.py
+run = start_run("pace_comp")  # phase timings, see f1/metrics.py
 st.title("Team Pace Comparison per Race")
 
-# Select race
-races = df["Race_Name"].unique()
-selected_race = st.selectbox("Select a race", sorted(races))
-
-# Filter dataset
-race_df = df[df["Race_Name"] == selected_race].copy()
-race_df = race_df[race_df["IsPersonalBest"] == True]
-
-# Order teams by median lap time
-team_order = race_df.groupby("Team")["LapTimeSeconds"].median().sort_values().index
-
-# Plot interactive boxplot
-fig = px.box(
-    race_df,
-    x="Team",
-    y="LapTimeSeconds",
-    color="Team",
-    category_orders={"Team": team_order},
-    title=f"{selected_race} – Team Pace Comparison",
-    points="all",  # show individual laps as points
-)
+# Select season and race
+seasons = get_seasons()
+selected_season = st.selectbox("Select a season", seasons, index=len(seasons) - 1)
+selected_race = st.selectbox("Select a race", get_races(selected_season))
+run.tag(season=selected_season, race=selected_race)
 
-fig.update_layout(
-    xaxis_title=None,
-    yaxis_title="Lap Time (s)",
-    showlegend=False,
-    template="plotly_white",
-)
+# Filter dataset (reads this race's partition only)
+with run.span("load"):
+    index = get_race_index(selected_season, selected_race)
+    box_stats = get_derived(selected_season, "team_pace_box")  # precomputed boxes
+with run.span("filter"):
+    race_df = personal_best_laps(index.race(selected_race))
 
-st.plotly_chart(fig, use_container_width=True)
+# Interactive boxplot, fastest median lap first, individual laps as points
+key = figure_key("pace_comp", selected_season, selected_race, [], get_data_version(selected_season))
+with run.span("figure"):
+    fig = cached_figure(key, lambda: charts.race_pace(box_stats, race_df, selected_race))
 
-# Optional: add a download button
-st.download_button(
-    label="Download plot as PNG",
-    data=fig.to_image(format="png"),
-    file_name=f"{selected_race}_team_pace.png",
-)
+st.plotly_chart(fig, use_container_width=True)
+note = decimation_note(fig)
+if note:
+    st.caption(note)
+
+# Optional: export the plot. Images are rendered only when asked for, on a
+# shared background renderer, and reused across sessions.
+export_format = st.radio("Export format", ["png", "svg"], horizontal=True)
+image = cached_image(key, export_format)  # keyed like the figure, no re-serialising
+if image is None and st.button(f"Prepare {export_format.upper()} download"):
+    try:
+        with st.spinner("Rendering image..."), run.span("export"):
+            image = render_image(key, fig, export_format).result(timeout=RENDER_TIMEOUT)
+    except Exception as e:
+        st.error(f"Image export failed: {e}")
+
+if image is not None:
+    st.download_button(
+        label=f"Download plot as {export_format.upper()}",
+        data=image,
+        file_name=f"{selected_race}_team_pace.{export_format}",
+    )
+
+run.finish()
+dev_overlay(run)
@@ -1,108 +1,87 @@
 # Tire_Usage_Interactive_Improved_Theme.py
 import streamlit as st
-import pandas as pd
 import plotly.express as px
-import os
-from pathlib import Path
+import plotly.graph_objects as go
+
+from f1 import charts
+from f1.analytics import COMPOUND_COLORS, DEFAULT_COLOR, correlation_matrix, race_results
+from f1.assets import asset_image
+from f1.data import get_derived, get_result_seasons, get_results, protect_shared_tables
+from f1.metrics import dev_overlay, start_run
+from f1.reports import report_figure
+from f1.results import RESULT_TABLES
 
 
 # -------------------------------
 # Page setup
 # -------------------------------
+protect_shared_tables()  # copy-on-write for the cached frames, see f1/data.py
 st.set_page_config(
     page_title="F1 Tire Strategies",
     layout="wide"
 )
+run = start_run("tire_usage")  # phase timings, see f1/metrics.py
 st.title("🏁 F1 Tire Strategies & Pit Analysis")
 
 # -------------------------------
-# Load dataset
+# Sidebar: Season & race selection
 # -------------------------------
-from pathlib import Path
-
-BASE_DIR = Path(__file__).resolve().parent.parent  # C:\F1_analysis
-DATA_PATH = BASE_DIR / "data" / "processed" / "f1_cleaned.csv"
-IMG_DIR = BASE_DIR / "assets" / "drivers"
-
-df = pd.read_csv(DATA_PATH)
+seasons = get_result_seasons()
+selected_season = st.sidebar.selectbox("Select Season", seasons, index=len(seasons) - 1)
 
 # -------------------------------
-# Sidebar: Race selection
+# Load dataset (race, driver-result and stint tables, see f1/results.py)
 # -------------------------------
-races = df["Race_Name"].unique()
-selected_race = st.sidebar.selectbox("Select Race", sorted(races))
-race_df = df[df["Race_Name"] == selected_race]
+with run.span("load"):
+    tables = {table: get_results(selected_season, table) for table in RESULT_TABLES}
+
+selected_race = st.sidebar.selectbox("Select Race", sorted(tables["races"]["Race_Name"].astype(str)))
+run.tag(season=selected_season, race=selected_race)
 
 # -------------------------------
 # Drivers in this race (use Abbreviation for images)
 # -------------------------------
-drivers = race_df["Abbreviation"].unique()
+with run.span("filter"):
+    drivers = race_results(tables, selected_race)["Abbreviation"].astype(str).tolist()
 
 # -------------------------------
 # Show driver images neatly
 # -------------------------------
 st.subheader("Drivers")
 cols = st.columns(len(drivers))
-for i, driver in enumerate(drivers):
-    img_path = IMG_DIR / f"{driver}.png"
-    if os.path.exists(img_path):
-        cols[i].image(img_path, width=120, caption=driver)
-    else:
-        cols[i].write(driver)
+with run.span("images"):
+    for i, driver in enumerate(drivers):
+        img = asset_image(f"drivers/{driver}.png", width=120)
+        if img is not None:
+            cols[i].image(img, width=120, caption=driver)
+        else:
+            cols[i].write(driver)
 
 # -------------------------------
 # Tire Strategy Plot (stacked horizontal bars)
 # -------------------------------
-compound_colors = {
-    "SOFT": "#FF073A",        # Neon red
-    "MEDIUM": "#FFD700",      # Neon yellow
-    "HARD": "#FFFFFF",        # White
-    "INTERMEDIATE": "#00FF00",# Neon green
-    "WET": "#00BFFF"          # Neon blue
-}
-
-# Create stints summary
-stints = race_df[["Abbreviation", "Stint", "Tire_Compound", "Stint_Length"]]
-stints_summary = stints.groupby(["Abbreviation", "Stint", "Tire_Compound"]).sum().reset_index()
-
-fig_tire = px.bar(
-    stints_summary,
-    x="Stint_Length",
-    y="Abbreviation",
-    color="Tire_Compound",
-    orientation='h',
-    text="Stint_Length",
-    color_discrete_map=compound_colors,
-    hover_data=["Tire_Compound", "Stint_Length"],
-    template="plotly_dark"
-)
-
-fig_tire.update_layout(
-    title=f"Tire Strategies – {selected_race}",
-    xaxis_title="Lap Number",
-    yaxis_title="Driver",
-    yaxis={'categoryorder':'total ascending'},
-    barmode='stack',
-    plot_bgcolor="#111111",
-    paper_bgcolor="#111111",
-    font=dict(color="#FFFFFF"),
-    height=600
-)
+# Prerendered per race (scripts/prerender.py), else built live
+with run.span("figure"):
+    fig_tire = (
+        report_figure(selected_season, "tyre_strategy", selected_race)
+        or charts.tyre_strategy(tables, selected_race)
+    )
 
 st.plotly_chart(fig_tire, use_container_width=True)
 
 # -------------------------------
 # Average Total Pit Stops per Circuit (Plotly version)
 # -------------------------------
-st.subheader("Average Pit Stops per Circuit – 2024 Season")
-pit_stops_per_circuit = df.groupby("Circuit")["TotalPitStops"].mean().sort_values().reset_index()
+st.subheader(f"Average Pit Stops per Circuit – {selected_season} Season")
+# Precomputed per data version (see f1/aggregates.py)
+pit_stops_per_circuit = get_derived(selected_season, "pit_stops_per_circuit")
 
 fig_pit = px.bar(
     pit_stops_per_circuit,
     x="Circuit",
-    y="TotalPitStops",
-    text="TotalPitStops",
-    color="TotalPitStops",
+    y="AvgPitStops",
+    text="AvgPitStops",
+    color="AvgPitStops",
     color_continuous_scale=px.colors.sequential.Reds,
     template="plotly_dark"
 )
@@ -123,8 +102,9 @@ st.plotly_chart(fig_pit, use_container_width=True)
 # Correlation Matrix – Air Temp, Track Temp & Total Pit Stops (Plotly version)
 # -------------------------------
 st.subheader("Correlation Matrix – Air Temp, Track Temp & Total Pit Stops")
-corr_df = df[["Air_Temp_C", "Track_Temp_C", "TotalPitStops"]]
-corr_matrix = corr_df.corr().round(2)
+# Race weather vs each race's average pit stops, precomputed per data version
+corr_columns = ["Air_Temp_C", "Track_Temp_C", "TotalPitStops"]
+corr_matrix = correlation_matrix(get_derived(selected_season, "weather_correlation"), corr_columns).round(2)
 
 fig_corr = px.imshow(
     corr_matrix,
@@ -141,3 +121,35 @@ fig_corr.update_layout(
 )
 
 st.plotly_chart(fig_corr, use_container_width=True)
+
+# -------------------------------
+# Stint Length per Compound (precomputed distribution)
+# -------------------------------
+st.subheader(f"Stint Length per Compound – {selected_season} Season")
+stint_lengths = get_derived(selected_season, "compound_stint_lengths")
+
+fig_stints = go.Figure()
+for row in stint_lengths.itertuples():
+    fig_stints.add_trace(go.Box(
+        x=[row.Tire_Compound],
+        q1=[row.Q1], median=[row.Median], q3=[row.Q3],
+        lowerfence=[row.Min], upperfence=[row.Max], mean=[row.Mean],
+        name=f"{row.Tire_Compound} ({row.Stints} stints)",
+        fillcolor=COMPOUND_COLORS.get(row.Tire_Compound, DEFAULT_COLOR),
+        line=dict(color="#888888"),
+    ))
+
+fig_stints.update_layout(
+    xaxis_title="Compound",
+    yaxis_title="Stint Length (laps)",
+    template="plotly_dark",
+    plot_bgcolor="#111111",
+    paper_bgcolor="#111111",
+    font=dict(color="#FFFFFF"),
+    height=450
+)
+
+st.plotly_chart(fig_stints, use_container_width=True)
+
+run.finish()
+dev_overlay(run)
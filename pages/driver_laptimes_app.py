@@ -1,109 +1,84 @@
 # C:\F1_analysis\streamlit_analysis\driver_lap_times_app.py
 
 import streamlit as st
-import pandas as pd
 import plotly.express as px
-import os
-from PIL import Image
-from pathlib import Path
 
-
-# -----------------------
-# Load Data
-# -----------------------
-BASE_DIR = Path(__file__).resolve().parent.parent  # assumes this script is in a subfolder like 'pages'
-
-# -----------------------
-# Path to the dataset
-# -----------------------
-DATA_PATH = BASE_DIR / "data" / "processed" / "laps_2024_cleaned.csv"
-df = pd.read_csv(DATA_PATH)
-
-# -----------------------
-# Paths to images
-# -----------------------
-DRIVER_IMAGES_PATH = BASE_DIR / "assets" / "drivers"
-CAR_IMAGES_PATH = BASE_DIR / "assets" / "teams"
+from f1.analytics import COMPOUND_COLORS
+from f1.assets import asset_image
+from f1.data import get_race_index, get_races, get_seasons, protect_shared_tables
+from f1.metrics import dev_overlay, start_run
 
 
 # -----------------------
 # Page setup
 # -----------------------
-st.set_page_config(page_title="F1 2024 Driver Lap Times", layout="wide")
-st.title("🏎️ F1 2024 Driver Lap Times Analysis")
+protect_shared_tables()  # copy-on-write for the cached frames, see f1/data.py
+st.set_page_config(page_title="F1 Driver Lap Times", layout="wide")
+run = start_run("driver_laptimes")  # phase timings, see f1/metrics.py
 
 # -----------------------
 # Sidebar filters
 # -----------------------
 st.sidebar.header("Filters")
 
-selected_race = st.sidebar.selectbox("Select Race", df["Race_Name"].unique())
-race_df = df[df["Race_Name"] == selected_race]
+seasons = get_seasons()
+selected_season = st.sidebar.selectbox("Select Season", seasons, index=len(seasons) - 1)
+selected_race = st.sidebar.selectbox("Select Race", get_races(selected_season))
+run.tag(season=selected_season, race=selected_race)
+with run.span("load"):
+    index = get_race_index(selected_season, selected_race)  # reads this race's partition only
+selected_driver = st.sidebar.selectbox("Select Driver", index.drivers(selected_race))
 
-selected_driver = st.sidebar.selectbox("Select Driver", sorted(race_df["Driver"].unique()))
+st.title(f"🏎️ F1 {selected_season} Driver Lap Times Analysis")
 
 # -----------------------
 # Display driver + car images using columns
 # -----------------------
-driver_img_file = os.path.join(DRIVER_IMAGES_PATH, f"{selected_driver}.png")
-team_name = race_df[race_df["Driver"] == selected_driver]["Team"].iloc[0]
-car_img_file = os.path.join(CAR_IMAGES_PATH, f"{team_name}.png")
+with run.span("filter"):
+    driver_laps = index.driver(selected_race, selected_driver)
+team_name = driver_laps["Team"].iloc[0]
 
 col1, col2 = st.columns([1, 4])
 
-with col1:
-    if os.path.exists(driver_img_file):
-        driver_img = Image.open(driver_img_file)
-        st.image(driver_img, width=150)
-
-with col2:
-    if os.path.exists(car_img_file):
-        car_img = Image.open(car_img_file)
-        st.image(car_img, width=600)
-
-# -----------------------
-# Filter driver laps
-# -----------------------
-driver_laps = race_df[race_df["Driver"] == selected_driver].sort_values("LapNumber").reset_index()
+with run.span("images"):
+    with col1:
+        driver_img = asset_image(f"drivers/{selected_driver}.png", width=150)
+        if driver_img is not None:
+            st.image(driver_img, width=150)
 
-# -----------------------
-# Tyre color mapping
-# -----------------------
-COMPOUND_COLORS = {
-    "SOFT": "#FF3333",
-    "MEDIUM": "#FFD700",
-    "HARD": "#E6E6E6",
-    "INTERMEDIATE": "#39B54A",
-    "WET": "#1E90FF"
-}
+    with col2:
+        car_img = asset_image(f"teams/{team_name}.png", width=600)
+        if car_img is not None:
+            st.image(car_img, width=600)
 
 # -----------------------
 # Plotly scatter plot
 # -----------------------
-fig = px.scatter(
-    driver_laps,
-    x="LapNumber",
-    y="LapTimeSeconds",
-    color="Compound",
-    color_discrete_map=COMPOUND_COLORS,
-    hover_data={
-        "LapNumber": True,
-        "LapTimeSeconds": True,
-        "Compound": True,
-        "PitInTime": True
-    },
-    title=f"{selected_driver} – {selected_race}",
-    height=600
-)
-
-fig.update_yaxes(autorange="reversed", title="Lap Time (s)")
-fig.update_xaxes(title="Lap Number")
-fig.update_layout(
-    plot_bgcolor="#111111",
-    paper_bgcolor="#111111",
-    font_color="#FFFFFF",
-    legend_title_text="Tyre Compound"
-)
+with run.span("figure"):
+    fig = px.scatter(
+        driver_laps,
+        x="LapNumber",
+        y="LapTimeSeconds",
+        color="Compound",
+        color_discrete_map=COMPOUND_COLORS,
+        hover_data={
+            "LapNumber": True,
+            "LapTimeSeconds": True,
+            "Compound": True,
+            "PitInTime": True
+        },
+        title=f"{selected_driver} – {selected_race}",
+        height=600
+    )
+
+    fig.update_yaxes(autorange="reversed", title="Lap Time (s)")
+    fig.update_xaxes(title="Lap Number")
+    fig.update_layout(
+        plot_bgcolor="#111111",
+        paper_bgcolor="#111111",
+        font_color="#FFFFFF",
+        legend_title_text="Tyre Compound"
+    )
 
 st.plotly_chart(fig, use_container_width=True)
 
@@ -112,3 +87,6 @@ st.plotly_chart(fig, use_container_width=True)
 # -----------------------
 if st.checkbox("Show raw lap data"):
     st.dataframe(driver_laps)
+
+run.finish()
+dev_overlay(run)
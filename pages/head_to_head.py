@@ -0,0 +1,91 @@
+# head_to_head_app.py
+import streamlit as st
+
+from f1 import charts
+from f1.data import (
+    get_data_version, get_race_gaps, get_race_index, get_races, get_seasons, protect_shared_tables,
+)
+from f1.figures import cached_figure
+from f1.gaps import CLOSE_GAP
+from f1.metrics import dev_overlay, start_run
+
+
+# -------------------------------
+# Page setup
+# -------------------------------
+protect_shared_tables()  # copy-on-write for the cached frames, see f1/data.py
+st.set_page_config(page_title="F1 Head to Head", layout="wide")
+run = start_run("head_to_head")  # phase timings, see f1/metrics.py
+
+# -------------------------------
+# Sidebar filters
+# -------------------------------
+seasons = get_seasons()
+selected_season = st.sidebar.selectbox("Select Season", seasons, index=len(seasons) - 1)
+selected_race = st.sidebar.selectbox("Select Race", get_races(selected_season))
+run.tag(season=selected_season, race=selected_race)
+
+st.title(f"🤝 F1 {selected_season} Head to Head – {selected_race}")
+
+with run.span("load"):
+    index = get_race_index(selected_season, selected_race)
+    gaps = get_race_gaps(selected_season, selected_race)  # every pair and lap, computed once per race
+version = get_data_version(selected_season)
+
+with run.span("aggregate"):
+    pairs = gaps.closest_pairs()
+
+# Closest pair of the race by default
+drivers = gaps.drivers
+default = pairs.iloc[0] if not pairs.empty else None
+driver = st.sidebar.selectbox(
+    "Driver", drivers, index=drivers.index(default["Driver"]) if default is not None else 0
+)
+rivals = [name for name in drivers if name != driver]
+rival = st.sidebar.selectbox(
+    "Rival", rivals,
+    index=rivals.index(default["Rival"]) if default is not None and default["Rival"] in rivals else 0,
+)
+
+# -------------------------------
+# Gap of the selected pair, lap by lap
+# -------------------------------
+with run.span("filter"):
+    pair = gaps.pair(driver, rival)
+
+if pair.empty:
+    st.warning(f"{driver} and {rival} never completed a lap at the same time.")
+else:
+    cols = st.columns(3)
+    cols[0].metric(f"Gap on lap {pair['LapNumber'].iloc[-1]}", f"{pair['Gap'].iloc[-1]:+.3f}s")
+    cols[1].metric("Mean gap", f"{pair['Gap'].abs().mean():.3f}s")
+    cols[2].metric(f"Laps within {CLOSE_GAP:g}s", int((pair["Gap"].abs() <= CLOSE_GAP).sum()))
+
+    key = ("head_to_head", selected_season, selected_race, driver, rival, version)
+    with run.span("figure"):
+        fig = cached_figure(key, lambda: charts.head_to_head(gaps, index, selected_race, driver, rival))
+    st.plotly_chart(fig, use_container_width=True)
+    st.caption(
+        "Gaps come from the session time at which each driver finished every lap. "
+        "Hollow markers are laps without a recorded time, interpolated from the laps around them."
+    )
+
+# -------------------------------
+# Who was closest to whom
+# -------------------------------
+st.subheader("Who Was Closest to Whom")
+with run.span("figure"):
+    fig_closeness = cached_figure(
+        ("closeness", selected_season, selected_race, version),
+        lambda: charts.closeness(gaps, selected_race),
+    )
+st.plotly_chart(fig_closeness, use_container_width=True)
+
+cols = st.columns(2)
+cols[0].markdown("**Closest pairs**")
+cols[0].dataframe(pairs.head(10).round({"MeanGap": 3}), hide_index=True)
+cols[1].markdown("**Nearest rival of each driver**")
+cols[1].dataframe(gaps.nearest_rivals().round({"MeanGap": 3}), hide_index=True)
+
+run.finish()
+dev_overlay(run)
@@ -0,0 +1,70 @@
+# race_trace_app.py
+import streamlit as st
+
+from f1 import charts
+from f1.analytics import race_order_summary
+from f1.data import get_data_version, get_positions_index, get_seasons, protect_shared_tables
+from f1.figures import cached_figure, decimation_note, figure_key
+from f1.metrics import dev_overlay, start_run
+
+
+# -------------------------------
+# Page setup
+# -------------------------------
+protect_shared_tables()  # copy-on-write for the cached frames, see f1/data.py
+st.set_page_config(page_title="F1 Race Trace", layout="wide")
+run = start_run("race_trace")  # phase timings, see f1/metrics.py
+
+# -------------------------------
+# Sidebar filters
+# -------------------------------
+seasons = get_seasons()
+selected_season = st.sidebar.selectbox("Select Season", seasons, index=len(seasons) - 1)
+with run.span("load"):
+    index = get_positions_index(selected_season)  # running order per lap, see f1/positions.py
+selected_race = st.sidebar.selectbox("Select Race", index.races)
+run.tag(season=selected_season, race=selected_race)
+
+st.title(f"📈 F1 {selected_season} Race Trace – {selected_race}")
+
+with run.span("aggregate"):
+    summary = race_order_summary(index.race(selected_race))
+
+drivers_selected = st.sidebar.multiselect(
+    "Select Drivers",
+    index.drivers(selected_race),
+    default=list(summary["Driver"].head(10)),
+)
+value = st.sidebar.radio("Show", ["Position", "Gap to leader"], horizontal=True)
+column = "Position" if value == "Position" else "GapToLeader"
+
+# -------------------------------
+# Race trace
+# -------------------------------
+if not drivers_selected:
+    st.warning("Please select at least one driver.")
+else:
+    key = figure_key(f"race_trace_{column}", selected_season, selected_race, drivers_selected,
+                     get_data_version(selected_season))
+    with run.span("figure"):
+        fig = cached_figure(key, lambda: charts.race_trace(index, selected_race, drivers_selected, column))
+    st.plotly_chart(fig, use_container_width=True)
+    note = decimation_note(fig)
+    if note:
+        st.caption(note)
+
+# -------------------------------
+# Positions and overtakes
+# -------------------------------
+st.subheader("Positions and Overtakes")
+st.dataframe(summary, hide_index=True, use_container_width=True)
+st.caption(
+    "Order at the end of every lap, from the time each driver crossed the line. "
+    "Overtakes count on-track passes only: swaps on laps where either car was in the pits "
+    "are left out. Start is the position after lap 1: the lap data has no grid, so "
+    "opening-lap places and passes aren't counted. Incomplete drivers' laps stop before "
+    "the flag: they retired, or their last laps are missing from the timing data."
+)
+
+run.finish()
+dev_overlay(run)
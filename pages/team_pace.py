@@ -1,51 +1,61 @@
 # C:\F1_analysis\streamlit_analysis\team_pace_season_app.py
 
 import streamlit as st
-import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
-from PIL import Image
-import os
-from pathlib import Path
+import plotly.graph_objects as go
 
+from f1 import charts
+from f1.analytics import gap_matrix
+from f1.assets import asset_image
+from f1.data import get_data_version, get_derived, get_seasons, protect_shared_tables
+from f1.figures import cached_figure, figure_key
+from f1.metrics import dev_overlay, start_run
+from f1.reports import report_figure
 
-# -------------------------------
-# Load Data
-# -------------------------------
-BASE_DIR = Path(__file__).resolve().parent.parent 
-DATA_PATH = BASE_DIR / "data" / "processed" / "laps_2024_cleaned.csv"
-df = pd.read_csv(DATA_PATH)
-
-# Keep only personal best laps for fair team pace comparison
-season_df = df[df["IsPersonalBest"] == True].copy()
-all_teams = season_df["Team"].unique()
 
 # -------------------------------
-# Official F1 Team Colors
+# Streamlit Page Config
 # -------------------------------
-TEAM_COLORS = {
-    "Red Bull Racing": "#0600EF",
-    "Mercedes": "#00D2BE",
-    "Ferrari": "#DC0000",
-    "McLaren": "#FF8700",
-    "Alfa Romeo": "#900000",
-    "Aston Martin": "#006F62",
-    "AlphaTauri": "#2B4562",
-    "Alpine": "#0090FF",
-    "Williams": "#005AFF",
-    "Haas F1 Team": "#FFFFFF"
-}
+protect_shared_tables()  # copy-on-write for the cached frames, see f1/data.py
+st.set_page_config(page_title="Team Pace - Season Overview", layout="wide")
+run = start_run("team_pace")  # phase timings, see f1/metrics.py
+
+seasons = get_seasons()
+selected_season = st.sidebar.selectbox("Select Season", seasons, index=len(seasons) - 1)
+run.tag(season=selected_season)
+st.markdown(f"<h1 style='color:#FF0000'>F1 {selected_season} Season – Team Pace Comparison</h1>", unsafe_allow_html=True)
 
 # -------------------------------
-# Path to team images
+# Load Data (box statistics precomputed per team and race, see f1/aggregates.py)
 # -------------------------------
-TEAM_IMAGES_FOLDER = BASE_DIR / "assets" / "teams"
+with run.span("load"):
+    box_stats = get_derived(selected_season, "team_pace_box")
+    outliers = get_derived(selected_season, "team_pace_outliers")
+    race_pace = get_derived(selected_season, "team_race_pace")
+all_teams = box_stats["Team"].unique()
 
 # -------------------------------
-# Streamlit Page Config
+# Season overview: median clean-lap pace gap to the fastest team per race
 # -------------------------------
-st.set_page_config(page_title="Team Pace - Season Overview", layout="wide")
-st.markdown("<h1 style='color:#FF0000'>F1 2024 Season – Team Pace Comparison</h1>", unsafe_allow_html=True)
+st.subheader("Median Race Pace – Gap to Fastest Team (s)")
+with run.span("aggregate"):
+    gaps = gap_matrix(race_pace)
+with run.span("figure"):
+    fig_gaps = go.Figure(go.Heatmap(
+        z=gaps.to_numpy(),
+        x=[race for _, race in gaps.columns],
+        y=gaps.index.astype(str),
+        colorscale="Reds_r",
+        hovertemplate="%{y} – %{x}<br>+%{z:.3f}s<extra></extra>",
+    ))
+    fig_gaps.update_layout(
+        template="plotly_dark",
+        plot_bgcolor="#111111",
+        paper_bgcolor="#111111",
+        xaxis=dict(tickangle=45),
+        yaxis=dict(autorange="reversed"),
+        height=450,
+    )
+st.plotly_chart(fig_gaps, use_container_width=True)
 
 st.markdown("""
 Select the teams you want to display from the sidebar.  
@@ -65,49 +75,25 @@ if not selected_teams:
     st.warning("Please select at least one team to display.")
 else:
     for team in selected_teams:
-        team_df = season_df[season_df["Team"] == team]
-
         # Display team car image above the plot - full width
-        img_path = os.path.join(TEAM_IMAGES_FOLDER, f"{team}.png")
-        if os.path.exists(img_path):
-            st.image(img_path, use_container_width=True)  # full width
-
-        # Order races chronologically
-        race_order = (
-            team_df.groupby("Race_Name")["Round"].median()
-            .sort_values()
-            .index
-        )
+        with run.span("images"):
+            img = asset_image(f"teams/{team}.png", width=1200)
+            if img is not None:
+                st.image(img, use_container_width=True)  # full width
 
         # -------------------------------
         # Plot Team Pace
         # -------------------------------
-        fig, ax = plt.subplots(figsize=(20, 10))
-
-        # Get official color
-        team_color = TEAM_COLORS.get(team, "grey")
-
-        # Neon-style boxplot
-        sns.boxplot(
-            data=team_df,
-            x="Race_Name",
-            y="LapTimeSeconds",
-            order=race_order,
-            color=team_color,
-            ax=ax,
-            whiskerprops=dict(color="white", linewidth=2),
-            boxprops=dict(edgecolor="white", linewidth=2),
-            medianprops=dict(color="#FF0000", linewidth=2),
-            capprops=dict(color="white", linewidth=2),
-        )
-
-        ax.set_facecolor("#111111")
-        ax.set_title(f"{team} – Season Pace", color="#FF0000", fontsize=18)
-        ax.set_ylabel("Lap Time (s)", color="white", fontsize=14)
-        ax.set_xlabel(None)
-        ax.tick_params(colors="white", rotation=45)
-        ax.grid(False)
-
-        fig.patch.set_facecolor("#111111")
-        plt.tight_layout()
-        st.pyplot(fig)
+        def build_figure():
+            return (
+                report_figure(selected_season, "team_pace", team)
+                or charts.team_pace(box_stats, outliers, team)
+            )
+
+        key = figure_key("team_pace", selected_season, None, [team], get_data_version(selected_season))
+        with run.span("figure"):
+            fig = cached_figure(key, build_figure)
+        st.plotly_chart(fig, use_container_width=True)
+
+run.finish()
+dev_overlay(run)
@@ -0,0 +1,95 @@
+# telemetry_comparison_app.py
+import streamlit as st
+
+from f1 import charts
+from f1.analytics import team_colors
+from f1.data import get_race_index, get_races, get_seasons, get_telemetry, protect_shared_tables
+from f1.figures import cached_figure, decimation_note
+from f1.metrics import dev_overlay, start_run
+from f1.telemetry import lap_delta
+
+
+# -------------------------------
+# Page setup
+# -------------------------------
+protect_shared_tables()  # copy-on-write for the cached frames, see f1/data.py
+st.set_page_config(page_title="F1 Telemetry Comparison", layout="wide")
+run = start_run("telemetry")  # phase timings, see f1/metrics.py
+
+# -------------------------------
+# Sidebar filters
+# -------------------------------
+seasons = get_seasons()
+selected_season = st.sidebar.selectbox("Select Season", seasons, index=len(seasons) - 1)
+selected_race = st.sidebar.selectbox("Select Race", get_races(selected_season))
+run.tag(season=selected_season, race=selected_race)
+
+st.title(f"📡 F1 {selected_season} Telemetry – Fastest Lap Comparison")
+
+with run.span("load"):
+    store = get_telemetry(selected_season, selected_race)  # memory-mapped, nothing read yet
+
+if store is None:
+    st.info(
+        "No telemetry stored for this race. Ingest it with "
+        "`python scripts/ingest.py --seasons <season> --profile laps_telemetry`."
+    )
+else:
+    drivers = store.drivers()
+    reference = st.sidebar.selectbox("Reference driver", drivers)
+    others = [driver for driver in drivers if driver != reference]
+    other = st.sidebar.selectbox("Compare with", others) if others else None
+
+    if other is None:
+        st.warning("Telemetry of a second driver is needed for a comparison.")
+    else:
+        # -------------------------------
+        # Fastest laps (only these two laps are read from disk)
+        # -------------------------------
+        with run.span("filter"):
+            lap_numbers = {driver: store.fastest_lap(driver) for driver in (reference, other)}
+            laps = {
+                f"{driver} – lap {lap}": store.lap(driver, lap)
+                for driver, lap in lap_numbers.items()
+                if lap is not None
+            }
+        untimed = [driver for driver, lap in lap_numbers.items() if lap is None]
+
+        if untimed:
+            st.warning(f"No timed lap with telemetry for {' and '.join(untimed)} (every lap deleted or untimed).")
+        else:
+            with run.span("aggregate"):
+                ref_lap, other_lap = laps.values()
+                delta = lap_delta(ref_lap, other_lap)
+
+            lap_times = store.laps.set_index(["Driver", "LapNumber"])["LapTime"]
+            cols = st.columns(3)
+            for col, (driver, lap) in zip(cols, lap_numbers.items()):
+                col.metric(f"{driver} fastest lap", f"{lap_times[(driver, lap)]:.3f}s", f"lap {lap}", delta_color="off")
+            cols[2].metric(f"Gap {other} to {reference}", f"{delta['Delta'].iloc[-1]:+.3f}s")
+
+            # -------------------------------
+            # Traces over distance
+            # -------------------------------
+            teams = get_race_index(selected_season, selected_race).race(selected_race).drop_duplicates("Driver")
+            driver_teams = dict(zip(teams["Driver"].astype(str), teams["Team"]))
+            colors = team_colors(driver_teams.values())
+
+            def build_figure():
+                return charts.telemetry_comparison(
+                    laps, delta,
+                    {label: colors.get(driver_teams.get(driver), "grey") for label, driver in zip(laps, lap_numbers)},
+                    f"{reference} vs {other} – {selected_race}",
+                )
+
+            key = ("telemetry", selected_season, selected_race, reference, other, store.version)
+            with run.span("figure"):
+                fig = cached_figure(key, build_figure)
+
+            st.plotly_chart(fig, use_container_width=True)
+            note = decimation_note(fig)
+            if note:
+                st.caption(note)
+
+run.finish()
+dev_overlay(run)
@@ -1,117 +1,96 @@
 # tire_degradation_app.py
 import streamlit as st
-import pandas as pd
-import plotly.graph_objects as go
-import os
-from pathlib import Path
+
+from f1 import charts
+from f1.analytics import circuit_compounds, stint_summary
+from f1.assets import asset_image
+from f1.data import (
+    get_data_version, get_degradation_index, get_derived, get_races, get_seasons, protect_shared_tables,
+)
+from f1.figures import cached_figure, decimation_note, figure_key
+from f1.metrics import dev_overlay, start_run
+from f1.reports import report_figure
 
 
 # -------------------------------
 # Settings
 # -------------------------------
-BASE_DIR = Path(__file__).resolve().parent.parent
-DATA_PATH = BASE_DIR / "data" / "processed" / "laps_2024_cleaned.csv"
-DRIVER_IMG_FOLDER = BASE_DIR / "assets" / "drivers"
-
+protect_shared_tables()  # copy-on-write for the cached frames, see f1/data.py
 st.set_page_config(page_title="F1 Tire Degradation", layout="wide")
-st.title("F1 2024 Tire Degradation Analysis 🚦")
-
-# -------------------------------
-# Load dataset
-# -------------------------------
-df = pd.read_csv(DATA_PATH)
-
-# -------------------------------
-# Helper functions
-# -------------------------------
-def get_races():
-    return sorted(df["Race_Name"].unique())
-
-def get_drivers(selected_race):
-    return sorted(df[df["Race_Name"] == selected_race]["Driver"].unique())
-
-def get_team_colors(race_df):
-    teams = race_df["Team"].unique()
-    colors = {}
-    for team in teams:
-        colors[team] = {
-            "Mercedes": "#00D2BE",
-            "Red Bull Racing": "#1E41FF",
-            "Ferrari": "#DC0000",
-            "McLaren": "#FF8700",
-            "Alpine": "#0090FF",
-            "AlphaTauri": "#2B4562",
-            "Aston Martin": "#006F62",
-            "Williams": "#005AFF",
-            "Haas": "#BD9E57",
-            "Alfa Romeo": "#900000"
-        }.get(team, "grey")
-    return colors
+run = start_run("tire_deg")  # phase timings, see f1/metrics.py
+seasons = get_seasons()
+selected_season = st.sidebar.selectbox("Select Season", seasons, index=len(seasons) - 1)
+st.title(f"F1 {selected_season} Tire Degradation Analysis 🚦")
 
 # -------------------------------
 # Sidebar selection
 # -------------------------------
-selected_race = st.sidebar.selectbox("Select Race", get_races())
+selected_race = st.sidebar.selectbox("Select Race", get_races(selected_season))
+run.tag(season=selected_season, race=selected_race)
+with run.span("load"):
+    index = get_degradation_index(selected_season)  # precomputed per-stint degradation
+with run.span("filter"):
+    race_drivers = index.drivers(selected_race)
 selected_drivers = st.sidebar.multiselect(
     "Select Drivers",
-    get_drivers(selected_race),
-    default=get_drivers(selected_race)[:2]
+    race_drivers,
+    default=race_drivers[:2]
 )
 
 if selected_drivers:
-    race_df = df[df["Race_Name"] == selected_race].sort_values("LapNumber")
-    team_colors = get_team_colors(race_df)
-
     # -------------------------------
     # Display driver images first
     # -------------------------------
     st.subheader("Selected Drivers")
     max_cols = min(4, len(selected_drivers))
     cols = st.columns(max_cols)
-    for col, driver in zip(cols, selected_drivers):
-        img_path = os.path.join(DRIVER_IMG_FOLDER, f"{driver}.png")
-        if os.path.exists(img_path):
-            col.image(img_path, caption=driver, use_container_width=True)
-        else:
-            col.write(f"No image for {driver}")
+    with run.span("images"):
+        for col, driver in zip(cols, selected_drivers):
+            img = asset_image(f"drivers/{driver}.png", width=300)
+            if img is not None:
+                col.image(img, caption=driver, use_container_width=True)
+            else:
+                col.write(f"No image for {driver}")
 
     # -------------------------------
-    # Prepare figure
+    # Prepare figure (prerendered for the default selection, else built live)
     # -------------------------------
-    fig = go.Figure()
+    def build_figure():
+        return (
+            report_figure(selected_season, "degradation", selected_race, selected_drivers)
+            or charts.degradation(index, selected_race, selected_drivers)
+        )
 
-    for driver in selected_drivers:
-        driver_laps = race_df[race_df["Driver"] == driver].reset_index()
-        driver_laps['LapDelta'] = driver_laps['LapTimeSeconds'].diff().fillna(0)
-        driver_laps['CumulativeDegradation'] = driver_laps['LapDelta'].cumsum()
-        team = driver_laps["Team"].iloc[0]
+    key = figure_key("tire_deg", selected_season, selected_race, selected_drivers, get_data_version(selected_season))
+    with run.span("figure"):
+        fig = cached_figure(key, build_figure)
 
-        fig.add_trace(go.Scatter(
-            x=driver_laps["LapNumber"],
-            y=driver_laps["CumulativeDegradation"],
-            mode='lines+markers',
-            name=driver,
-            line=dict(color=team_colors[team], width=3),
-            marker=dict(size=8),
-            hovertemplate=
-            '<b>%{text}</b><br>Laps: %{x}<br>Degradation: %{y:.2f}s<extra></extra>',
-            text=[driver]*len(driver_laps)
-        ))
+    st.plotly_chart(fig, use_container_width=True)
+    note = decimation_note(fig)
+    if note:
+        st.caption(note)
 
-        # Pit stops
-        pit_laps = driver_laps[driver_laps["PitInTime"].notna()]
-        for lap in pit_laps["LapNumber"]:
-            fig.add_vline(x=lap, line=dict(color=team_colors[team], dash='dash', width=1))
+    # -------------------------------
+    # Stint summary (degradation slope per stint)
+    # -------------------------------
+    st.subheader("Stint Degradation")
+    with run.span("aggregate"):
+        stints = stint_summary(get_derived(selected_season, "stint_degradation"), selected_race, selected_drivers)
+    st.dataframe(
+        stints.rename(columns={"DegSlope": "Degradation (s/lap)", "MeanLapTime": "Mean Lap Time (s)"}),
+        hide_index=True,
+        use_container_width=True
+    )
 
-    fig.update_layout(
-        title=f"Cumulative Tire Degradation – {selected_race}",
-        xaxis_title="Lap Number",
-        yaxis_title="Cumulative Lap Time Increase (s)",
-        template="plotly_dark",
-        plot_bgcolor="#0E1117",
-        paper_bgcolor="#0E1117",
-        font=dict(color="#FF0000"),
-        hovermode="x unified"
+    # -------------------------------
+    # Compound comparison at this circuit
+    # -------------------------------
+    compounds = get_derived(selected_season, "compound_degradation")
+    st.caption("Median degradation per compound at this circuit (all drivers, s/lap)")
+    st.dataframe(
+        circuit_compounds(compounds, selected_race),
+        hide_index=True
     )
 
-    st.plotly_chart(fig, use_container_width=True)
+run.finish()
+dev_overlay(run)
@@ -1,22 +1,11 @@
-import pandas as pd
-import seaborn as sns
-from pathlib import Path
+from f1.analytics import team_colors
+from f1.data import get_race_index, get_races  # noqa: F401  (get_races(season) is re-exported)
 
 
-# Load cleaned dataset
-BASE_DIR = Path(__file__).resolve().parent.parent
-DATA_PATH = BASE_DIR / "data" / "processed" / "laps_2024_cleaned.csv"
-df = pd.read_csv(DATA_PATH)
-
-# Get all races
-def get_races():
-    return sorted(df["Race_Name"].unique())
-
 # Get drivers for a given race
-def get_drivers(race_name):
-    return sorted(df[df["Race_Name"] == race_name]["Driver"].unique())
+def get_drivers(season, race_name):
+    return get_race_index(season, race_name).drivers(race_name)
 
 # Generate team color mapping
 def get_team_colors(race_df):
-    teams = race_df["Team"].unique()
-    return dict(zip(teams, sns.color_palette("tab10", len(teams))))
+    return team_colors(race_df["Team"].unique())
@@ -0,0 +1,54 @@
+# Materialise the derived tables (degradation, season aggregates, ...) for each season.
+#
+#     python scripts/build_derived.py                 # every season in the lap store
+#     python scripts/build_derived.py --seasons 2024
+#
+# Run after ingesting/cleaning or rebuilding the results tables. Tables
+# already built from the current source data and engine code are skipped.
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from f1.derived import (  # noqa: E402
+    DERIVED_TABLES, build_derived, data_version, load_source, read_derived, source_files, table_source,
+    write_derived,
+)
+from f1.results import RESULTS_DIR, list_result_seasons  # noqa: E402
+from f1.store import LAPS_DIR, list_seasons  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Materialise derived tables per season.")
+    parser.add_argument("--seasons", type=int, nargs="*", help="default: every season in the lap store")
+    parser.add_argument("--force", action="store_true", help="rebuild tables that are up to date")
+    args = parser.parse_args()
+
+    seasons = args.seasons or sorted(set(list_seasons(LAPS_DIR)) | set(list_result_seasons(RESULTS_DIR)))
+    sources = sorted({table_source(name) for name in DERIVED_TABLES})
+    for season in seasons:
+        for source in sources:
+            files = source_files(source, season)
+            if not files:
+                continue
+            version = data_version(files)
+            todo = [
+                name for name in DERIVED_TABLES
+                if table_source(name) == source
+                and (args.force or read_derived(name, season, version) is None)
+            ]
+            if not todo:
+                print(f"Season {season}: {source} tables up to date ({version})")
+                continue
+
+            data = load_source(source, season)
+            for name in todo:
+                table = build_derived(name, data)
+                write_derived(name, season, table, version)
+                print(f"Season {season}: {name} ({len(table)} rows)")
+    print("✅ Derived tables up to date")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+# Convert a cleaned lap CSV into the partitioned Parquet lap store.
+#
+#     python scripts/build_lap_store.py                       # data/processed/laps_2024_cleaned.csv
+#     python scripts/build_lap_store.py --csv laps_2023_cleaned.csv --season 2023
+import argparse
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BASE_DIR))
+
+from f1.store import LAPS_CSV_PATH, LAPS_DIR, partition_files, write_laps  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Convert a cleaned lap CSV into the lap store.")
+    parser.add_argument("--csv", type=Path, default=LAPS_CSV_PATH)
+    parser.add_argument("--season", type=int, default=2024,
+                        help="season of the CSV (older cleaned CSVs have no Season column)")
+    parser.add_argument("--out", type=Path, default=LAPS_DIR)
+    args = parser.parse_args()
+
+    df = pd.read_csv(args.csv)
+    if "Season" not in df.columns:
+        df["Season"] = args.season
+    write_laps(df, args.out)
+
+    files = partition_files(args.out, args.season)
+    csv_mb = args.csv.stat().st_size / 1e6
+    parquet_mb = sum(p.stat().st_size for p in files) / 1e6
+    print(f"✅ Wrote {len(df)} laps to {len(files)} partitions in {args.out} "
+          f"({csv_mb:.1f} MB CSV -> {parquet_mb:.1f} MB Parquet)")
+
+
+if __name__ == "__main__":
+    main()
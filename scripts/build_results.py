@@ -0,0 +1,36 @@
+# Split the stint-level results CSV into the normalised race/result/stint tables.
+#
+#     python scripts/build_results.py                 # data/processed/f1_cleaned.csv
+#     python scripts/build_results.py --csv f1_2023_cleaned.csv
+import argparse
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BASE_DIR))
+
+from f1.results import RESULTS_CSV_PATH, RESULTS_DIR, result_files, write_results  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the race/result/stint tables from the results CSV.")
+    parser.add_argument("--csv", type=Path, default=RESULTS_CSV_PATH)
+    parser.add_argument("--out", type=Path, default=RESULTS_DIR)
+    args = parser.parse_args()
+
+    df = pd.read_csv(args.csv)
+    seasons = set()
+    for season, table, rows in write_results(df, args.out):
+        seasons.add(season)
+        print(f"Season {season}: {table} ({rows} rows)")
+
+    files = [path for season in sorted(seasons) for path in result_files(args.out, season)]
+    csv_mb = args.csv.stat().st_size / 1e6
+    parquet_mb = sum(p.stat().st_size for p in files) / 1e6
+    print(f"✅ Wrote {len(files)} tables to {args.out} ({csv_mb:.2f} MB CSV -> {parquet_mb:.2f} MB Parquet)")
+
+
+if __name__ == "__main__":
+    main()
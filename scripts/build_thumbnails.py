@@ -0,0 +1,64 @@
+# Pre-size the image assets for the widths the pages display them at.
+#
+#     python scripts/build_thumbnails.py
+#     python scripts/build_thumbnails.py --force
+#
+# Writes WebP thumbnails to assets/thumbs/<width>/ (see f1/assets.py).
+# Thumbnails newer than their source are skipped; images are never upscaled.
+import argparse
+import os
+import sys
+from pathlib import Path
+
+from PIL import Image
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from f1.assets import ASSETS_DIR, THUMB_FORMAT, THUMB_QUALITY, THUMB_WIDTHS, thumbnail_name  # noqa: E402
+
+
+IMAGE_SUFFIXES = {".png", ".jpg", ".jpeg"}
+
+
+def source_images(folder):
+    root = ASSETS_DIR / folder
+    return sorted(path for path in root.iterdir() if path.suffix.lower() in IMAGE_SUFFIXES)
+
+
+def build_thumbnail(src, dst, width):
+    with Image.open(src) as img:
+        img = img.convert("RGBA" if img.mode in ("RGBA", "LA", "P") else "RGB")
+        if img.width > width:
+            img = img.resize((width, round(img.height * width / img.width)), Image.LANCZOS)
+        dst.parent.mkdir(parents=True, exist_ok=True)
+        tmp = dst.with_name(f".{dst.name}.tmp")
+        img.save(tmp, format=THUMB_FORMAT, quality=THUMB_QUALITY, method=6)
+    os.replace(tmp, dst)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build WebP thumbnails of the image assets.")
+    parser.add_argument("--force", action="store_true", help="rebuild thumbnails that are up to date")
+    args = parser.parse_args()
+
+    built = skipped = 0
+    size_in = size_out = 0
+    for folder, widths in THUMB_WIDTHS.items():
+        for src in source_images(folder):
+            name = src.relative_to(ASSETS_DIR).as_posix()
+            for width in widths:
+                dst = ASSETS_DIR / thumbnail_name(name, width)
+                if not args.force and dst.exists() and dst.stat().st_mtime >= src.stat().st_mtime:
+                    skipped += 1
+                    continue
+                build_thumbnail(src, dst, width)
+                size_in += src.stat().st_size
+                size_out += dst.stat().st_size
+                built += 1
+
+    print(f"Built {built} thumbnails ({size_in / 1e6:.1f} MB -> {size_out / 1e6:.1f} MB), {skipped} up to date")
+    print("✅ Thumbnails up to date")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+# Clean raw laps into the processed, season/round partitioned lap store.
+#
+#     python scripts/clean.py                                # raw partitions from scripts/ingest.py
+#     python scripts/clean.py --raw data/raw/laps_2024.csv   # legacy season CSV
+#
+# Rounds are processed one at a time, so memory stays flat however many
+# seasons are re-cleaned.
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from f1.clean import clean_csv, clean_partitions  # noqa: E402
+from f1.ingest import RAW_LAPS_DIR  # noqa: E402
+from f1.store import LAPS_DIR  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Clean raw laps into the processed lap store.")
+    parser.add_argument("--raw", type=Path, default=RAW_LAPS_DIR,
+                        help="raw partition folder, or a legacy raw season CSV")
+    parser.add_argument("--out", type=Path, default=LAPS_DIR,
+                        help="root of the processed lap store")
+    parser.add_argument("--chunksize", type=int, default=50_000,
+                        help="rows per chunk when reading a CSV")
+    parser.add_argument("--force", action="store_true",
+                        help="re-clean rounds that are already up to date")
+    args = parser.parse_args()
+
+    if args.raw.suffix == ".csv":
+        rounds = clean_csv(args.raw, args.out, args.chunksize, args.force)
+    else:
+        rounds = clean_partitions(args.raw, args.out, args.force)
+
+    n_rounds = 0
+    for season, round_no, n_laps in rounds:
+        print(f"  {season} Round {round_no}: {n_laps} laps")
+        n_rounds += 1
+    print(f"✅ Cleaned {n_rounds} rounds into {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,17 +1,21 @@
 #functions that will be reused often
+# (thin wrappers over the f1 package, for notebooks and one-off scripts)
 
-import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
+from f1.aggregates import pit_stops_per_circuit
+from f1.results import RESULT_TABLES, read_results
 
-def load_data(path="../data/processed/f1_clean.csv"):
-    return pd.read_csv(path)
+def load_data(season):
+    """The season's races/results/stints tables (see f1/results.py)."""
+    return {table: read_results(season, table) for table in RESULT_TABLES}
 
-def plot_avg_pitstops(df,circuit_col='Circuit', pit_col='TotalPitStops'):
-    avg_pits= df.groupby(circuit_col)[pit_col].mean().sort_values(ascending=False)
-    sns.barplot(x=avg_pits.values, y=avg_pits.index)
+def plot_avg_pitstops(tables):
+    # plotting libraries are only imported when something is plotted
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+
+    avg_pits = pit_stops_per_circuit(tables).sort_values("AvgPitStops", ascending=False)
+    sns.barplot(x=avg_pits["AvgPitStops"], y=avg_pits["Circuit"].astype(str))
     plt.xlabel('Average Number of Pit Stops')
     plt.ylabel('Circuit')
     plt.title('Average Number of Pit Stops per Circuit')
     plt.show()
-    
\ No newline at end of file
@@ -0,0 +1,61 @@
+# Fetch race laps from FastF1 into the season/round partitioned raw store.
+#
+#     python scripts/ingest.py --seasons 2024
+#     python scripts/ingest.py --seasons 2018-2025 --workers 8
+#     python scripts/ingest.py --seasons 2024 --profile full
+#     python scripts/ingest.py --seasons 2024 --profile laps_telemetry   # + car telemetry store
+#
+# Only rounds that are missing or changed since the last run are fetched, so
+# running this after each race weekend just adds the new round.
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from f1.ingest import CACHE_DIR, DEFAULT_PROFILE, LOAD_PROFILES, RAW_LAPS_DIR, ingest_season  # noqa: E402
+
+
+def parse_seasons(value):
+    """'2024' -> [2024], '2022-2024' -> [2022, 2023, 2024]"""
+    first, _, last = value.partition("-")
+    return list(range(int(first), int(last or first) + 1))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fetch new or updated race rounds from FastF1.")
+    parser.add_argument("--seasons", type=parse_seasons, required=True,
+                        help="season or inclusive range, e.g. 2024 or 2018-2024")
+    parser.add_argument("--out", type=Path, default=RAW_LAPS_DIR,
+                        help="root of the partitioned lap store (telemetry goes to <out>/telemetry "
+                             "unless it is the default)")
+    parser.add_argument("--cache", type=Path, default=CACHE_DIR,
+                        help="FastF1 HTTP cache folder")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="parallel rounds (default: CPU count)")
+    parser.add_argument("--profile", choices=list(LOAD_PROFILES), default=DEFAULT_PROFILE,
+                        help="which session data to load and keep (default: laps)")
+    parser.add_argument("--force", action="store_true",
+                        help="ignore the manifest and refetch every round")
+    args = parser.parse_args()
+
+    failed = {}
+    for season in args.seasons:
+        try:
+            failed_rounds = ingest_season(
+                season, args.out, args.cache, args.workers, args.force, args.profile
+            )
+        except Exception as e:
+            print(f"Failed to fetch event schedule for {season}: {e}")
+            failed_rounds = ["schedule"]
+        if failed_rounds:
+            failed[season] = failed_rounds
+
+    if failed:
+        print(f"Failed: {failed} – re-run to retry only those rounds.")
+        sys.exit(1)
+    print(f"✅ Lap store up to date in {args.out}")
+
+
+if __name__ == "__main__":
+    main()
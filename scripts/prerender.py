@@ -0,0 +1,74 @@
+# Prerender the common dashboard views to static files.
+#
+#     python scripts/prerender.py                          # every season, every analysis
+#     python scripts/prerender.py --seasons 2024 --analyses lap_overlay team_pace --png
+#
+# One report per (season, race or team, analysis) with the pages' default
+# selection, written under reports/ (see f1/reports.py) by a process pool.
+# Reports already built from the current data and chart code are skipped.
+import argparse
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from f1.data import get_result_seasons, get_seasons  # noqa: E402
+from f1.reports import (  # noqa: E402
+    ANALYSES, REPORTS_DIR, is_current, render_report, report_path, report_targets, report_version,
+)
+
+
+def write_index(root):
+    """Plain index.html linking every HTML report, for the static file server."""
+    links = [
+        f'<li><a href="{path.relative_to(root).as_posix()}">{path.relative_to(root).with_suffix("").as_posix()}</a></li>'
+        for path in sorted(root.glob("season=*/*/*.html"))
+    ]
+    (root / "index.html").write_text(
+        "<!doctype html><title>F1 reports</title><ul>\n" + "\n".join(links) + "\n</ul>\n", encoding="utf-8"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Prerender dashboard views to JSON/HTML/PNG.")
+    parser.add_argument("--seasons", type=int, nargs="*", help="default: every season")
+    parser.add_argument("--analyses", nargs="*", choices=list(ANALYSES), default=list(ANALYSES))
+    parser.add_argument("--workers", type=int, default=None, help="default: one per CPU")
+    parser.add_argument("--png", action="store_true", help="also render PNGs (needs Kaleido + Chrome)")
+    parser.add_argument("--force", action="store_true", help="re-render reports that are up to date")
+    args = parser.parse_args()
+
+    seasons = args.seasons or sorted(set(get_seasons()) | set(get_result_seasons()))
+    tasks = []
+    skipped = 0
+    for season in seasons:
+        for analysis in args.analyses:
+            version = report_version(season, analysis)
+            for name, selection in report_targets(season, analysis):
+                if not args.force and is_current(season, analysis, name, selection, version, args.png):
+                    skipped += 1
+                    continue
+                tasks.append((season, analysis, name, selection, version, args.png))
+
+    print(f"{len(tasks)} reports to render, {skipped} up to date")
+    failed = 0
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        futures = {pool.submit(render_report, *task): task for task in tasks}
+        for future in as_completed(futures):
+            season, analysis, name = futures[future][:3]
+            try:
+                future.result()
+                print(f"  {report_path(season, analysis, name, 'json').relative_to(REPORTS_DIR)}")
+            except Exception as e:
+                failed += 1
+                print(f"  ❌ {season} {analysis} {name}: {type(e).__name__}: {e}")
+
+    REPORTS_DIR.mkdir(parents=True, exist_ok=True)
+    write_index(REPORTS_DIR)
+    print(f"✅ Rendered {len(tasks) - failed} reports ({failed} failed) in {REPORTS_DIR}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())